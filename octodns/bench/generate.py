@@ -0,0 +1,212 @@
+#
+#
+#
+
+from ipaddress import IPv4Address, IPv6Address
+from os import makedirs
+from os.path import join
+from random import Random
+
+from ..yaml import safe_dump
+
+# relative weights of the kinds of records that make up a generated zone
+KINDS = (
+    ('A', 30),
+    ('AAAA', 15),
+    ('CNAME', 15),
+    ('MX', 8),
+    ('TXT', 15),
+    ('SRV', 7),
+    ('dynamic', 5),
+    ('geo', 5),
+)
+
+
+class Generator(object):
+    '''
+    Generates synthetic, but valid, zone data for benchmarking. The output is
+    deterministic for a given seed so that runs against different versions of
+    octoDNS are comparable.
+
+    Each zone gets a root NS record plus its share of records, one per name,
+    with types mixed according to KINDS.
+    '''
+
+    def __init__(self, zones=1000, records=100000, seed=42):
+        self.zones = zones
+        self.records = records
+        self.seed = seed
+
+    @property
+    def zone_names(self):
+        return [f'zone-{i:05d}.bench.' for i in range(self.zones)]
+
+    def data(self):
+        '''
+        Returns a dict of zone name to a dict of record name to record data,
+        in the same format YamlProvider uses.
+        '''
+        rand = Random(self.seed)
+        kinds = [k for k, _ in KINDS]
+        weights = [w for _, w in KINDS]
+        names = self.zone_names
+        per_zone, extra = divmod(self.records, len(names))
+
+        data = {}
+        for i, zone_name in enumerate(names):
+            zone = {
+                '': {
+                    'type': 'NS',
+                    'ttl': 3600,
+                    'values': [f'ns{n}.bench.' for n in range(1, 5)],
+                }
+            }
+            count = per_zone + (1 if i < extra else 0)
+            for n, kind in enumerate(rand.choices(kinds, weights, k=count)):
+                name, record = getattr(self, f'_{kind.lower()}')(
+                    rand, n, zone_name
+                )
+                zone[name] = record
+            data[zone_name] = zone
+        return data
+
+    def write(self, directory):
+        '''
+        Writes the zone files, along with a config that syncs them to an empty
+        YamlProvider target, into directory. Returns the config filename and
+        the zone data.
+        '''
+        data = self.data()
+
+        zones_dir = join(directory, 'zones')
+        makedirs(zones_dir, exist_ok=True)
+        for zone_name, records in data.items():
+            with open(join(zones_dir, f'{zone_name}yaml'), 'w') as fh:
+                safe_dump(records, fh)
+
+        def provider(path):
+            return {
+                'class': 'octodns.provider.yaml.YamlProvider',
+                'directory': join(directory, path),
+                'escaped_semicolons': True,
+            }
+
+        config = {
+            'providers': {
+                'config': provider('zones'),
+                'dump': provider('dump'),
+            },
+            'zones': {
+                zone_name: {'sources': ['config'], 'targets': ['dump']}
+                for zone_name in data
+            },
+        }
+        config_file = join(directory, 'config.yaml')
+        with open(config_file, 'w') as fh:
+            safe_dump(config, fh)
+
+        return config_file, data
+
+    def _ipv4(self, rand):
+        return str(IPv4Address(rand.randrange(0x01000000, 0xDF000000)))
+
+    def _ipv6(self, rand):
+        return str(IPv6Address((0x2001 << 112) + rand.getrandbits(96)))
+
+    def _ttl(self, rand):
+        return rand.choice((60, 300, 3600, 86400))
+
+    def _a(self, rand, n, zone_name):
+        return f'a-{n}', {
+            'type': 'A',
+            'ttl': self._ttl(rand),
+            'values': sorted(
+                set(self._ipv4(rand) for _ in range(rand.randint(1, 4)))
+            ),
+        }
+
+    def _aaaa(self, rand, n, zone_name):
+        return f'aaaa-{n}', {
+            'type': 'AAAA',
+            'ttl': self._ttl(rand),
+            'values': sorted(
+                set(self._ipv6(rand) for _ in range(rand.randint(1, 4)))
+            ),
+        }
+
+    def _cname(self, rand, n, zone_name):
+        return f'cname-{n}', {
+            'type': 'CNAME',
+            'ttl': self._ttl(rand),
+            'value': f'target-{rand.randrange(1000)}.{zone_name}',
+        }
+
+    def _mx(self, rand, n, zone_name):
+        return f'mx-{n}', {
+            'type': 'MX',
+            'ttl': self._ttl(rand),
+            'values': [
+                {'preference': p * 10, 'exchange': f'mx{p}.{zone_name}'}
+                for p in range(1, rand.randint(2, 4))
+            ],
+        }
+
+    def _txt(self, rand, n, zone_name):
+        return f'txt-{n}', {
+            'type': 'TXT',
+            'ttl': self._ttl(rand),
+            'values': sorted(
+                set(
+                    f'v=bench{rand.getrandbits(64):x} id={i}'
+                    for i in range(rand.randint(1, 3))
+                )
+            ),
+        }
+
+    def _srv(self, rand, n, zone_name):
+        return f'_svc-{n}._tcp', {
+            'type': 'SRV',
+            'ttl': self._ttl(rand),
+            'values': [
+                {
+                    'priority': p,
+                    'weight': rand.randrange(100),
+                    'port': rand.randrange(1, 65536),
+                    'target': f'srv{p}.{zone_name}',
+                }
+                for p in range(rand.randint(1, 3))
+            ],
+        }
+
+    def _dynamic(self, rand, n, zone_name):
+        return f'dynamic-{n}', {
+            'type': 'A',
+            'ttl': self._ttl(rand),
+            'values': [self._ipv4(rand)],
+            'dynamic': {
+                'pools': {
+                    'one': {'values': [{'value': self._ipv4(rand)}]},
+                    'two': {
+                        'values': [
+                            {'value': self._ipv4(rand), 'weight': 1},
+                            {'value': self._ipv4(rand), 'weight': 2},
+                        ]
+                    },
+                },
+                'rules': [
+                    {'geos': ['EU', 'NA-US-CA'], 'pool': 'one'},
+                    {'pool': 'two'},
+                ],
+            },
+        }
+
+    def _geo(self, rand, n, zone_name):
+        return f'geo-{n}', {
+            'type': 'A',
+            'ttl': self._ttl(rand),
+            'values': [self._ipv4(rand)],
+            'geo': {
+                'EU': [self._ipv4(rand)],
+                'NA-US': [self._ipv4(rand), self._ipv4(rand)],
+            },
+        }
@@ -0,0 +1,422 @@
+#
+#
+#
+
+from io import StringIO
+from logging import getLogger
+from os import environ, pathsep
+from os.path import dirname, join
+from platform import python_implementation, python_version
+from shutil import rmtree
+from statistics import median
+from subprocess import check_call
+from sys import executable
+from tempfile import mkdtemp
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from .. import __file__ as _package_file
+from .. import __version__
+from ..manager import Manager
+from ..provider.jsonl import JsonLinesProvider
+from ..provider.plan import PlanHtml, PlanJson, PlanLogger, PlanMarkdown
+from ..provider.sqlite import SqliteProvider
+from ..provider.yaml import YamlProvider
+from ..record import Record
+from ..yaml import NaturalSortEnforcingLoader, safe_dump, safe_load
+from ..zone import Zone
+from .generate import Generator
+
+
+class Context(object):
+    '''
+    The generated data shared by the benchmarks, written out to directory.
+    '''
+
+    def __init__(self, directory, generator):
+        self.directory = directory
+        self.generator = generator
+        self.config_file, self.data = generator.write(directory)
+        self.records = sum(len(records) for records in self.data.values())
+        self._runs = 0
+
+    def provider(self, path='zones'):
+        return YamlProvider(
+            'bench', join(self.directory, path), escaped_semicolons=True
+        )
+
+    def scratch(self):
+        '''
+        Returns a new, empty, directory name for things to write into.
+        '''
+        self._runs += 1
+        return f'scratch-{self._runs}'
+
+    def zones(self, modify=0):
+        '''
+        Returns a list of Zones populated with the generated records. When
+        modify is non-zero every modify'th record has its ttl changed.
+        '''
+        zones = []
+        n = 0
+        for zone_name, records in self.data.items():
+            zone = Zone(zone_name, [])
+            for name, data in records.items():
+                n += 1
+                if modify and n % modify == 0:
+                    data = dict(data, ttl=data['ttl'] + 1)
+                record = Record.new(zone, name, data, lenient=True)
+                zone.add_record(record, lenient=True)
+            zones.append(zone)
+        return zones
+
+    def plans(self):
+        target = self.provider(self.scratch())
+        return [(target, target.plan(zone)) for zone in self.zones()]
+
+
+# Each benchmark does any setup it needs with the context and returns a
+# callable that does the work to be timed along with the number of operations
+# that it will perform.
+
+
+def _bench_import(module):
+    def bench(ctx):
+        # a fresh interpreter is needed each time so this includes its start
+        # up, compare to import_sys for the baseline. It's pointed at the
+        # same octoDNS we're running.
+        path = dirname(dirname(_package_file))
+        env = dict(environ)
+        env['PYTHONPATH'] = pathsep.join(
+            p for p in (path, environ.get('PYTHONPATH')) if p
+        )
+        cmd = [executable, '-c', f'import {module}']
+
+        def run():
+            check_call(cmd, env=env)
+
+        return run, 1
+
+    return bench
+
+
+def bench_record_new(ctx):
+    items = [
+        (Zone(zone_name, []), records)
+        for zone_name, records in ctx.data.items()
+    ]
+
+    def run():
+        for zone, records in items:
+            for name, data in records.items():
+                Record.new(zone, name, data)
+
+    return run, ctx.records
+
+
+def bench_zone_add_record(ctx):
+    items = [(Zone(zone.name, []), zone.records) for zone in ctx.zones()]
+
+    def run():
+        for zone, records in items:
+            for record in records:
+                zone.add_record(record)
+
+    return run, ctx.records
+
+
+def bench_zone_changes(ctx):
+    target = ctx.provider()
+    # one in ten records differ
+    items = list(zip(ctx.zones(), ctx.zones(modify=10)))
+
+    def run():
+        for existing, desired in items:
+            existing.changes(desired, target)
+
+    return run, ctx.records
+
+
+def bench_zone_copy(ctx):
+    # copy each zone several times, as planning against multiple targets does,
+    # and modify a single record in each copy
+    items = []
+    for zone in ctx.zones():
+        record = next(iter(zone)).copy()
+        items.append((zone, record))
+    copies = 5
+
+    def run():
+        for zone, record in items:
+            for _ in range(copies):
+                zone.copy().add_record(record, replace=True)
+
+    return run, len(items) * copies
+
+
+def bench_zone_validate(ctx):
+    zones = ctx.zones()
+
+    def run():
+        for zone in zones:
+            zone.validate()
+
+    return run, len(zones)
+
+
+def bench_yaml_populate(ctx):
+    provider = ctx.provider()
+    names = list(ctx.data.keys())
+
+    def run():
+        for zone_name in names:
+            provider.populate(Zone(zone_name, []))
+
+    return run, ctx.records
+
+
+def bench_jsonl_populate(ctx):
+    # the same zones written out by, and then populated from, a
+    # JsonLinesProvider
+    provider = JsonLinesProvider('bench', join(ctx.directory, ctx.scratch()))
+    for zone in ctx.zones():
+        provider.apply(provider.plan(zone))
+    names = list(ctx.data.keys())
+
+    def run():
+        for zone_name in names:
+            provider.populate(Zone(zone_name, []))
+
+    return run, ctx.records
+
+
+def bench_sqlite_populate(ctx):
+    # the same zones written to, and then populated from, a SqliteProvider
+    provider = SqliteProvider(
+        'bench', join(ctx.directory, ctx.scratch(), 'zones.db')
+    )
+    for zone in ctx.zones():
+        provider.apply(provider.plan(zone))
+    names = list(ctx.data.keys())
+
+    def run():
+        for zone_name in names:
+            provider.populate(Zone(zone_name, []))
+
+    return run, ctx.records
+
+
+def _bench_yaml_load(libyaml):
+    def bench(ctx):
+        filenames = [
+            join(ctx.directory, 'zones', f'{zone_name}yaml')
+            for zone_name in ctx.data
+        ]
+
+        def run():
+            for filename in filenames:
+                with open(filename) as fh:
+                    safe_load(fh, libyaml=libyaml)
+
+        return run, ctx.records
+
+    return bench
+
+
+def bench_yaml_order_check(ctx):
+    # a single mapping with a key for every record, e.g. a very large zone,
+    # parsed once up front so that just the construction, and with it the
+    # key order check, is timed
+    buf = StringIO()
+    safe_dump(
+        {
+            f'{name}.{zone_name}': 1
+            for zone_name, records in ctx.data.items()
+            for name in records
+        },
+        buf,
+    )
+    loader = NaturalSortEnforcingLoader(buf.getvalue())
+    node = loader.get_single_node()
+
+    def run():
+        loader.construct_document(node)
+
+    return run, len(node.value)
+
+
+def bench_yaml_apply(ctx):
+    plans = ctx.plans()
+
+    def run():
+        for target, plan in plans:
+            target._apply(plan)
+
+    return run, ctx.records
+
+
+def _bench_plan_output(output):
+    def bench(ctx):
+        plans = ctx.plans()
+        log = getLogger('Bench.Plan')
+
+        def run():
+            output.run(plans=plans, log=log, fh=StringIO())
+
+        return run, len(plans)
+
+    return bench
+
+
+def bench_manager_sync(ctx):
+    manager = Manager(ctx.config_file)
+
+    def run():
+        manager.sync(plan_output_fh=StringIO())
+
+    return run, ctx.records
+
+
+BENCHMARKS = {
+    'import_sys': _bench_import('sys'),
+    'import_record': _bench_import('octodns.record'),
+    'import_manager': _bench_import('octodns.manager'),
+    'record_new': bench_record_new,
+    'zone_add_record': bench_zone_add_record,
+    'zone_changes': bench_zone_changes,
+    'zone_copy': bench_zone_copy,
+    'zone_validate': bench_zone_validate,
+    'yaml_populate': bench_yaml_populate,
+    'jsonl_populate': bench_jsonl_populate,
+    'sqlite_populate': bench_sqlite_populate,
+    'yaml_load_python': _bench_yaml_load(libyaml=False),
+    'yaml_load_libyaml': _bench_yaml_load(libyaml=True),
+    'yaml_order_check': bench_yaml_order_check,
+    'yaml_apply': bench_yaml_apply,
+    'plan_logger': _bench_plan_output(PlanLogger('logger', level='debug')),
+    'plan_json': _bench_plan_output(PlanJson('json')),
+    'plan_markdown': _bench_plan_output(PlanMarkdown('markdown')),
+    'plan_html': _bench_plan_output(PlanHtml('html')),
+    'manager_sync': bench_manager_sync,
+}
+
+
+def measure_memory(ctx):
+    '''
+    Returns the memory allocated by Record.new for every record, along with
+    the number of records and the average bytes per record. The records are
+    kept alive, but not added to zones, so this is just their footprint,
+    including their values.
+    '''
+    items = [
+        (Zone(zone_name, []), records)
+        for zone_name, records in ctx.data.items()
+    ]
+    start()
+    try:
+        kept = [
+            Record.new(zone, name, data)
+            for zone, records in items
+            for name, data in records.items()
+        ]
+        allocated, _ = get_traced_memory()
+    finally:
+        stop()
+    return {
+        'records': len(kept),
+        'bytes': allocated,
+        'bytes_per_record': allocated / len(kept),
+    }
+
+
+class Runner(object):
+    '''
+    Runs benchmarks against synthetic data, see Generator, returning results
+    that can be serialized as JSON and compared across runs/versions.
+    '''
+
+    log = getLogger('Bench')
+
+    def __init__(self, zones=1000, records=100000, seed=42, repeat=3):
+        self.generator = Generator(zones=zones, records=records, seed=seed)
+        self.repeat = repeat
+
+    def run(self, names=None, memory=False):
+        names = names or list(BENCHMARKS.keys())
+        unknown = [n for n in names if n not in BENCHMARKS]
+        if unknown:
+            raise ValueError(f'Unknown benchmark(s): {", ".join(unknown)}')
+
+        directory = mkdtemp(prefix='octodns-bench-')
+        try:
+            self.log.info(
+                'run: generating zones=%d, records=%d, seed=%d',
+                self.generator.zones,
+                self.generator.records,
+                self.generator.seed,
+            )
+            ctx = Context(directory, self.generator)
+            results = {}
+            for name in names:
+                results[name] = self._run_one(name, BENCHMARKS[name], ctx)
+            if memory:
+                memory = self._measure_memory(ctx)
+        finally:
+            rmtree(directory)
+
+        ret = {
+            'octodns': __version__,
+            'python': f'{python_implementation()} {python_version()}',
+            'parameters': {
+                'zones': self.generator.zones,
+                'records': self.generator.records,
+                'seed': self.generator.seed,
+                'repeat': self.repeat,
+            },
+            'benchmarks': results,
+        }
+        if memory:
+            ret['memory'] = memory
+        return ret
+
+    def _measure_memory(self, ctx):
+        ret = measure_memory(ctx)
+        self.log.info(
+            '_measure_memory: records=%d, bytes_per_record=%.1f',
+            ret['records'],
+            ret['bytes_per_record'],
+        )
+        return ret
+
+    def _run_one(self, name, bench, ctx):
+        seconds = []
+        for _ in range(self.repeat):
+            func, ops = bench(ctx)
+            start = perf_counter()
+            func()
+            seconds.append(perf_counter() - start)
+        best = min(seconds)
+        self.log.info('_run_one: name=%s, ops=%d, best=%.3fs', name, ops, best)
+        return {
+            'ops': ops,
+            'seconds': seconds,
+            'min': best,
+            'median': median(seconds),
+            'ops_per_second': ops / best,
+        }
+
+
+def compare(baseline, results):
+    '''
+    Compares two sets of results, returning a dict of benchmark name to the
+    ratio of its minimum time to that of the baseline, i.e. < 1 is faster.
+    Benchmarks that only appear in one of the two are skipped.
+    '''
+    ret = {}
+    for name, result in results['benchmarks'].items():
+        try:
+            base = baseline['benchmarks'][name]['min']
+        except KeyError:
+            continue
+        ret[name] = result['min'] / base
+    return ret
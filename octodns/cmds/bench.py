@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+'''
+octoDNS Benchmarks
+'''
+
+from json import dump, load
+from logging import WARNING, getLogger
+from sys import stdout
+
+from octodns.bench.runner import BENCHMARKS, Runner, compare
+from octodns.cmds.args import ArgumentParser
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split('\n')[1])
+
+    parser.add_argument(
+        '--zones',
+        type=int,
+        default=1000,
+        help='The number of synthetic zones to generate',
+    )
+    parser.add_argument(
+        '--records',
+        type=int,
+        default=100000,
+        help='The total number of synthetic records to generate, spread across the zones',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='The random seed used when generating data, keep it the same to compare runs',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='The number of times to run each benchmark, the best is reported',
+    )
+    parser.add_argument(
+        '--benchmark',
+        default=[],
+        action='append',
+        choices=list(BENCHMARKS.keys()),
+        help='Limit the run to the specified benchmark(s)',
+    )
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        default=False,
+        help='Also measure the memory used per record',
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help='Write the JSON results to the specified file rather than stdout',
+    )
+    parser.add_argument(
+        '--compare',
+        default=None,
+        help='JSON results from a previous run to compare against',
+    )
+
+    args = parser.parse_args(WARNING)
+    # we want to see progress
+    getLogger('Bench').setLevel('INFO')
+
+    runner = Runner(
+        zones=args.zones,
+        records=args.records,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+    results = runner.run(args.benchmark, memory=args.memory)
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            dump(results, fh, indent=2)
+    else:
+        dump(results, stdout, indent=2)
+        stdout.write('\n')
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = load(fh)
+        log = getLogger('Bench')
+        for name, ratio in compare(baseline, results).items():
+            log.info('compare: %s %.2fx of baseline', name, ratio)
+
+
+if __name__ == '__main__':
+    main()
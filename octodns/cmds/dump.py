@@ -37,6 +37,17 @@ def main():
         default=False,
         help='Split the dumped zone into a YAML file per record',
     )
+    parser.add_argument(
+        '--timings-output',
+        default=None,
+        help='Write a report of how long each phase of the run took to the specified file',
+    )
+    parser.add_argument(
+        '--timings-format',
+        choices=('json', 'prometheus'),
+        default='json',
+        help='The format of the --timings-output report, JSON or a Prometheus textfile',
+    )
     parser.add_argument(
         'zone',
         help="Zone to dump, '*' (single quoted to avoid expansion) for all configured zones",
@@ -46,14 +57,20 @@ def main():
     args = parser.parse_args()
 
     manager = Manager(args.config_file)
-    manager.dump(
-        zone=args.zone,
-        output_dir=args.output_dir,
-        output_provider=args.output_provider,
-        lenient=args.lenient,
-        split=args.split,
-        sources=args.source,
-    )
+    try:
+        manager.dump(
+            zone=args.zone,
+            output_dir=args.output_dir,
+            output_provider=args.output_provider,
+            lenient=args.lenient,
+            split=args.split,
+            sources=args.source,
+        )
+    finally:
+        if args.timings_output:
+            manager.timings.write(
+                args.timings_output, format=args.timings_format
+            )
 
 
 if __name__ == '__main__':
@@ -151,7 +151,7 @@ def main():
     loop = new_event_loop()
     limit = Semaphore(concurrency)
     tasks = []
-    for record in sorted(zone.records):
+    for record in sorted(zone):
         for resolver in resolvers:
             tasks.append(
                 loop.create_task(
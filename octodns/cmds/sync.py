@@ -15,6 +15,11 @@ def main():
         required=True,
         help='The Manager configuration file to use',
     )
+    parser.add_argument(
+        '--config-cache-dir',
+        default=None,
+        help='Cache the parsed config file, and anything it !includes, in the specified directory',
+    )
     parser.add_argument(
         '--doit',
         action='store_true',
@@ -32,6 +37,17 @@ def main():
         default=None,
         help="Provide the expected checksum, apply will only continue if it matches the plan's computed checksum",
     )
+    parser.add_argument(
+        '--timings-output',
+        default=None,
+        help='Write a report of how long each phase of the run took to the specified file',
+    )
+    parser.add_argument(
+        '--timings-format',
+        choices=('json', 'prometheus'),
+        default='json',
+        help='The format of the --timings-output report, JSON or a Prometheus textfile',
+    )
 
     parser.add_argument(
         'zone',
@@ -55,15 +71,21 @@ def main():
 
     args = parser.parse_args()
 
-    manager = Manager(args.config_file)
-    manager.sync(
-        eligible_zones=args.zone,
-        eligible_sources=args.source,
-        eligible_targets=args.target,
-        dry_run=not args.doit,
-        force=args.force,
-        checksum=args.checksum,
-    )
+    manager = Manager(args.config_file, config_cache_dir=args.config_cache_dir)
+    try:
+        manager.sync(
+            eligible_zones=args.zone,
+            eligible_sources=args.source,
+            eligible_targets=args.target,
+            dry_run=not args.doit,
+            force=args.force,
+            checksum=args.checksum,
+        )
+    finally:
+        if args.timings_output:
+            manager.timings.write(
+                args.timings_output, format=args.timings_format
+            )
 
 
 if __name__ == '__main__':
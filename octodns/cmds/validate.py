@@ -28,12 +28,28 @@ def main():
         required=True,
         help='The Manager configuration file to use',
     )
+    parser.add_argument(
+        '--config-cache-dir',
+        default=None,
+        help='Cache the parsed config file, and anything it !includes, in the specified directory',
+    )
     parser.add_argument(
         '--all',
         action='store_true',
         default=False,
         help='Validate records in lenient mode, printing warnings so that all validation issues are shown',
     )
+    parser.add_argument(
+        '--timings-output',
+        default=None,
+        help='Write a report of how long each phase of the run took to the specified file',
+    )
+    parser.add_argument(
+        '--timings-format',
+        choices=('json', 'prometheus'),
+        default='json',
+        help='The format of the --timings-output report, JSON or a Prometheus textfile',
+    )
 
     args = parser.parse_args(WARNING)
 
@@ -41,8 +57,14 @@ def main():
     getLogger('Record').addHandler(flagging)
     getLogger('Zone').addHandler(flagging)
 
-    manager = Manager(args.config_file)
-    manager.validate_configs(lenient=args.all)
+    manager = Manager(args.config_file, config_cache_dir=args.config_cache_dir)
+    try:
+        manager.validate_configs(lenient=args.all)
+    finally:
+        if args.timings_output:
+            manager.timings.write(
+                args.timings_output, format=args.timings_format
+            )
 
     if flagging.flag:
         exit(1)
@@ -17,6 +17,8 @@ class EqualityTupleMixin(object):
     key.
     '''
 
+    __slots__ = ()
+
     def _equality_tuple(self):
         raise NotImplementedError('_equality_tuple method not implemented')
 
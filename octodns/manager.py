@@ -2,17 +2,23 @@
 #
 #
 
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from fnmatch import filter as fnmatch_filter
+from functools import partial
 from hashlib import sha256
 from importlib import import_module
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as module_version
 from json import dumps
 from logging import INFO, getLogger
+from multiprocessing import get_context
+from queue import Queue
 from re import compile as re_compile
 from sys import stdout
+from threading import RLock
+from time import monotonic, perf_counter, time
 
 from . import __version__
 from .deprecation import deprecated
@@ -22,11 +28,12 @@ from .processor.meta import MetaProcessor
 from .provider.base import BaseProvider
 from .provider.plan import Plan
 from .provider.yaml import SplitYamlProvider, YamlProvider
-from .record import Record
+from .record import Create, Delete, Record, Update
 from .record.exception import RecordException
 from .record.validator import RecordValidator, ValueValidator
 from .secret.environ import EnvironSecrets
-from .yaml import safe_load
+from .timings import Timings
+from .yaml import YamlCache, include_cache, safe_load
 from .zone import Zone
 from .zone.exception import ZoneException
 from .zone.validator import ZoneValidator
@@ -60,6 +67,76 @@ class _AggregateTarget(object):
         raise AttributeError(f'{klass} object has no attribute {name}')
 
 
+class _LazyObjects(MutableMapping):
+    '''
+    A dict of name to object where objects added with add_factory are only
+    created, by calling their factory, the first time they're looked up. This
+    lets a Manager with a large config skip importing and creating providers
+    and processors, and fetching their secrets, for zones it isn't touching.
+
+    Iterating keys, len, and in don't create anything, values, items, and get
+    do.
+    '''
+
+    _PENDING = object()
+
+    def __init__(self):
+        self._objects = {}
+        self._factories = {}
+        # creation is rare, a single lock is plenty and it's re-entrant in
+        # case creating one thing looks up another
+        self._lock = RLock()
+
+    def add_factory(self, name, factory):
+        self._objects[name] = self._PENDING
+        self._factories[name] = factory
+
+    def created(self):
+        '''
+        Returns the (name, object) pairs of everything that has been created
+        so far without creating anything else.
+        '''
+        return [
+            (name, obj)
+            for name, obj in list(self._objects.items())
+            if obj is not self._PENDING
+        ]
+
+    def create_all(self):
+        for name in list(self._objects):
+            self[name]
+
+    def __getitem__(self, name):
+        obj = self._objects[name]
+        if obj is self._PENDING:
+            with self._lock:
+                obj = self._objects[name]
+                if obj is self._PENDING:
+                    # the factory is only dropped once it's succeeded so that
+                    # a failure, e.g. bad config, is raised every time
+                    obj = self._factories[name]()
+                    self._objects[name] = obj
+                    del self._factories[name]
+        return obj
+
+    def __setitem__(self, name, obj):
+        self._factories.pop(name, None)
+        self._objects[name] = obj
+
+    def __delitem__(self, name):
+        del self._objects[name]
+        self._factories.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._objects
+
+    def __iter__(self):
+        return iter(list(self._objects))
+
+    def __len__(self):
+        return len(self._objects)
+
+
 class MakeThreadFuture(object):
     def __init__(self, func, args, kwargs):
         self.func = func
@@ -103,23 +180,65 @@ class Manager(object):
         include_meta=False,
         auto_arpa=False,
         enable_checksum=False,
+        apply_workers=None,
+        executor=None,
+        plan_workers=None,
+        config_cache_dir=None,
     ):
+        start = time()
+        counter = perf_counter()
         version = self._try_version('octodns', version=__version__)
         self.log.info(
-            '__init__: config_file=%s, (octoDNS %s)', config_file, version
+            '__init__: config_file=%s, config_cache_dir=%s, (octoDNS %s)',
+            config_file,
+            config_cache_dir,
+            version,
         )
 
         self._configured_sub_zones = None
+        self.timings = Timings()
 
         # Read our config file
-        with open(config_file, 'r') as fh:
-            self.config = safe_load(fh, enforce_order=False)
+        if config_cache_dir:
+            self.config = YamlCache(config_cache_dir).load(
+                config_file, enforce_order=False
+            )
+        else:
+            with open(config_file, 'r') as fh:
+                self.config = safe_load(fh, enforce_order=False)
 
         zones = self.config['zones']
         self.config['zones'] = self._config_zones(zones)
 
         manager_config = self.config.get('manager') or {}
-        self._executor = self._config_executor(manager_config, max_workers)
+        # state shared with process executor workers, filled in below once
+        # the processors have been configured, see _config_worker_state
+        self._worker_state = {}
+        # ids of the plans that were made in process executor workers, their
+        # targets haven't been populated in this process, see _apply_plan
+        self._worker_plans = set()
+        self._executor = self._config_executor(
+            manager_config,
+            max_workers,
+            executor,
+            # process workers build their own Manager from the same config
+            worker_args=(
+                config_file,
+                {
+                    'include_meta': include_meta,
+                    'auto_arpa': auto_arpa,
+                    'enable_checksum': enable_checksum,
+                    'plan_workers': plan_workers,
+                },
+                self._worker_state,
+            ),
+        )
+        self._apply_executor = self._config_apply_executor(
+            manager_config, apply_workers
+        )
+        self._plan_executor = self._config_plan_executor(
+            manager_config, plan_workers
+        )
         self.include_meta = self._config_include_meta(
             manager_config, include_meta
         )
@@ -190,6 +309,18 @@ class Manager(object):
         }
         self.plan_outputs = self._config_plan_outputs(plan_outputs_config)
 
+        self._config_worker_state()
+
+        seconds = perf_counter() - counter
+        self.timings.record('init', seconds, start=start)
+        self.log.info(
+            '__init__: done in %.3fs, providers=%d, processors=%d, created=%d',
+            seconds,
+            len(self.providers),
+            len(self.processors),
+            len(self.providers.created()) + len(self.processors.created()),
+        )
+
     def _config_zones(self, zones):
         # record the set of configured zones we have as they are
         configured_zones = set([z.lower() for z in zones.keys()])
@@ -208,17 +339,86 @@ class Manager(object):
         # convert the zones portion of things into an IdnaDict
         return IdnaDict(zones)
 
-    def _config_executor(self, manager_config, max_workers=None):
+    def _config_executor(
+        self, manager_config, max_workers=None, executor=None, worker_args=()
+    ):
         max_workers = (
             manager_config.get('max_workers') or 1
             if max_workers is None
             else max_workers
         )
         self.log.info('_config_executor: max_workers=%d', max_workers)
+        executor = executor or manager_config.get('executor', 'thread')
+        if executor == 'process':
+            self.log.info('_config_executor: executor=process')
+            # spawn rather than fork so that workers behave the same across
+            # platforms and don't inherit any threads/locks from this process.
+            # Workers are started on demand so worker_args are picked up as
+            # of the first submit.
+            return ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=get_context('spawn'),
+                initializer=_process_worker_init,
+                initargs=worker_args,
+            )
+        elif executor != 'thread':
+            raise ManagerException(
+                f'Unknown executor "{executor}", options are "thread" and "process"'
+            )
         if max_workers > 1:
             return ThreadPoolExecutor(max_workers=max_workers)
         return MainThreadExecutor()
 
+    @property
+    def _process_executor(self):
+        return isinstance(self._executor, ProcessPoolExecutor)
+
+    def _config_worker_state(self):
+        # Per-run values that workers need to agree with us on, e.g. the time
+        # and uuid of MetaProcessors which would otherwise differ per worker
+        if self._process_executor:
+            # any processor may turn out to be a MetaProcessor, so they all
+            # need to exist up front
+            self.processors.create_all()
+        self._worker_state['meta'] = {
+            name: (processor.time, processor.uuid)
+            for name, processor in self.processors.created()
+            if isinstance(processor, MetaProcessor)
+        }
+
+    def _config_apply_executor(self, manager_config, apply_workers=None):
+        apply_workers = (
+            manager_config.get('apply_workers')
+            if apply_workers is None
+            else apply_workers
+        )
+        if apply_workers is None:
+            if not self._process_executor:
+                # not explicitly configured, share the planning executor
+                self.log.info(
+                    '_config_apply_executor: apply_workers=None, using planning executor'
+                )
+                return self._executor
+            # targets can only be applied in this process, use threads
+            apply_workers = self._executor._max_workers
+        self.log.info('_config_apply_executor: apply_workers=%d', apply_workers)
+        if apply_workers > 1:
+            return ThreadPoolExecutor(max_workers=apply_workers)
+        return MainThreadExecutor()
+
+    def _config_plan_executor(self, manager_config, plan_workers=None):
+        plan_workers = (
+            manager_config.get('plan_workers') or 1
+            if plan_workers is None
+            else plan_workers
+        )
+        self.log.info('_config_plan_executor: plan_workers=%d', plan_workers)
+        # this is a separate pool from the zone executor, planning tasks are
+        # submitted from within zone tasks and sharing a pool could deadlock
+        if plan_workers > 1:
+            return ThreadPoolExecutor(max_workers=plan_workers)
+        return MainThreadExecutor()
+
     def _config_include_meta(self, manager_config, include_meta=False):
         include_meta = include_meta or manager_config.get('include_meta', False)
         self.log.info('_config_include_meta: include_meta=%s', include_meta)
@@ -272,7 +472,7 @@ class Manager(object):
 
     def _config_providers(self, providers_config):
         self.log.debug('_config_providers: configuring providers')
-        providers = {}
+        providers = _LazyObjects()
         for provider_name, provider_config in providers_config.items():
             # Get our class and remove it from the provider_config
             try:
@@ -282,28 +482,44 @@ class Manager(object):
                 raise ManagerException(
                     f'Provider {provider_name} is missing class, {provider_config.context}'
                 )
-            _class, module, version = self._get_named_class(
-                'provider', _class, provider_config.context
-            )
-            kwargs = self._build_kwargs(provider_config)
-            try:
-                providers[provider_name] = _class(provider_name, **kwargs)
-                self.log.info(
-                    '__init__: provider=%s (%s %s)',
+            # importing, fetching secrets, and creating the provider waits
+            # until it's first used
+            providers.add_factory(
+                provider_name,
+                partial(
+                    self._create_provider,
                     provider_name,
-                    module,
-                    version,
-                )
-            except TypeError:
-                self.log.exception('Invalid provider config')
-                raise ManagerException(
-                    f'Incorrect provider config for {provider_name}, {provider_config.context}'
-                )
+                    _class,
+                    provider_config,
+                ),
+            )
 
         return providers
 
+    def _create_provider(self, provider_name, _class, provider_config):
+        counter = perf_counter()
+        _class, module, version = self._get_named_class(
+            'provider', _class, provider_config.context
+        )
+        kwargs = self._build_kwargs(provider_config)
+        try:
+            provider = _class(provider_name, **kwargs)
+        except TypeError:
+            self.log.exception('Invalid provider config')
+            raise ManagerException(
+                f'Incorrect provider config for {provider_name}, {provider_config.context}'
+            )
+        self.log.info(
+            '_create_provider: provider=%s (%s %s) in %.3fs',
+            provider_name,
+            module,
+            version,
+            perf_counter() - counter,
+        )
+        return provider
+
     def _config_processors(self, processors_config):
-        processors = {}
+        processors = _LazyObjects()
         for processor_name, processor_config in processors_config.items():
             try:
                 _class = processor_config.pop('class')
@@ -312,25 +528,39 @@ class Manager(object):
                 raise ManagerException(
                     f'Processor {processor_name} is missing class, {processor_config.context}'
                 )
-            _class, module, version = self._get_named_class(
-                'processor', _class, processor_config.context
-            )
-            kwargs = self._build_kwargs(processor_config)
-            try:
-                processors[processor_name] = _class(processor_name, **kwargs)
-                self.log.info(
-                    '__init__: processor=%s (%s %s)',
+            processors.add_factory(
+                processor_name,
+                partial(
+                    self._create_processor,
                     processor_name,
-                    module,
-                    version,
-                )
-            except TypeError:
-                self.log.exception('Invalid processor config')
-                raise ManagerException(
-                    f'Incorrect processor config for {processor_name}, {processor_config.context}'
-                )
+                    _class,
+                    processor_config,
+                ),
+            )
         return processors
 
+    def _create_processor(self, processor_name, _class, processor_config):
+        counter = perf_counter()
+        _class, module, version = self._get_named_class(
+            'processor', _class, processor_config.context
+        )
+        kwargs = self._build_kwargs(processor_config)
+        try:
+            processor = _class(processor_name, **kwargs)
+        except TypeError:
+            self.log.exception('Invalid processor config')
+            raise ManagerException(
+                f'Incorrect processor config for {processor_name}, {processor_config.context}'
+            )
+        self.log.info(
+            '_create_processor: processor=%s (%s %s) in %.3fs',
+            processor_name,
+            module,
+            version,
+            perf_counter() - counter,
+        )
+        return processor
+
     def _config_validators(self, validators_config):
         # Parses the top-level `validators:` config section, instantiates each
         # validator, and registers it into the available registry via
@@ -466,6 +696,13 @@ class Manager(object):
                         record_type,
                     )
 
+        cache_size = record_config.get('cache_size', 0)
+        if cache_size:
+            self.log.info(
+                '_configure_validators: validation cache_size=%d', cache_size
+            )
+        Record.enable_validation_cache(cache_size)
+
         zone_config = validators_config.get('zone') or {}
         for name in zone_config.get('validators') or []:
             try:
@@ -666,8 +903,10 @@ class Manager(object):
         targets,
         desired=None,
         lenient=False,
+        zone=None,
     ):
-        zone = self.get_zone(zone_name)
+        if zone is None:
+            zone = self.get_zone(zone_name)
         self.log.debug(
             'sync:   populating, zone=%s, lenient=%s',
             zone.decoded_name,
@@ -677,50 +916,80 @@ class Manager(object):
         if desired:
             # This is an alias zone, rather than populate it we'll copy the
             # records over from `desired`.
-            for _, records in desired._records.items():
-                for record in records:
-                    zone.add_record(record.copy(zone=zone), lenient=lenient)
+            with self.timings.time('populate', zone=zone.decoded_name):
+                for _, records in desired._records.items():
+                    for record in records:
+                        zone.add_record(record.copy(zone=zone), lenient=lenient)
         else:
             for source in sources:
+                with self.timings.time(
+                    'populate', zone=zone.decoded_name, source=source.id
+                ):
+                    try:
+                        source.populate(zone, lenient=lenient)
+                    except TypeError as e:
+                        e_str = str(e)
+                        if "unexpected keyword argument 'lenient'" not in e_str:
+                            raise
+                        deprecated(
+                            f'`populate` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {source.__class__.__name__}',
+                            stacklevel=99,
+                        )
+                        self.log.warning(
+                            'provider %s does not accept lenient param',
+                            source.__class__.__name__,
+                        )
+                        source.populate(zone)
+
+        for processor in processors:
+            with self.timings.time(
+                'process_source_zone',
+                zone=zone.decoded_name,
+                processor=processor.id,
+            ):
                 try:
-                    source.populate(zone, lenient=lenient)
+                    zone = processor.process_source_zone(
+                        zone, sources=sources, lenient=lenient
+                    )
                 except TypeError as e:
                     if "unexpected keyword argument 'lenient'" not in str(e):
                         raise
                     deprecated(
-                        f'`populate` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {source.__class__.__name__}',
+                        f'`process_source_zone` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {processor.__class__.__name__}',
                         stacklevel=99,
                     )
                     self.log.warning(
-                        'provider %s does not accept lenient param',
-                        source.__class__.__name__,
+                        'processor %s does not accept lenient param',
+                        processor.__class__.__name__,
                     )
-                    source.populate(zone)
-
-        for processor in processors:
-            try:
-                zone = processor.process_source_zone(
-                    zone, sources=sources, lenient=lenient
-                )
-            except TypeError as e:
-                if "unexpected keyword argument 'lenient'" not in str(e):
-                    raise
-                deprecated(
-                    f'`process_source_zone` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {processor.__class__.__name__}',
-                    stacklevel=99,
-                )
-                self.log.warning(
-                    'processor %s does not accept lenient param',
-                    processor.__class__.__name__,
-                )
-                zone = processor.process_source_zone(zone, sources=sources)
+                    zone = processor.process_source_zone(zone, sources=sources)
 
-        zone.validate(lenient=lenient)
+        with self.timings.time('validate', zone=zone.decoded_name):
+            zone.validate(lenient=lenient)
 
         self.log.debug('sync:   planning, zone=%s', zone.decoded_name)
+        # each target works on its own copy of zone so they can be planned
+        # concurrently, results are collected in targets order to keep things
+        # deterministic
+        futures = [
+            self._plan_executor.submit(
+                self._plan_target, zone, target, processors, sources, lenient
+            )
+            for target in targets
+        ]
         plans = []
+        for target, future in zip(targets, futures):
+            plan = future.result()
+            if plan:
+                plans.append((target, plan))
 
-        for target in targets:
+        # Return the zone as it's the desired state
+        return plans, zone
+
+    def _plan_target(self, zone, target, processors, sources, lenient):
+        with self.timings.time(
+            'plan', zone=zone.decoded_name, target=target.id
+        ):
             try:
                 plan = target.plan(zone, processors=processors, lenient=lenient)
             except TypeError as e:
@@ -761,7 +1030,13 @@ class Manager(object):
                 else:
                     raise
 
-            for processor in processors:
+        for processor in processors:
+            with self.timings.time(
+                'process_plan',
+                zone=zone.decoded_name,
+                target=target.id,
+                processor=processor.id,
+            ):
                 try:
                     plan = processor.process_plan(
                         plan, sources=sources, target=target, lenient=lenient
@@ -780,11 +1055,255 @@ class Manager(object):
                     plan = processor.process_plan(
                         plan, sources=sources, target=target
                     )
-            if plan:
-                plans.append((target, plan))
+        return plan
 
-        # Return the zone as it's the desired state
-        return plans, zone
+    def _submit_delayed_arpa(self, **kwargs):
+        # AutoArpa's state lives in this process so when using worker
+        # processes arpa zones are planned here
+        executor = (
+            MainThreadExecutor() if self._process_executor else self._executor
+        )
+        return executor.submit(self._populate_and_plan, **kwargs)
+
+    def _schedule_zones(self, nodes, deps, aliases):
+        '''
+        Populates and plans each of the zones in nodes as soon as all of the
+        zones it depends on have completed rather than in fixed phases.
+        Whenever zones become ready they're started in order of the longest
+        chain of zones waiting on them, then the number of targets, so that
+        the things most likely to hold up the rest of the sync go first.
+        Returns a dict of zone name to (plans, desired).
+        '''
+        dependents = defaultdict(list)
+        for zone_name, zone_deps in deps.items():
+            for dep in zone_deps:
+                dependents[dep].append(zone_name)
+        # dependents always come after the zones they depend on in nodes so
+        # walking it backwards sees them first
+        rank = {}
+        for zone_name in reversed(nodes):
+            rank[zone_name] = 1 + max(
+                (rank[d] for d in dependents[zone_name]), default=0
+            )
+        order = {zone_name: i for i, zone_name in enumerate(nodes)}
+
+        def priority(zone_name):
+            targets = nodes[zone_name][1]['targets']
+            return (-rank[zone_name], -len(targets), order[zone_name])
+
+        waiting = {
+            zone_name: len(zone_deps) for zone_name, zone_deps in deps.items()
+        }
+        done = Queue()
+        futures = {}
+        started = {}
+        finished = {}
+        results = {}
+
+        def submit(zone_name):
+            submitter, kwargs = nodes[zone_name]
+            if zone_name in aliases:
+                kwargs = dict(kwargs, desired=results[aliases[zone_name]][1])
+            self.log.debug('_schedule_zones: starting zone=%s', zone_name)
+            started[zone_name] = monotonic()
+            future = submitter(**kwargs)
+            futures[zone_name] = future
+            if hasattr(future, 'add_done_callback'):
+
+                def callback(_, zone_name=zone_name):
+                    finished[zone_name] = monotonic()
+                    done.put(zone_name)
+
+                future.add_done_callback(callback)
+            else:
+                # MainThreadExecutor, the work happens when we ask for the
+                # result
+                done.put(zone_name)
+
+        for zone_name in sorted(
+            (n for n, c in waiting.items() if not c), key=priority
+        ):
+            submit(zone_name)
+
+        while len(results) < len(nodes):
+            zone_name = done.get()
+            if zone_name not in finished:
+                started[zone_name] = monotonic()
+            results[zone_name] = futures[zone_name].result()
+            finished.setdefault(zone_name, monotonic())
+            ready = []
+            for dependent in dependents[zone_name]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+            for dependent in sorted(ready, key=priority):
+                submit(dependent)
+
+        if finished:
+            # walk back from the last zone to finish through whichever of
+            # its dependencies finished last
+            path = [max(finished, key=finished.get)]
+            while deps[path[-1]]:
+                path.append(max(deps[path[-1]], key=finished.get))
+            path.reverse()
+            self.log.info(
+                '_schedule_zones: critical path=%s, elapsed=%.3fs',
+                ' -> '.join(
+                    f'{idna_decode(n)} ({finished[n] - started[n]:.3f}s)'
+                    for n in path
+                ),
+                finished[path[-1]] - started[path[0]],
+            )
+
+        return results
+
+    def _submit_populate_and_plan(
+        self,
+        zone_name,
+        processors,
+        sources,
+        targets,
+        desired=None,
+        lenient=False,
+    ):
+        if not self._process_executor:
+            return self._executor.submit(
+                self._populate_and_plan,
+                zone_name,
+                processors,
+                sources,
+                targets,
+                desired=desired,
+                lenient=lenient,
+            )
+
+        # objects don't cross the process boundary, things are referred to by
+        # id and zones are shipped in packed form
+        memo = {}
+        future = self._executor.submit(
+            _process_populate_and_plan,
+            _pack_zone(self.get_zone(zone_name), memo),
+            [p.id for p in processors],
+            [s.id for s in sources],
+            [t.id for t in targets],
+            desired=_pack_zone(desired, memo) if desired else None,
+            lenient=lenient,
+        )
+        return _PackedPlansFuture(self, future)
+
+    def _worker_populate_and_plan(
+        self, zone, processors, sources, targets, desired=None, lenient=False
+    ):
+        '''
+        Runs in process executor workers, the counterpart to
+        _submit_populate_and_plan.
+        '''
+        memo = {}
+        zone = self._unpack_zone(zone, memo)
+        if desired:
+            desired = self._unpack_zone(desired, memo)
+
+        auto_arpa = self.processors.get('auto-arpa') if self.auto_arpa else None
+        if auto_arpa:
+            # only ship back what this zone contributes
+            auto_arpa._records.clear()
+        # same for timings
+        self.timings.reset()
+
+        plans, desired = self._populate_and_plan(
+            zone.name,
+            [self.processors[p] for p in processors],
+            [self.providers[s] for s in sources],
+            [self.providers[t] for t in targets],
+            desired=desired,
+            lenient=lenient,
+            zone=zone,
+        )
+
+        memo = {}
+        plans = [(t.id, _pack_plan(p, memo)) for t, p in plans]
+        arpa = dict(auto_arpa._records) if auto_arpa else None
+        timings = (self.timings.origin, self.timings.entries)
+        return plans, _pack_zone(desired, memo), arpa, timings
+
+    def _find_source(self, source_id):
+        if source_id is None:
+            return None
+        try:
+            return self.providers[source_id]
+        except KeyError:
+            # processors, e.g. AutoArpa, can be sources too
+            return self.processors.get(source_id)
+
+    def _unpack_zone_header(self, header, memo):
+        key = id(header)
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        name, sub_zones, update, delete, ignore, context, validators = header
+        zone = memo[key] = Zone(
+            name,
+            sub_zones,
+            update,
+            delete,
+            ignore_subzone_adds=ignore,
+            context=context,
+            validators=validators,
+        )
+        return zone
+
+    def _unpack_record(self, packed, memo):
+        key = id(packed)
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        header, _type, name, data, source, context = packed
+        _class = Record.registered_types()[_type]
+        # already validated in the worker, construct directly
+        record = memo[key] = _class(
+            self._unpack_zone_header(header, memo),
+            name,
+            data,
+            source=self._find_source(source),
+            context=context,
+        )
+        return record
+
+    def _unpack_zone(self, packed, memo):
+        header, records = packed
+        zone = self._unpack_zone_header(header, memo)
+        for packed_record in records:
+            record = self._unpack_record(packed_record, memo)
+            # records were added (and checked) in the worker, skip straight to
+            # storing them
+            zone._store(record)
+        return zone
+
+    def _unpack_plan(self, packed, memo):
+        existing, desired, changes, exists, update, delete, meta = packed
+        unpacked = []
+        for _class, existing_record, new_record in changes:
+            if existing_record is not None:
+                existing_record = self._unpack_record(existing_record, memo)
+            if new_record is not None:
+                new_record = self._unpack_record(new_record, memo)
+            if _class == 'Create':
+                unpacked.append(Create(new_record))
+            elif _class == 'Delete':
+                unpacked.append(Delete(existing_record))
+            else:
+                unpacked.append(Update(existing_record, new_record))
+        return Plan(
+            self._unpack_zone(existing, memo),
+            self._unpack_zone(desired, memo),
+            unpacked,
+            exists,
+            update_pcent_threshold=update,
+            delete_pcent_threshold=delete,
+            meta=meta,
+        )
 
     def _get_sources(self, decoded_zone_name, config, eligible_sources):
         try:
@@ -940,6 +1459,8 @@ class Manager(object):
             checksum,
         )
 
+        start = time()
+
         zones = self.config['zones']
 
         zones = self._preprocess_zones(zones, eligible_sources)
@@ -967,7 +1488,10 @@ class Manager(object):
 
         aliased_zones = {}
         delayed_arpa = []
-        futures = []
+        # zone name -> (submit function, kwargs), ordered normal, aliased, and
+        # then arpa zones which is the order plans are collected in below
+        nodes = {}
+        deps = {}
 
         for zone_name, config in zones.items():
             if config is None:
@@ -1052,59 +1576,43 @@ class Manager(object):
             if self.auto_arpa and zone_name.endswith('arpa.'):
                 delayed_arpa.append(kwargs)
             else:
-                futures.append(
-                    self._executor.submit(self._populate_and_plan, **kwargs)
-                )
+                nodes[zone_name] = (self._submit_populate_and_plan, kwargs)
+                deps[zone_name] = ()
 
-        # Wait on all results and unpack/flatten the plans and store the
-        # desired states in case we need them below
-        plans = []
-        desired = {}
-        for future in futures:
-            ps, d = future.result()
-            desired[d.name] = d
-            for plan in ps:
-                plans.append(plan)
-
-        # Populate aliases zones.
-        futures = []
+        # Aliased zones copy their records from the desired state of their
+        # source zone so they depend on it
         for zone_name, zone_source in aliased_zones.items():
-            source_config = self.config['zones'][zone_source]
-            try:
-                desired_config = desired[zone_source]
-            except KeyError:
+            if zone_source not in nodes:
                 raise ManagerException(
                     f'Zone {idna_decode(zone_name)} cannot be synced without zone {zone_source} sinced it is aliased'
                 )
-            futures.append(
-                self._executor.submit(
-                    self._populate_and_plan,
-                    zone_name,
-                    processors,
-                    [],
-                    [self.providers[t] for t in source_config['targets']],
-                    desired=desired_config,
-                    lenient=lenient,
-                )
+            source_config = self.config['zones'][zone_source]
+            nodes[zone_name] = (
+                self._submit_populate_and_plan,
+                {
+                    'zone_name': zone_name,
+                    'processors': processors,
+                    'sources': [],
+                    'targets': [
+                        self.providers[t] for t in source_config['targets']
+                    ],
+                    'lenient': lenient,
+                },
             )
-
-        # Wait on results and unpack/flatten the plans, ignore the desired here
-        # as these are aliased zones
-        plans += [p for f in futures for p in f.result()[0]]
+            deps[zone_name] = (zone_source,)
 
         if delayed_arpa:
-            # if delaying arpa all of the non-arpa zones have been processed now
-            # so it's time to plan them
-            self.log.info(
-                'sync: processing %d delayed arpa zones', len(delayed_arpa)
-            )
-            # populate and plan them
-            futures = [
-                self._executor.submit(self._populate_and_plan, **kwargs)
-                for kwargs in delayed_arpa
-            ]
-            # wait on the results and unpack/flatten the plans
-            plans += [p for f in futures for p in f.result()[0]]
+            # AutoArpa needs to have seen all of the records in the forward
+            # zones before arpa zones can be planned so they depend on all of
+            # them
+            self.log.info('sync: delaying %d arpa zones', len(delayed_arpa))
+            forward = tuple(nodes.keys())
+            for kwargs in delayed_arpa:
+                nodes[kwargs['zone_name']] = (self._submit_delayed_arpa, kwargs)
+                deps[kwargs['zone_name']] = forward
+
+        results = self._schedule_zones(nodes, deps, aliased_zones)
+        plans = [p for zone_name in nodes for p in results[zone_name][0]]
 
         # Best effort sort plans children first so that we create/update
         # children zones before parents which should allow us to more safely
@@ -1133,15 +1641,16 @@ class Manager(object):
                 plan.raise_if_unsafe()
 
         if dry_run and not checksum:
+            self.timings.record('sync', time() - start, start=start)
             return 0
         elif computed_checksum and computed_checksum != checksum:
             raise ManagerException(
                 f'checksum={checksum} does not match computed={computed_checksum}'
             )
 
-        total_changes = 0
         self.log.debug('sync:   applying')
         zones = self.config['zones']
+        applicable = []
         for target, plan in plans:
             zone_name = plan.existing.decoded_name
             if zones[zone_name].get('always-dry-run', False):
@@ -1149,9 +1658,143 @@ class Manager(object):
                     'sync: zone=%s skipping always-dry-run', zone_name
                 )
                 continue
-            total_changes += target.apply(plan)
+            applicable.append((target, plan))
+
+        total_changes = self._apply_plans(applicable)
 
+        self.log.debug(
+            'sync: include cache hits=%d, misses=%d',
+            include_cache.hits,
+            include_cache.misses,
+        )
         self.log.info('sync:   %d total changes', total_changes)
+        self.timings.record('sync', time() - start, start=start)
+        return total_changes
+
+    @classmethod
+    def _apply_waves(cls, plans):
+        '''
+        Groups plans into waves that can safely be applied concurrently. A
+        zone's plans always land in a later wave than those of any of its
+        sub-zones so that children are created/updated before their parents,
+        see the plan sorting in sync for why. Plans for unrelated zones, and
+        for the same zone to multiple targets, share a wave.
+        '''
+        names = set(p.desired.name for _, p in plans)
+        levels = {}
+        # deepest (longest) names first so that a zone's level is final before
+        # it's pushed up to its closest parent
+        for name in sorted(names, key=len, reverse=True):
+            level = levels.setdefault(name, 0)
+            parent = name
+            while '.' in parent[:-1]:
+                parent = parent.split('.', 1)[1]
+                if parent in names:
+                    levels[parent] = max(levels.get(parent, 0), level + 1)
+                    break
+
+        waves = defaultdict(list)
+        for target, plan in plans:
+            waves[levels[plan.desired.name]].append((target, plan))
+        return [waves[level] for level in sorted(waves)]
+
+    def _apply_plan(self, target, plan):
+        with self.timings.time(
+            'apply', zone=plan.desired.decoded_name, target=target.id
+        ):
+            if id(plan) in self._worker_plans:
+                self._worker_plans.discard(id(plan))
+                # the plan was made in a worker process so this instance of
+                # the target has never populated the zone. Providers can rely
+                # on state from populate, e.g. zone or record ids, in _apply
+                # so it's re-populated, as plan would have, first
+                self.log.debug(
+                    '_apply_plan: populating zone=%s, target=%s',
+                    plan.desired.decoded_name,
+                    target.id,
+                )
+                existing = Zone(plan.existing.name, plan.existing.sub_zones)
+                target.populate(existing, target=True, lenient=True)
+            return target.apply(plan)
+
+    def _apply_zone_plans(self, plans):
+        ret = []
+        for target, plan in plans:
+            try:
+                ret.append((target, plan, self._apply_plan(target, plan), None))
+            except Exception as e:
+                self.log.exception(
+                    '_apply_plans: zone=%s, target=%s failed',
+                    plan.desired.decoded_name,
+                    target.id,
+                )
+                ret.append((target, plan, None, e))
+        return ret
+
+    def _apply_plans(self, plans):
+        results = []
+        failures = []
+        failed_zones = set()
+        for wave in self._apply_waves(plans):
+            zones = defaultdict(list)
+            for target, plan in wave:
+                zone_name = plan.desired.name
+                dotted = f'.{zone_name}'
+                if any(f.endswith(dotted) for f in failed_zones):
+                    # one of our sub-zones failed, applying the parent could
+                    # do more harm than good
+                    failures.append(
+                        (
+                            target,
+                            plan,
+                            ManagerException('skipped, sub-zone apply failed'),
+                        )
+                    )
+                    failed_zones.add(zone_name)
+                    continue
+                zones[zone_name].append((target, plan))
+            # zones are applied concurrently, but a zone's targets one at a
+            # time as they may share underlying resources, e.g. YamlProviders
+            # pointed at the same directory
+            futures = [
+                self._apply_executor.submit(self._apply_zone_plans, zone_plans)
+                for zone_plans in zones.values()
+            ]
+            # wait on everything in this wave before moving on to the next
+            for future in futures:
+                for target, plan, num_changes, e in future.result():
+                    if e is None:
+                        results.append((target, plan, num_changes))
+                    else:
+                        failures.append((target, plan, e))
+                        failed_zones.add(plan.desired.name)
+
+        total_changes = 0
+        for target, plan, num_changes in results:
+            self.log.info(
+                '_apply_plans: zone=%s, target=%s, applied %d changes',
+                plan.desired.decoded_name,
+                target.id,
+                num_changes,
+            )
+            total_changes += num_changes
+
+        if failures:
+            for target, plan, e in failures:
+                self.log.error(
+                    '_apply_plans: zone=%s, target=%s, failed: %s',
+                    plan.desired.decoded_name,
+                    target.id,
+                    e,
+                )
+            details = ', '.join(
+                f'{p.desired.decoded_name} ({t.id}): {e}'
+                for t, p, e in failures
+            )
+            raise ManagerException(
+                f'{len(failures)} of {len(plans)} plans failed to apply, {details}'
+            ) from failures[0][2]
+
         return total_changes
 
     def compare(self, a, b, zone):
@@ -1266,38 +1909,63 @@ class Manager(object):
             self.log.info('dump:     processors=%s', [p.id for p in processors])
 
             zone = self.get_zone(zone_name)
+            decoded_zone_name = zone.decoded_name
             for source in sources:
-                source.populate(zone, lenient=lenient)
+                with self.timings.time(
+                    'populate', zone=decoded_zone_name, source=source.id
+                ):
+                    source.populate(zone, lenient=lenient)
 
             # Apply processors
             for processor in processors:
-                try:
-                    zone = processor.process_source_zone(
-                        zone, sources=sources, lenient=lenient
-                    )
-                except TypeError as e:
-                    if "unexpected keyword argument 'lenient'" not in str(e):
-                        raise
-                    deprecated(
-                        f'`process_source_zone` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {processor.__class__.__name__}',
-                        stacklevel=99,
-                    )
-                    self.log.warning(
-                        'processor %s does not accept lenient param',
-                        processor.__class__.__name__,
-                    )
-                    zone = processor.process_source_zone(zone, sources=sources)
+                with self.timings.time(
+                    'process_source_zone',
+                    zone=decoded_zone_name,
+                    processor=processor.id,
+                ):
+                    try:
+                        zone = processor.process_source_zone(
+                            zone, sources=sources, lenient=lenient
+                        )
+                    except TypeError as e:
+                        if "unexpected keyword argument 'lenient'" not in str(
+                            e
+                        ):
+                            raise
+                        deprecated(
+                            f'`process_source_zone` method does not support the `lenient` param, fallback is DEPRECATED. Will be removed in 2.0. Class {processor.__class__.__name__}',
+                            stacklevel=99,
+                        )
+                        self.log.warning(
+                            'processor %s does not accept lenient param',
+                            processor.__class__.__name__,
+                        )
+                        zone = processor.process_source_zone(
+                            zone, sources=sources
+                        )
 
-            zone.validate(lenient=lenient)
+            with self.timings.time('validate', zone=decoded_zone_name):
+                zone.validate(lenient=lenient)
 
-            plan = target.plan(zone)
+            with self.timings.time(
+                'plan', zone=decoded_zone_name, target=target.id
+            ):
+                plan = target.plan(zone)
             if plan is None:
                 plan = Plan(zone, zone, [], False)
-            target.apply(plan)
+            with self.timings.time(
+                'apply', zone=decoded_zone_name, target=target.id
+            ):
+                target.apply(plan)
 
     def validate_configs(self, lenient=False):
         # TODO: this code can probably be shared with stuff in sync
 
+        # providers and processors are normally only created when first used,
+        # create them all so that any problems with their config are found
+        self.providers.create_all()
+        self.processors.create_all()
+
         zones = self.config['zones']
         zones = self._preprocess_zones(zones)
 
@@ -1347,9 +2015,13 @@ class Manager(object):
             zone_lenient = lenient or config.get('lenient', False)
             for source in sources:
                 if isinstance(source, YamlProvider):
-                    source.populate(zone, lenient=zone_lenient)
+                    with self.timings.time(
+                        'populate', zone=decoded_zone_name, source=source.id
+                    ):
+                        source.populate(zone, lenient=zone_lenient)
 
-            zone.validate(lenient=zone_lenient)
+            with self.timings.time('validate', zone=decoded_zone_name):
+                zone.validate(lenient=zone_lenient)
 
             # check that processors are in order if any are specified
             processors = config.get('processors') or []
@@ -1392,3 +2064,116 @@ class Manager(object):
             )
 
         raise ManagerException(f'Unknown zone name {idna_decode(zone_name)}')
+
+
+class _PackedPlansFuture(object):
+    '''
+    Wraps a process executor future, unpacking the plans and desired zone that
+    come back from the worker and merging in its AutoArpa contributions.
+    '''
+
+    def __init__(self, manager, future):
+        self.manager = manager
+        self.future = future
+
+    def add_done_callback(self, fn):
+        self.future.add_done_callback(lambda _: fn(self))
+
+    def result(self):
+        plans, desired, arpa, timings = self.future.result()
+        manager = self.manager
+        origin, entries = timings
+        manager.timings.merge(entries, origin)
+        if arpa:
+            auto_arpa = manager.processors['auto-arpa']
+            for ptr, fqdns in arpa.items():
+                auto_arpa._records[ptr].extend(fqdns)
+        memo = {}
+        plans = [
+            (manager.providers[t], manager._unpack_plan(p, memo))
+            for t, p in plans
+        ]
+        manager._worker_plans.update(id(p) for _, p in plans)
+        return plans, manager._unpack_zone(desired, memo)
+
+
+def _pack_zone_header(zone, memo):
+    key = id(zone)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    header = memo[key] = (
+        zone.name,
+        zone.sub_zones,
+        zone.update_pcent_threshold,
+        zone.delete_pcent_threshold,
+        zone.ignore_subzone_adds,
+        zone.context,
+        zone.validators_config,
+    )
+    return header
+
+
+def _pack_record(record, memo):
+    key = id(record)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    # records are shared between zones and changes, the memo ensures they're
+    # only packed once and pickle takes care of the rest
+    packed = memo[key] = (
+        _pack_zone_header(record.zone, memo),
+        record._type,
+        record.name,
+        record.data,
+        getattr(record.source, 'id', None),
+        record.context,
+    )
+    return packed
+
+
+def _pack_zone(zone, memo):
+    return (
+        _pack_zone_header(zone, memo),
+        [_pack_record(r, memo) for r in zone],
+    )
+
+
+def _pack_plan(plan, memo):
+    return (
+        _pack_zone(plan.existing, memo),
+        _pack_zone(plan.desired, memo),
+        [
+            (
+                c.__class__.__name__,
+                _pack_record(c.existing, memo) if c.existing else None,
+                _pack_record(c.new, memo) if c.new else None,
+            )
+            for c in plan.changes
+        ],
+        plan.exists,
+        plan.update_pcent_threshold,
+        plan.delete_pcent_threshold,
+        plan.meta,
+    )
+
+
+# The Manager used by process executor workers, see _process_worker_init
+_worker_manager = None
+
+
+def _process_worker_init(config_file, kwargs, state):
+    global _worker_manager
+    _worker_manager = Manager(
+        config_file, max_workers=1, executor='thread', **kwargs
+    )
+    for name, (meta_time, meta_uuid) in state.get('meta', {}).items():
+        processor = _worker_manager.processors[name]
+        processor.time = meta_time
+        processor.uuid = meta_uuid
+
+
+def _process_populate_and_plan(*args, **kwargs):
+    return _worker_manager._worker_populate_and_plan(*args, **kwargs)
@@ -33,7 +33,7 @@ class AcmeManagingProcessor(BaseProcessor):
 
     def process_source_zone(self, desired, sources, lenient=False):
         lenient = self.lenient or lenient
-        for record in desired.records:
+        for record in desired:
             if record._type == 'TXT' and record.name.startswith(
                 '_acme-challenge'
             ):
@@ -49,7 +49,7 @@ class AcmeManagingProcessor(BaseProcessor):
         return desired
 
     def process_target_zone(self, existing, target, lenient=False):
-        for record in existing.records:
+        for record in existing:
             # Uses a startswith rather than == to ignore subdomain challenges,
             # e.g. _acme-challenge.foo.domain.com when managing domain.com
             if (
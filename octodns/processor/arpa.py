@@ -39,10 +39,8 @@ class AutoArpa(BaseProcessor):
         self._records = defaultdict(list)
 
     def process_source_zone(self, desired, sources, lenient=False):
-        for record in desired.records:
-            if record._type in ('A', 'AAAA') and (
-                record.name != '*' or self.wildcard_replacement is not None
-            ):
+        for record in desired.get_by_type('A') | desired.get_by_type('AAAA'):
+            if record.name != '*' or self.wildcard_replacement is not None:
                 ips = record.values
                 if record.geo:
                     for geo in record.geo.values():
@@ -92,7 +90,7 @@ class AutoArpa(BaseProcessor):
             lenient,
         )
 
-        before = len(zone.records)
+        before = len(zone)
 
         zone_name = zone.name
         n = len(zone_name) + 1
@@ -116,9 +114,7 @@ class AutoArpa(BaseProcessor):
                     replace=self.populate_should_replace,
                     lenient=lenient,
                 )
-        self.log.info(
-            'populate:   found %s records', len(zone.records) - before
-        )
+        self.log.info('populate:   found %s records', len(zone) - before)
 
     def list_zones(self):
         return set()
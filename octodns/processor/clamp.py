@@ -56,7 +56,7 @@ class TtlClampProcessor(BaseProcessor):
         """
         self.log.debug('process_source_zone: desired=%s', desired.name)
 
-        for record in desired.records:
+        for record in desired:
             original_ttl = record.ttl
             clamped_ttl = max(self.min_ttl, min(self.max_ttl, original_ttl))
 
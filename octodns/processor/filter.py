@@ -48,7 +48,7 @@ class _TypeBaseFilter(_FilterProcessor):
         self._list = set(_list)
 
     def _process(self, zone, sources_or_target, lenient=False):
-        for record in zone.records:
+        for record in zone:
             if record._type in self._list:
                 self.matches(zone, record)
             else:
@@ -130,7 +130,7 @@ class _NameBaseFilter(_FilterProcessor):
         self.regex = regex
 
     def _process(self, zone, sources_or_target, lenient=False):
-        for record in zone.records:
+        for record in zone:
             name = record.name
             if name in self.exact:
                 self.matches(zone, record)
@@ -247,7 +247,7 @@ class _ValueBaseFilter(_FilterProcessor):
         self.regex = regex
 
     def _process(self, zone, sources_or_target, lenient=False):
-        for record in zone.records:
+        for record in zone:
             values = []
             if hasattr(record, 'values'):
                 values = [_match_text(value) for value in record.values]
@@ -355,7 +355,7 @@ class _NetworkValueBaseFilter(BaseProcessor):
                 raise ValueError(f'{value} is not a valid CIDR to use')
 
     def _process(self, zone, *args, **kwargs):
-        for record in zone.records:
+        for record in zone:
             if record._type not in ['A', 'AAAA']:
                 continue
 
@@ -449,7 +449,7 @@ class IgnoreRootNsFilter(BaseProcessor):
     '''
 
     def _process(self, zone, *args, **kwargs):
-        for record in zone.records:
+        for record in zone:
             if record._type == 'NS' and not record.name:
                 zone.remove_record(record)
 
@@ -541,7 +541,7 @@ class ZoneNameFilter(_FilterProcessor):
     def _process(self, zone, sources_or_target, lenient=False):
         zone_name_with_dot = zone.name
         zone_name_without_dot = zone_name_with_dot[:-1]
-        for record in zone.records:
+        for record in zone:
             name = record.name
             if name.endswith(zone_name_with_dot) or name.endswith(
                 zone_name_without_dot
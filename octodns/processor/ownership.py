@@ -38,7 +38,7 @@ class OwnershipProcessor(BaseProcessor):
         self.allow_takeover = allow_takeover
 
     def process_source_zone(self, desired, sources, lenient=False):
-        for record in desired.records:
+        for record in desired:
             if self._is_ownership(record):
                 # don't apply ownership to existing ownership recorcs, most
                 # likely to see this in an alias zone that will be proccessed
@@ -95,13 +95,13 @@ class OwnershipProcessor(BaseProcessor):
         # populated below (it depends on desired too).
         owned = defaultdict(dict)
         foreign = []
-        for record in plan.existing.records:
+        for record in plan.existing:
             if self._is_ownership(record):
                 name, _type = self._decode_ownership_name(record)
                 owned[name][_type] = True
             elif not self.allow_takeover and self._is_ownership_name(record):
                 foreign.append(record)
-        for record in plan.desired.records:
+        for record in plan.desired:
             if self._is_ownership(record):
                 name, _type = self._decode_ownership_name(record)
                 owned[name][_type] = True
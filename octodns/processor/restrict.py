@@ -60,7 +60,7 @@ class TtlRestrictionFilter(BaseProcessor):
         self.allowed_ttls = set(allowed_ttls) if allowed_ttls else None
 
     def process_source_zone(self, zone, sources, lenient=False):
-        for record in zone.records:
+        for record in zone:
             if record.lenient:
                 continue
             if self.allowed_ttls and record.ttl not in self.allowed_ttls:
@@ -130,10 +130,7 @@ class SpfDnsLookupProcessor(BaseProcessor):
         return lookups
 
     def process_source_zone(self, zone, sources, lenient=False):
-        for record in zone.records:
-            if record._type != 'TXT':
-                continue
-
+        for record in zone.get_by_type('TXT'):
             if record.lenient:
                 continue
 
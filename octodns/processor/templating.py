@@ -86,7 +86,7 @@ class Templating(BaseProcessor):
             'zone_name': zone_name,
             'zone_decoded_name': zone_decoded_name,
             'zone_encoded_name': zone_encoded_name,
-            'zone_num_records': len(desired.records),
+            'zone_num_records': len(desired),
             # add any extra context provided to us, if the value is a callable
             # object call it passing our params so that arbitrary dynamic
             # context can be added for use in formatting
@@ -126,7 +126,7 @@ class Templating(BaseProcessor):
                     f'undefined template parameter "{e.args[0]}" in value',
                 ) from e
 
-        for record in desired.records:
+        for record in desired:
             params = build_params(record)
             if hasattr(record, 'values'):
                 if record.values and not hasattr(record.values[0], 'template'):
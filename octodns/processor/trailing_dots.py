@@ -23,7 +23,7 @@ def _ensure_trailing_dots(record, prop):
 class EnsureTrailingDots(BaseProcessor):
     def process_source_zone(self, desired, sources, lenient=False):
         lenient = self.lenient or lenient
-        for record in desired.records:
+        for record in desired:
             _type = record._type
             if _type in ('ALIAS', 'CNAME', 'DNAME') and record.value[-1] != '.':
                 new = record.copy()
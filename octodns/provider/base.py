@@ -148,7 +148,7 @@ class BaseProvider(BaseSource):
              on the provider configuration.
         '''
 
-        for record in desired.records:
+        for record in desired:
             if not self.supports(record):
                 msg = f'{record._type} records not supported for {record.fqdn}'
                 fallback = 'omitting record'
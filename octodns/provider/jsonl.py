@@ -0,0 +1,288 @@
+#
+#
+#
+'''
+Example Configuration
+---------------------
+
+Core provider for records stored in JSON Lines files on disk, one record per
+line. It's intended for machine generated and managed zones where the files
+don't need to be edited by hand and is considerably quicker to load and write
+than YAML::
+
+  jsonl:
+    class: octodns.provider.jsonl.JsonLinesProvider
+
+    # The location of the files. Records are stored in a file named for the
+    # zone in this directory, e.g. something.com.jsonl.
+    # (required)
+    directory: ./zones
+
+    # The ttl to use for records when not specified in the data
+    # (optional, default 3600)
+    default_ttl: 3600
+
+    # Whether duplicate records should replace rather than error
+    # (optional, default False)
+    populate_should_replace: false
+
+    # Whether to ignore missing zone files when used as a source
+    # (optional, default False)
+    ignore_missing_zones: false
+
+File Format
+-----------
+
+Each line is a JSON object with the record's name and the same data
+YamlProvider uses, e.g.::
+
+  {"name":"","ttl":3600,"type":"NS","values":["ns1.example.com.","ns2.example.com."]}
+  {"name":"www","ttl":300,"type":"A","values":["1.2.3.4","1.2.3.5"]}
+
+Lines are processed in order and a later line for the same name and type
+replaces an earlier one, while a line with ``"deleted":true`` removes it. When
+applying changes to a zone that this provider just populated, the normal
+plan then apply flow, they're appended to the file in that form rather than
+rewriting it. Once the file has more than twice as many lines as the zone has
+records it's rewritten, with one line per record, the next time there are
+changes. Rewrites are done to a temporary file that is then moved into place.
+
+A final line without a newline, e.g. from being interrupted while appending,
+is ignored with a warning and the file is rewritten the next time there are
+changes.
+'''
+
+import logging
+from json import dumps, loads
+from os import listdir, makedirs, remove, replace
+from os.path import isdir, isfile, join, split
+from uuid import uuid4
+
+from ..context import ContextDict
+from ..record import Delete, Record
+from . import ProviderException
+from .base import BaseProvider
+
+
+def _dumps(data):
+    return f'{dumps(data, sort_keys=True, separators=(",", ":"))}\n'
+
+
+class JsonLinesProvider(BaseProvider):
+    SUPPORTS_GEO = True
+    SUPPORTS_DYNAMIC = True
+    SUPPORTS_POOL_VALUE_STATUS = True
+    SUPPORTS_DYNAMIC_SUBNETS = True
+    SUPPORTS_MULTIVALUE_PTR = True
+
+    def __init__(
+        self,
+        id,
+        directory,
+        default_ttl=3600,
+        populate_should_replace=False,
+        supports_root_ns=True,
+        ignore_missing_zones=False,
+        *args,
+        **kwargs,
+    ):
+        klass = self.__class__.__name__
+        self.log = logging.getLogger(f'{klass}[{id}]')
+        self.log.debug(
+            '__init__: id=%s, directory=%s, default_ttl=%d, populate_should_replace=%s, supports_root_ns=%s, ignore_missing_zones=%s',
+            id,
+            directory,
+            default_ttl,
+            populate_should_replace,
+            supports_root_ns,
+            ignore_missing_zones,
+        )
+        super().__init__(id, *args, **kwargs)
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.populate_should_replace = populate_should_replace
+        self.supports_root_ns = supports_root_ns
+        self.ignore_missing_zones = ignore_missing_zones
+        # zone name to the number of lines in its file when it was last
+        # populated, or None if it can't be appended to, see _apply
+        self._lines = {}
+
+    def copy(self):
+        kwargs = dict(self.__dict__)
+        kwargs['id'] = f'{kwargs["id"]}-copy'
+        del kwargs['log']
+        del kwargs['_lines']
+        return self.__class__(**kwargs)
+
+    @property
+    def SUPPORTS(self):
+        # Like YamlProvider we can store any type that's registered
+        return set(Record.registered_types().keys())
+
+    def supports(self, record):
+        return True
+
+    @property
+    def SUPPORTS_ROOT_NS(self):
+        return self.supports_root_ns
+
+    def list_zones(self):
+        self.log.debug('list_zones:')
+        zones = set()
+        for filename in listdir(self.directory):
+            not_ends_with = not filename.endswith('.jsonl')
+            too_few_dots = filename.count('.') < 2
+            not_file = not isfile(join(self.directory, filename))
+            if not_file or not_ends_with or too_few_dots:
+                continue
+            # trim off the jsonl, leave the .
+            zones.add(filename[:-5])
+        return sorted(zones)
+
+    def _filename(self, zone):
+        utf8 = join(self.directory, f'{zone.decoded_name}jsonl')
+        idna = join(self.directory, f'{zone.name}jsonl')
+        if utf8 != idna and isfile(idna):
+            if isfile(utf8):
+                raise ProviderException(
+                    f'Both UTF-8 "{utf8}" and IDNA "{idna}" exist for {zone.decoded_name}'
+                )
+            return idna
+        return utf8
+
+    def populate(self, zone, target=False, lenient=False):
+        self.log.debug(
+            'populate: name=%s, target=%s, lenient=%s',
+            zone.decoded_name,
+            target,
+            lenient,
+        )
+
+        filename = self._filename(zone)
+        # until we know otherwise
+        self._lines[zone.name] = None
+        if not isfile(filename):
+            if not target and not self.ignore_missing_zones:
+                raise ProviderException(
+                    f'no JSON Lines file found for {zone.decoded_name}'
+                )
+            self.log.info('populate:   found 0 records, exists=False')
+            return False
+
+        before = len(zone)
+        # (name, type) to the record we created for it, later lines replace
+        # or delete earlier ones
+        records = {}
+        n = 0
+        # whether the file ends with a newline, if it doesn't an append would
+        # join the first new record onto the last line
+        complete = True
+        with open(filename, 'r') as fh:
+            for n, line in enumerate(fh, start=1):
+                complete = line.endswith('\n')
+                if line.isspace():
+                    continue
+                context = f'{filename}, line {n}'
+                try:
+                    data = loads(line)
+                except ValueError:
+                    if line.endswith('\n'):
+                        raise ProviderException(f'Invalid JSON, {context}')
+                    self.log.warning(
+                        'populate: ignoring incomplete last line, %s', context
+                    )
+                    # it'll need to be rewritten before it can be appended to
+                    return self._populated(zone, before)
+                if not isinstance(data, dict) or 'name' not in data:
+                    raise ProviderException(f'Missing name, {context}')
+                data = ContextDict(data, context=context)
+                name = data.pop('name')
+                key = (name, data.get('type'))
+                if data.get('deleted'):
+                    record = records.pop(key, None)
+                    if record:
+                        zone.remove_record(record)
+                    continue
+                if 'ttl' not in data:
+                    data['ttl'] = self.default_ttl
+                record = Record.new(
+                    zone, name, data, source=self, lenient=lenient
+                )
+                zone.add_record(
+                    record,
+                    lenient=lenient,
+                    replace=key in records or self.populate_should_replace,
+                )
+                records[key] = record
+
+        if complete:
+            self._lines[zone.name] = n
+        return self._populated(zone, before)
+
+    def _populated(self, zone, before):
+        self.log.info(
+            'populate:   found %s records, exists=True', len(zone) - before
+        )
+        return True
+
+    def _line(self, record):
+        data = record.data
+        data['name'] = record.decoded_name
+        data['type'] = record._type
+        return _dumps(data)
+
+    def _write(self, filename, lines):
+        # write to a temp file alongside and then move it into place so that
+        # readers never see a partially written file
+        directory, name = split(filename)
+        tmp = join(directory, f'.{name}.{uuid4().hex}.tmp')
+        try:
+            with open(tmp, 'x') as fh:
+                fh.writelines(lines)
+            replace(tmp, filename)
+        except BaseException:
+            try:
+                remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _apply(self, plan):
+        desired = plan.existing.copy()
+        changes = plan.changes
+        self.log.debug(
+            '_apply: zone=%s, len(changes)=%d',
+            desired.decoded_name,
+            len(changes),
+        )
+        desired.apply(changes)
+
+        if not isdir(self.directory):
+            self.log.debug('_apply: creating directory=%s', self.directory)
+            makedirs(self.directory)
+
+        filename = self._filename(desired)
+        # only safe to append if we know what the file holds, i.e. it's the
+        # existing we populated
+        lines = self._lines.pop(desired.name, None)
+        if lines is not None and isfile(filename):
+            lines += len(changes)
+            if lines <= 2 * len(desired):
+                self.log.debug('_apply:   appending to filename=%s', filename)
+                with open(filename, 'a') as fh:
+                    fh.write(''.join(self._change_line(c) for c in changes))
+                return
+
+        self.log.debug('_apply:   writing filename=%s', filename)
+        self._write(filename, (self._line(r) for r in sorted(desired.records)))
+
+    def _change_line(self, change):
+        if isinstance(change, Delete):
+            record = change.existing
+            data = {
+                'deleted': True,
+                'name': record.decoded_name,
+                'type': record._type,
+            }
+            return _dumps(data)
+        return self._line(change.new)
@@ -81,11 +81,8 @@ class Plan(object):
         return {'changes': [c.data for c in self.changes], 'meta': self.meta}
 
     def raise_if_unsafe(self):
-        if (
-            self.existing
-            and len(self.existing.records) >= self.MIN_EXISTING_RECORDS
-        ):
-            existing_record_count = len(self.existing.records)
+        if self.existing and len(self.existing) >= self.MIN_EXISTING_RECORDS:
+            existing_record_count = len(self.existing)
             if existing_record_count > 0:
                 update_pcent = (
                     self.change_counts['Update'] / existing_record_count
@@ -0,0 +1,240 @@
+#
+#
+#
+'''
+Example Configuration
+---------------------
+
+Core provider for records stored in a local SQLite database, one row per
+record. It's intended for large numbers of machine managed zones and records
+where populating a zone shouldn't require reading everything and applying
+changes should only touch the records that changed::
+
+  sqlite:
+    class: octodns.provider.sqlite.SqliteProvider
+
+    # The database file, it and its tables will be created if they don't
+    # exist
+    # (required)
+    path: ./zones.db
+
+    # Whether to ignore zones that aren't in the database when used as a
+    # source
+    # (optional, default False)
+    ignore_missing_zones: false
+
+Storage
+-------
+
+Records are stored in a ``records`` table keyed, and indexed, by
+``(zone, name, type)`` with the same data YamlProvider uses as JSON in the
+``data`` column. Zone and record names are stored IDNA encoded. Zones that
+have been written to are also recorded in a ``zones`` table so that they're
+listed, and exist, even when empty.
+
+The database is put into WAL mode so that readers aren't blocked by a write
+in progress. Each apply is a single transaction that only inserts, replaces,
+and deletes the rows of the records in its changes.
+'''
+
+import logging
+import sqlite3
+from json import dumps, loads
+from os import makedirs
+from os.path import dirname, isdir
+from threading import Lock
+
+from ..context import ContextDict
+from ..record import Delete, Record
+from . import ProviderException
+from .base import BaseProvider
+
+_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS zones (
+    name TEXT NOT NULL PRIMARY KEY
+) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS records (
+    zone TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (zone, name, type)
+) WITHOUT ROWID''',
+)
+
+
+class SqliteProvider(BaseProvider):
+    SUPPORTS_GEO = True
+    SUPPORTS_DYNAMIC = True
+    SUPPORTS_POOL_VALUE_STATUS = True
+    SUPPORTS_DYNAMIC_SUBNETS = True
+    SUPPORTS_MULTIVALUE_PTR = True
+
+    def __init__(
+        self,
+        id,
+        path,
+        populate_should_replace=False,
+        supports_root_ns=True,
+        ignore_missing_zones=False,
+        *args,
+        **kwargs,
+    ):
+        klass = self.__class__.__name__
+        self.log = logging.getLogger(f'{klass}[{id}]')
+        self.log.debug(
+            '__init__: id=%s, path=%s, populate_should_replace=%s, supports_root_ns=%s, ignore_missing_zones=%s',
+            id,
+            path,
+            populate_should_replace,
+            supports_root_ns,
+            ignore_missing_zones,
+        )
+        super().__init__(id, *args, **kwargs)
+        self.path = path
+        self.populate_should_replace = populate_should_replace
+        self.supports_root_ns = supports_root_ns
+        self.ignore_missing_zones = ignore_missing_zones
+        # a single connection, created on first use, shared by any threads
+        # populating or applying with access serialized by the lock
+        self._conn = None
+        self._lock = Lock()
+
+    @property
+    def SUPPORTS(self):
+        # Like YamlProvider we can store any type that's registered
+        return set(Record.registered_types().keys())
+
+    def supports(self, record):
+        return True
+
+    @property
+    def SUPPORTS_ROOT_NS(self):
+        return self.supports_root_ns
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self.log.debug('conn: connecting, path=%s', self.path)
+            directory = dirname(self.path)
+            if directory and not isdir(directory):
+                self.log.debug('conn: creating directory=%s', directory)
+                makedirs(directory)
+            conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            # WAL lets readers carry on while a write is in progress and with
+            # it NORMAL is still durable across application crashes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        '''
+        Closes the database connection, if there is one. It'll be re-opened
+        if the provider is used again.
+        '''
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def list_zones(self):
+        self.log.debug('list_zones:')
+        with self._lock:
+            rows = self.conn.execute('SELECT name FROM zones ORDER BY name')
+            return [name for name, in rows]
+
+    def populate(self, zone, target=False, lenient=False):
+        self.log.debug(
+            'populate: name=%s, target=%s, lenient=%s',
+            zone.decoded_name,
+            target,
+            lenient,
+        )
+
+        with self._lock:
+            conn = self.conn
+            exists = (
+                conn.execute(
+                    'SELECT 1 FROM zones WHERE name = ?', (zone.name,)
+                ).fetchone()
+                is not None
+            )
+            rows = conn.execute(
+                'SELECT name, type, data FROM records WHERE zone = ?',
+                (zone.name,),
+            ).fetchall()
+
+        if not exists:
+            if not target and not self.ignore_missing_zones:
+                raise ProviderException(
+                    f'no zone {zone.decoded_name} found in {self.path}'
+                )
+            self.log.info('populate:   found 0 records, exists=False')
+            return False
+
+        before = len(zone)
+        for name, _type, data in rows:
+            data = ContextDict(
+                loads(data), context=f'{self.path}, {name} {_type}'
+            )
+            data['type'] = _type
+            record = Record.new(zone, name, data, source=self, lenient=lenient)
+            zone.add_record(
+                record, lenient=lenient, replace=self.populate_should_replace
+            )
+
+        self.log.info(
+            'populate:   found %s records, exists=True', len(zone) - before
+        )
+        return True
+
+    def _apply(self, plan):
+        desired = plan.desired
+        changes = plan.changes
+        self.log.debug(
+            '_apply: zone=%s, len(changes)=%d',
+            desired.decoded_name,
+            len(changes),
+        )
+
+        zone_name = desired.name
+        deletes = []
+        upserts = []
+        for change in changes:
+            if isinstance(change, Delete):
+                record = change.existing
+                deletes.append((zone_name, record.name, record._type))
+            else:
+                record = change.new
+                data = dumps(record.data, sort_keys=True, separators=(',', ':'))
+                upserts.append((zone_name, record.name, record._type, data))
+
+        with self._lock:
+            conn = self.conn
+            conn.execute('BEGIN')
+            try:
+                conn.execute(
+                    'INSERT OR IGNORE INTO zones (name) VALUES (?)',
+                    (zone_name,),
+                )
+                conn.executemany(
+                    'DELETE FROM records WHERE zone = ? AND name = ? AND type = ?',
+                    deletes,
+                )
+                conn.executemany(
+                    'INSERT OR REPLACE INTO records (zone, name, type, data) VALUES (?, ?, ?, ?)',
+                    upserts,
+                )
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+        self.log.debug(
+            '_apply:   deleted=%d, upserted=%d', len(deletes), len(upserts)
+        )
@@ -52,7 +52,8 @@ Core provider for records configured in yaml files on disk::
     split_catchall: true
 
     # Optional filename with record data to be included in all zones
-    # populated by this provider. Has no effect when used as a target.
+    # populated by this provider. Has no effect when used as a target. It's
+    # only parsed again when it changes, not for every zone.
     # (optional, default null)
     shared_filename: null
 
@@ -68,6 +69,32 @@ Core provider for records configured in yaml files on disk::
     # (optional, default False)
     ignore_missing_zones: False
 
+    # Directory in which to cache the parsed contents of the YAML files.
+    # Files that haven't changed, along with anything they !include, since
+    # they were cached are loaded from the cache rather than parsed again.
+    # Entries are pickles so the directory must only be writable by trusted
+    # users.
+    # (optional, default null, disabled)
+    cache_dir: null
+    # The maximum total size, in bytes, of the cache_dir entries. The least
+    # recently used entries are removed once it's exceeded.
+    # (optional, default 268435456, 256MiB)
+    cache_max_size: 268435456
+
+    # The number of workers to use to parse the YAML files of a zone
+    # concurrently, mostly useful with split_extension where each record is
+    # in its own file. The records are still added to the zone one file at a
+    # time in sorted order so the results, duplicate detection, and
+    # populate_should_replace behave the same as when loading sequentially.
+    # (optional, default 1, sequential)
+    load_workers: 1
+    # How load_workers are run, `thread` or `process`. Parsing is CPU bound so
+    # `process` will generally be faster, but has more overhead. The workers
+    # are started, with spawn, the first time they're needed and then reused
+    # for every zone the provider populates.
+    # (optional, default thread)
+    load_executor: thread
+
 .. Note::
 
   When using this provider as a target any existing comments or formatting in
@@ -91,6 +118,11 @@ managed under directory "zones/" would look like::
       www.yaml
       ...
 
+When applying changes only the files of the records that changed are
+written, and the files of records that were deleted are removed, the rest of
+the zone's files are left untouched. Files are written to a temporary file
+and then moved into place so a partially written file is never seen.
+
 Overriding Values
 -----------------
 
@@ -172,16 +204,32 @@ and internally (with the custom overrides) with
 
 import logging
 from collections import defaultdict
-from os import listdir, makedirs
-from os.path import isdir, isfile, join
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from itertools import repeat
+from multiprocessing import get_context
+from os import listdir, makedirs, remove, replace, stat
+from os.path import isdir, isfile, join, split
+from threading import Lock
+from uuid import uuid4
 
 from ..deprecation import deprecated
 from ..record import Record
-from ..yaml import safe_dump, safe_load
+from ..yaml import YamlCache, safe_dump, safe_dump_stream, safe_load, sort_keys
 from . import ProviderException
 from .base import BaseProvider
 
 
+def _load_yaml(filename, enforce_order, order_mode, cache=None):
+    # module level so that it can be used with process pools
+    if cache:
+        return cache.load(
+            filename, enforce_order=enforce_order, order_mode=order_mode
+        )
+    with open(filename, 'r') as fh:
+        return safe_load(fh, enforce_order=enforce_order, order_mode=order_mode)
+
+
 class YamlProvider(BaseProvider):
     SUPPORTS_GEO = True
     SUPPORTS_DYNAMIC = True
@@ -208,6 +256,10 @@ class YamlProvider(BaseProvider):
         disable_zonefile=False,
         escaped_semicolons=None,
         ignore_missing_zones=False,
+        cache_dir=None,
+        cache_max_size=256 * 1024 * 1024,
+        load_workers=1,
+        load_executor='thread',
         *args,
         **kwargs,
     ):
@@ -221,7 +273,7 @@ class YamlProvider(BaseProvider):
         klass = self.__class__.__name__
         self.log = logging.getLogger(f'{klass}[{id}]')
         self.log.debug(
-            '__init__: id=%s, directory=%s, default_ttl=%d, enforce_order=%d, order_mode=%s, populate_should_replace=%s, supports_root_ns=%s, split_extension=%s, split_catchall=%s, shared_filename=%s, disable_zonefile=%s, escaped_semicolons=%s, ignore_missing_zones=%s',
+            '__init__: id=%s, directory=%s, default_ttl=%d, enforce_order=%d, order_mode=%s, populate_should_replace=%s, supports_root_ns=%s, split_extension=%s, split_catchall=%s, shared_filename=%s, disable_zonefile=%s, escaped_semicolons=%s, ignore_missing_zones=%s, cache_dir=%s, cache_max_size=%d, load_workers=%d, load_executor=%s',
             id,
             directory,
             default_ttl,
@@ -235,7 +287,15 @@ class YamlProvider(BaseProvider):
             disable_zonefile,
             escaped_semicolons,
             ignore_missing_zones,
+            cache_dir,
+            cache_max_size,
+            load_workers,
+            load_executor,
         )
+        if load_executor not in ('thread', 'process'):
+            raise ProviderException(
+                f'Invalid load_executor, "{load_executor}", options are "thread", "process"'
+            )
         super().__init__(id, *args, **kwargs)
         self.directory = directory
         self.default_ttl = default_ttl
@@ -249,11 +309,28 @@ class YamlProvider(BaseProvider):
         self.disable_zonefile = disable_zonefile
         self.escaped_semicolons = escaped_semicolons
         self.ignore_missing_zones = ignore_missing_zones
+        self.cache_dir = cache_dir
+        self.cache_max_size = cache_max_size
+        self.load_workers = load_workers
+        self.load_executor = load_executor
+        self._cache = (
+            YamlCache(cache_dir, max_size=cache_max_size) if cache_dir else None
+        )
+        # ((filename, mtime_ns, size), records) of shared_filename once it has
+        # been loaded, see _shared_records
+        self._shared = None
+        # the load_workers pool, created on first use, see _load_executor_pool
+        self._load_pool = None
+        self._load_pool_lock = Lock()
 
     def copy(self):
         kwargs = dict(self.__dict__)
         kwargs['id'] = f'{kwargs["id"]}-copy'
         del kwargs['log']
+        del kwargs['_cache']
+        del kwargs['_shared']
+        del kwargs['_load_pool']
+        del kwargs['_load_pool_lock']
         return YamlProvider(**kwargs)
 
     @property
@@ -343,45 +420,119 @@ class YamlProvider(BaseProvider):
 
         return None
 
-    def _populate_from_file(self, filename, zone, lenient):
-        with open(filename, 'r') as fh:
-            yaml_data = safe_load(
-                fh, enforce_order=self.enforce_order, order_mode=self.order_mode
+    def _load_file(self, filename):
+        return _load_yaml(
+            filename, self.enforce_order, self.order_mode, self._cache
+        )
+
+    @property
+    def _load_executor_pool(self):
+        # populate is called from the Manager's zone threads so the pool is
+        # shared by all of them
+        with self._load_pool_lock:
+            if self._load_pool is None:
+                self.log.debug(
+                    '_load_executor_pool: creating, workers=%d, executor=%s',
+                    self.load_workers,
+                    self.load_executor,
+                )
+                if self.load_executor == 'process':
+                    # spawn rather than fork, populate runs in threads and a
+                    # forked child would inherit any locks they're holding,
+                    # see Manager._config_executor
+                    self._load_pool = ProcessPoolExecutor(
+                        max_workers=self.load_workers,
+                        mp_context=get_context('spawn'),
+                    )
+                else:
+                    self._load_pool = ThreadPoolExecutor(
+                        max_workers=self.load_workers,
+                        thread_name_prefix=f'{self.id}-load',
+                    )
+            return self._load_pool
+
+    def close(self):
+        '''
+        Shuts down the load_workers pool, if there is one. It'll be re-created
+        if the provider is used again.
+        '''
+        with self._load_pool_lock:
+            if self._load_pool is not None:
+                self._load_pool.shutdown()
+                self._load_pool = None
+
+    def _load_files(self, filenames):
+        '''
+        Parses filenames with load_workers, yielding (filename, data) in the
+        same order as filenames as they become available.
+        '''
+        self.log.debug(
+            '_load_files: filenames=%d, workers=%d, executor=%s',
+            len(filenames),
+            self.load_workers,
+            self.load_executor,
+        )
+        executor = self._load_executor_pool
+        if self.load_executor == 'process':
+            workers = min(self.load_workers, len(filenames))
+            # send work in batches to cut down on the IPC
+            chunksize = max(1, len(filenames) // (workers * 4))
+            results = executor.map(
+                _load_yaml,
+                filenames,
+                repeat(self.enforce_order),
+                repeat(self.order_mode),
+                repeat(self._cache),
+                chunksize=chunksize,
             )
-            if yaml_data:
-                for name, data in yaml_data.items():
-                    if not isinstance(data, list):
-                        data = [data]
-                    for d in data:
-                        _type = d.get('type')
-                        if not self.escaped_semicolons and _type in (
-                            'SPF',
-                            'TXT',
-                        ):
-                            if 'value' in d and d['value'] is not None:
-                                d['value'] = d['value'].replace(';', '\\;')
-                            if 'values' in d:
-                                d['values'] = [
-                                    (
-                                        v.replace(';', '\\;')
-                                        if v is not None
-                                        else v
-                                    )
-                                    for v in d['values']
-                                ]
-                        if 'ttl' not in d:
-                            d['ttl'] = self.default_ttl
-                        record = Record.new(
-                            zone, name, d, source=self, lenient=lenient
-                        )
-                        zone.add_record(
-                            record,
-                            lenient=lenient,
-                            replace=self.populate_should_replace,
-                        )
-            self.log.debug(
-                '_populate_from_file: successfully loaded "%s"', filename
+        else:
+            results = executor.map(self._load_file, filenames)
+        yield from zip(filenames, results)
+
+    def _prepare(self, yaml_data):
+        # returns a list of (name, data) for the records in yaml_data, with
+        # our defaults and escaping applied
+        ret = []
+        if yaml_data:
+            for name, data in yaml_data.items():
+                if not isinstance(data, list):
+                    data = [data]
+                for d in data:
+                    _type = d.get('type')
+                    if not self.escaped_semicolons and _type in ('SPF', 'TXT'):
+                        if 'value' in d and d['value'] is not None:
+                            d['value'] = d['value'].replace(';', '\\;')
+                        if 'values' in d:
+                            d['values'] = [
+                                (v.replace(';', '\\;') if v is not None else v)
+                                for v in d['values']
+                            ]
+                    if 'ttl' not in d:
+                        d['ttl'] = self.default_ttl
+                    ret.append((name, d))
+        return ret
+
+    def _shared_records(self, filename):
+        # the shared file is only parsed again when it changes, each zone gets
+        # its own copy of the data to create its records from
+        st = stat(filename)
+        current = (filename, st.st_mtime_ns, st.st_size)
+        shared = self._shared
+        if shared is None or shared[0] != current:
+            self.log.debug('_shared_records: loading "%s"', filename)
+            shared = (current, self._prepare(self._load_file(filename)))
+            self._shared = shared
+        return deepcopy(shared[1])
+
+    def _populate_from_records(self, filename, records, zone, lenient):
+        for name, d in records:
+            record = Record.new(zone, name, d, source=self, lenient=lenient)
+            zone.add_record(
+                record, lenient=lenient, replace=self.populate_should_replace
             )
+        self.log.debug(
+            '_populate_from_records: successfully loaded "%s"', filename
+        )
 
     def populate(self, zone, target=False, lenient=False):
         self.log.debug(
@@ -391,7 +542,7 @@ class YamlProvider(BaseProvider):
             lenient,
         )
 
-        before = len(zone.records)
+        before = len(zone)
 
         sources = []
 
@@ -404,8 +555,10 @@ class YamlProvider(BaseProvider):
             if source:
                 sources.append(source)
 
+        shared = None
         if self.shared_filename:
-            sources.append(join(self.directory, self.shared_filename))
+            shared = join(self.directory, self.shared_filename)
+            sources.append(shared)
 
         if not sources and not target and not self.ignore_missing_zones:
             raise ProviderException(f'no YAMLs found for {zone.decoded_name}')
@@ -413,17 +566,73 @@ class YamlProvider(BaseProvider):
         # deterministically order our sources
         sources.sort()
 
+        filenames = [s for s in sources if s != shared]
+        if self.load_workers > 1 and len(filenames) > 1:
+            # parse concurrently, but add the records in order
+            loaded = self._load_files(filenames)
+        else:
+            loaded = ((f, self._load_file(f)) for f in filenames)
+
         for source in sources:
-            self._populate_from_file(source, zone, lenient)
+            if source == shared:
+                records = self._shared_records(source)
+            else:
+                _, yaml_data = next(loaded)
+                records = self._prepare(yaml_data)
+            self._populate_from_records(source, records, zone, lenient)
 
         exists = len(sources) > 0
         self.log.info(
             'populate:   found %s records, exists=%s',
-            len(zone.records) - before,
+            len(zone) - before,
             exists,
         )
         return exists
 
+    def _record_data(self, record):
+        d = record.data
+        d['type'] = record._type
+        if record.ttl == self.default_ttl:
+            # ttl is the default, we don't need to store it
+            del d['ttl']
+        if not self.escaped_semicolons and record._type in ('SPF', 'TXT'):
+            if 'value' in d:
+                d['value'] = d['value'].replace('\\;', ';')
+            if 'values' in d:
+                d['values'] = [v.replace('\\;', ';') for v in d['values']]
+        return d
+
+    def _node_data(self, records):
+        # order things alphabetically (records sort that way) and flatten
+        # single element lists
+        data = [self._record_data(r) for r in sorted(records)]
+        return data[0] if len(data) == 1 else data
+
+    def _write(self, filename, data, stream=False, **kwargs):
+        # write to a temp file alongside and then move it into place so that
+        # readers never see a partially written file. The name doesn't end
+        # with .yaml so that it's never picked up as a split source.
+        directory, name = split(filename)
+        tmp = join(directory, f'.{name}.{uuid4().hex}.tmp')
+        dump = safe_dump_stream if stream else safe_dump
+        try:
+            with open(tmp, 'x') as fh:
+                dump(data, fh, order_mode=self.order_mode, **kwargs)
+            replace(tmp, filename)
+        except BaseException:
+            try:
+                remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _remove(self, filename):
+        try:
+            remove(filename)
+        except FileNotFoundError:
+            return
+        self.log.debug('_apply:   removed filename=%s', filename)
+
     def _apply(self, plan):
         # make a copy of existing we can muck with
         copy = plan.existing.copy()
@@ -435,76 +644,72 @@ class YamlProvider(BaseProvider):
         # apply our pending changes to that copy
         copy.apply(changes)
 
-        # we now have the records we need to write out, order things
-        # alphabetically (records sort that way
-        records = sorted(copy.records)
-        data = defaultdict(list)
-        for record in records:
-            d = record.data
-            d['type'] = record._type
-            if record.ttl == self.default_ttl:
-                # ttl is the default, we don't need to store it
-                del d['ttl']
-            if not self.escaped_semicolons and record._type in ('SPF', 'TXT'):
-                if 'value' in d:
-                    d['value'] = d['value'].replace('\\;', ';')
-                if 'values' in d:
-                    d['values'] = [v.replace('\\;', ';') for v in d['values']]
-            # we want to output the utf-8 version of the name
-            data[record.decoded_name].append(d)
-
-        # Flatten single element lists
-        for k in data.keys():
-            if len(data[k]) == 1:
-                data[k] = data[k][0]
-
         if not isdir(self.directory):
             self.log.debug('_apply: creating directory=%s', self.directory)
             makedirs(self.directory)
 
         if self.split_extension:
-            # we're going to do split files
-            decoded_name = copy.decoded_name[:-1]
-            directory = join(
-                self.directory, f'{decoded_name}{self.split_extension}'
-            )
+            self._apply_split(copy, changes)
+            return
 
-            if not isdir(directory):
-                self.log.debug('_apply: creating split directory=%s', directory)
-                makedirs(directory)
-
-            catchall = {}
-            for record, config in data.items():
-                if self.split_catchall and record in self.CATCHALL_RECORD_NAMES:
-                    catchall[record] = config
-                    continue
-                filename = join(directory, f'{record}.yaml')
-                self.log.debug('_apply:   writing filename=%s', filename)
-
-                with open(filename, 'w') as fh:
-                    record_data = {record: config}
-                    safe_dump(record_data, fh, order_mode=self.order_mode)
-
-            if catchall:
-                # Scrub the trailing . to make filenames more sane.
-                filename = join(directory, f'${decoded_name}.yaml')
-                self.log.debug(
-                    '_apply:   writing catchall filename=%s', filename
-                )
-                with open(filename, 'w') as fh:
-                    safe_dump(catchall, fh, order_mode=self.order_mode)
+        # single large file, it all has to be written out
+        nodes = defaultdict(list)
+        for record in copy.records:
+            # we want to output the utf-8 version of the name
+            nodes[record.decoded_name].append(record)
+        filename = join(self.directory, f'{copy.decoded_name}yaml')
+        self.log.debug('_apply:   writing filename=%s', filename)
+        names = sort_keys(nodes.keys(), order_mode=self.order_mode)
+        if names is None:
+            # there are names that sort the same, their data decides the order
+            data = {k: self._node_data(v) for k, v in nodes.items()}
+            self._write(filename, data, allow_unicode=True)
+            return
+        # write it out a node at a time rather than building it all up first
+        items = ((n, self._node_data(nodes[n])) for n in names)
+        self._write(filename, items, stream=True, allow_unicode=True)
+
+    def _apply_split(self, zone, changes):
+        # we're going to do split files
+        decoded_name = zone.decoded_name[:-1]
+        directory = join(
+            self.directory, f'{decoded_name}{self.split_extension}'
+        )
 
-        else:
-            # single large file
-            filename = join(self.directory, f'{copy.decoded_name}yaml')
+        if not isdir(directory):
+            self.log.debug('_apply: creating split directory=%s', directory)
+            makedirs(directory)
+
+        # only the files of nodes that have changes need to be touched, the
+        # rest are already up to date
+        names = {c.record.name: c.record.decoded_name for c in changes}
+        catchall = False
+        for name, decoded in sorted(names.items(), key=lambda i: i[1]):
+            if self.split_catchall and decoded in self.CATCHALL_RECORD_NAMES:
+                catchall = True
+                continue
+            filename = join(directory, f'{decoded}.yaml')
+            records = zone.get(name)
+            if not records:
+                # everything in the node was deleted
+                self._remove(filename)
+                continue
             self.log.debug('_apply:   writing filename=%s', filename)
-            with open(filename, 'w') as fh:
-                safe_dump(
-                    dict(data),
-                    fh,
-                    allow_unicode=True,
-                    order_mode=self.order_mode,
-                )
+            self._write(filename, {decoded: self._node_data(records)})
+
+        if catchall:
+            # Scrub the trailing . to make filenames more sane.
+            filename = join(directory, f'${decoded_name}.yaml')
+            data = {}
+            for name in sorted(self.CATCHALL_RECORD_NAMES):
+                records = zone.get(name)
+                if records:
+                    data[name] = self._node_data(records)
+            if not data:
+                self._remove(filename)
+                return
+            self.log.debug('_apply:   writing catchall filename=%s', filename)
+            self._write(filename, data)
 
 
 class SplitYamlProvider(YamlProvider):
@@ -2,10 +2,8 @@
 #
 #
 
+from importlib import import_module
 
-from .a import ARecord, Ipv4Address, Ipv4Value
-from .aaaa import AaaaRecord, Ipv6Address, Ipv6Value
-from .alias import AliasRecord, AliasValue
 from .base import (
     Record,
     ValueMixin,
@@ -13,90 +11,117 @@ from .base import (
     value_from_rdata_text,
     value_to_rdata_text,
 )
-from .caa import CaaRecord, CaaValue
 from .change import Change, Create, Delete, Update
-from .cname import CnameRecord, CnameValue
-from .dname import DnameRecord, DnameValue
-from .ds import DsRecord, DsValue
 from .exception import RecordException, ValidationError
-from .geo import GeoCodes, GeoValue
-from .https import HttpsRecord, HttpsValue
-from .loc import LocRecord, LocValue
-from .mx import MxRecord, MxValue
-from .naptr import NaptrRecord, NaptrValue
-from .ns import NsRecord, NsValue
-from .openpgpkey import OpenpgpkeyRecord, OpenpgpkeyValue
-from .ptr import PtrRecord, PtrValue
 from .rr import RdataParseError, Rr, RrParseError, Rrset
-from .spf import SpfRecord
-from .srv import SrvRecord, SrvValue
-from .sshfp import SshfpRecord, SshfpValue
-from .svcb import SvcbRecord, SvcbValue
-from .tlsa import TlsaRecord, TlsaValue
-from .txt import TxtRecord, TxtValue
-from .uri import UriRecord, UriValue
-from .urlfwd import UrlfwdRecord, UrlfwdValue
 
 # quell warnings
-ARecord
-AaaaRecord
-AliasRecord
-AliasValue
-CaaRecord
-CaaValue
 Change
-CnameRecord
-CnameValue
 Create
 Delete
-DnameRecord
-DnameValue
-DsRecord
-DsValue
-GeoCodes
-GeoValue
-HttpsRecord
-HttpsValue
-Ipv4Address
-Ipv4Value
-Ipv6Address
-Ipv6Value
-LocRecord
-LocValue
-MxRecord
-MxValue
-NaptrRecord
-NaptrValue
-NsRecord
-NsValue
-OpenpgpkeyRecord
-OpenpgpkeyValue
-PtrRecord
-PtrValue
 RdataParseError
 Record
 RecordException
 Rr
 RrParseError
 Rrset
-SpfRecord
-SrvRecord
-SrvValue
-SshfpRecord
-SshfpValue
-SvcbRecord
-SvcbValue
-TlsaRecord
-TlsaValue
-TxtRecord
-TxtValue
 Update
-UriRecord
-UriValue
-UrlfwdRecord
-UrlfwdValue
 ValidationError
 value_from_rdata_text
 value_to_rdata_text
 ValueMixin
 ValuesMixin
+
+# The built-in types, and the modules that define them. Importing them, and
+# with them things like dnspython, is put off until they're needed, see
+# Record.declare_type
+_TYPES = {
+    'A': 'a',
+    'AAAA': 'aaaa',
+    'ALIAS': 'alias',
+    'CAA': 'caa',
+    'CNAME': 'cname',
+    'DNAME': 'dname',
+    'DS': 'ds',
+    'HTTPS': 'https',
+    'LOC': 'loc',
+    'MX': 'mx',
+    'NAPTR': 'naptr',
+    'NS': 'ns',
+    'OPENPGPKEY': 'openpgpkey',
+    'PTR': 'ptr',
+    'SPF': 'spf',
+    'SRV': 'srv',
+    'SSHFP': 'sshfp',
+    'SVCB': 'svcb',
+    'TLSA': 'tlsa',
+    'TXT': 'txt',
+    'URI': 'uri',
+    'URLFWD': 'urlfwd',
+}
+for _type, module in _TYPES.items():
+    Record.declare_type(_type, f'{__name__}.{module}')
+
+# Names that are available from here, but live in the lazily imported modules,
+# see __getattr__
+_LAZY = {
+    'ARecord': 'a',
+    'Ipv4Address': 'a',
+    'Ipv4Value': 'a',
+    'AaaaRecord': 'aaaa',
+    'Ipv6Address': 'aaaa',
+    'Ipv6Value': 'aaaa',
+    'AliasRecord': 'alias',
+    'AliasValue': 'alias',
+    'CaaRecord': 'caa',
+    'CaaValue': 'caa',
+    'CnameRecord': 'cname',
+    'CnameValue': 'cname',
+    'DnameRecord': 'dname',
+    'DnameValue': 'dname',
+    'DsRecord': 'ds',
+    'DsValue': 'ds',
+    'GeoCodes': 'geo',
+    'GeoValue': 'geo',
+    'HttpsRecord': 'https',
+    'HttpsValue': 'https',
+    'LocRecord': 'loc',
+    'LocValue': 'loc',
+    'MxRecord': 'mx',
+    'MxValue': 'mx',
+    'NaptrRecord': 'naptr',
+    'NaptrValue': 'naptr',
+    'NsRecord': 'ns',
+    'NsValue': 'ns',
+    'OpenpgpkeyRecord': 'openpgpkey',
+    'OpenpgpkeyValue': 'openpgpkey',
+    'PtrRecord': 'ptr',
+    'PtrValue': 'ptr',
+    'SpfRecord': 'spf',
+    'SrvRecord': 'srv',
+    'SrvValue': 'srv',
+    'SshfpRecord': 'sshfp',
+    'SshfpValue': 'sshfp',
+    'SvcbRecord': 'svcb',
+    'SvcbValue': 'svcb',
+    'TlsaRecord': 'tlsa',
+    'TlsaValue': 'tlsa',
+    'TxtRecord': 'txt',
+    'TxtValue': 'txt',
+    'UriRecord': 'uri',
+    'UriValue': 'uri',
+    'UrlfwdRecord': 'urlfwd',
+    'UrlfwdValue': 'urlfwd',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(f'{__name__}.{module}'), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
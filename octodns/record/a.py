@@ -11,6 +11,8 @@ from .ip import _IpValue
 
 
 class Ipv4Value(_IpValue):
+    __slots__ = ()
+
     _address_type = _IPv4Address
     _address_name = 'IPv4'
 
@@ -19,6 +21,8 @@ Ipv4Address = Ipv4Value
 
 
 class ARecord(_DynamicMixin, _GeoMixin, Record):
+    __slots__ = ('values', 'geo', 'dynamic')
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc1035',)
     _type = 'A'
     _value_type = Ipv4Value
@@ -11,6 +11,8 @@ from .ip import _IpValue
 
 
 class Ipv6Value(_IpValue):
+    __slots__ = ()
+
     _address_type = _IPv6Address
     _address_name = 'IPv6'
 
@@ -19,6 +21,8 @@ Ipv6Address = Ipv6Value
 
 
 class AaaaRecord(_DynamicMixin, _GeoMixin, Record):
+    __slots__ = ('values', 'geo', 'dynamic')
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc3596',)
     _type = 'AAAA'
     _value_type = Ipv6Address
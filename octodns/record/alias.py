@@ -8,6 +8,8 @@ from .validator import RecordValidator, ValidationReason
 
 
 class AliasValue(_TargetValue):
+    __slots__ = ()
+
     pass
 
 
@@ -28,6 +30,8 @@ class AliasRootValidator(RecordValidator):
 
 
 class AliasRecord(ValueMixin, Record):
+    __slots__ = ('value',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/draft-ietf-dnsop-aname/',)
     _type = 'ALIAS'
     _value_type = AliasValue
@@ -5,6 +5,7 @@
 from collections import defaultdict
 from copy import deepcopy
 from functools import cache
+from importlib import import_module
 from logging import getLogger
 
 from ..context import ContextDict
@@ -162,6 +163,8 @@ class TtlValidator(RecordValidator):
     integer.
     '''
 
+    name_dependent = False
+
     def validate(self, record_cls, name, fqdn, data, disabled=None):
         reasons = []
         try:
@@ -183,6 +186,8 @@ class HealthcheckValidator(RecordValidator):
     present, is one of the supported protocols.
     '''
 
+    name_dependent = False
+
     def validate(self, record_cls, name, fqdn, data, disabled=None):
         reasons = []
         try:
@@ -210,6 +215,8 @@ class ValueTypeValidator(RecordValidator):
     value type's validators.
     '''
 
+    name_dependent = False
+
     def __init__(self):
         super().__init__(id='_value-type')
 
@@ -231,6 +238,8 @@ class ValuesTypeValidator(RecordValidator):
     back-compat) and any active ``ValueValidator`` instances for the type.
     '''
 
+    name_dependent = False
+
     def __init__(self):
         super().__init__(id='_values-type')
 
@@ -247,6 +256,21 @@ class ValuesTypeValidator(RecordValidator):
 
 
 class Record(EqualityTupleMixin):
+    # there are a lot of records, so they're slotted to keep them compact.
+    # Type specific attributes, e.g. values, are slotted by the concrete
+    # classes since the mixins can't have conflicting layouts. Subclasses that
+    # don't declare __slots__ will get a __dict__ and keep working as before.
+    __slots__ = (
+        'zone',
+        'name',
+        'decoded_name',
+        'source',
+        'context',
+        'ttl',
+        'octodns',
+        '_hash',
+    )
+
     log = getLogger('Record')
 
     def __init_subclass__(cls, **kwargs):
@@ -266,12 +290,38 @@ class Record(EqualityTupleMixin):
     )
 
     _CLASSES = {}
-    validators = ValidatorRegistry()
+    # type to the module that defines and registers it, for types that are
+    # only imported the first time types are needed, see declare_type
+    _DECLARED = {}
+    validators = ValidatorRegistry(load=lambda: Record._load_types())
+
+    @classmethod
+    def declare_type(cls, _type, module):
+        '''
+        Declares that importing module will register _type without importing
+        it. Declared types are imported the first time any type is needed,
+        e.g. by Record.new or registered_types, or validators are configured.
+        '''
+        cls._DECLARED[_type] = module
+
+    @classmethod
+    def _load_types(cls):
+        if cls._DECLARED:
+            for module in list(cls._DECLARED.values()):
+                import_module(module)
+            # only cleared once everything is registered so that anyone who
+            # sees it empty can rely on _CLASSES
+            cls._DECLARED.clear()
 
     @classmethod
     def register_type(cls, _class, _type=None):
         if _type is None:
             _type = _class._type
+        declared = cls._DECLARED.get(_type)
+        if declared is not None and declared != _class.__module__:
+            # something other than the declared module is registering the
+            # type, load the declared one first so that it conflicts
+            cls._load_types()
         existing = cls._CLASSES.get(_type)
         if existing:
             module = existing.__module__
@@ -292,6 +342,7 @@ class Record(EqualityTupleMixin):
 
     @classmethod
     def registered_types(cls):
+        cls._load_types()
         return cls._CLASSES
 
     @classmethod
@@ -310,6 +361,10 @@ class Record(EqualityTupleMixin):
     def disable_validator(cls, validator_id, types=None):
         return cls.validators.disable(validator_id, types=types)
 
+    @classmethod
+    def enable_validation_cache(cls, size):
+        cls.validators.enable_cache(size)
+
     @classmethod
     def registered_validators(cls):
         return cls.validators.registered()
@@ -340,6 +395,7 @@ class Record(EqualityTupleMixin):
             if context:
                 msg += f', {context}'
             raise Exception(msg)
+        cls._load_types()
         try:
             _class = cls._CLASSES[_type]
         except KeyError:
@@ -415,6 +471,7 @@ class Record(EqualityTupleMixin):
         for rr in rrs:
             grouped[(rr.name, rr._type)].append(rr)
 
+        cls._load_types()
         records = []
         for _, grouped_rrs in sorted(grouped.items()):
             first = grouped_rrs[0]
@@ -430,6 +487,7 @@ class Record(EqualityTupleMixin):
     def _record_from_rrset(cls, zone, rrset, lenient=False, source=None):
         # NOTE: Rrset rejects an empty rdatas at construction, so there's no
         # need to re-check it here.
+        cls._load_types()
         try:
             record_class = cls._CLASSES[rrset._type]
         except KeyError:
@@ -517,6 +575,8 @@ class Record(EqualityTupleMixin):
         return [value_from_rdata_text(cls._value_type, r) for r in rdatas]
 
     def __init__(self, zone, name, data, source=None, context=None):
+        # see __hash__
+        self._hash = None
         self.zone = zone
         if name:
             # internally everything is idna
@@ -709,6 +769,13 @@ class Record(EqualityTupleMixin):
     def _equality_tuple(self):
         return (self.name, self._type)
 
+    def __hash__(self):
+        # name and _type don't change once a record is created and records are
+        # hashed a lot when zones are compared, so we only do it once
+        if self._hash is None:
+            self._hash = hash(self._equality_tuple())
+        return self._hash
+
     def __repr__(self):
         # Make sure this is always overridden
         raise NotImplementedError('Abstract base class, __repr__ required')
@@ -721,6 +788,8 @@ def _process_value_validators(value_type, values, _type, disabled=None):
 
 
 class ValuesMixin(object):
+    __slots__ = ()
+
     VALIDATORS = [ValuesTypeValidator()]
 
     @classmethod
@@ -785,6 +854,8 @@ class ValuesMixin(object):
 
 
 class ValueMixin(object):
+    __slots__ = ()
+
     VALIDATORS = [ValueTypeValidator()]
 
     @classmethod
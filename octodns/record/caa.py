@@ -138,6 +138,8 @@ class CaaValueBestPracticeValidator(ValueValidator):
 
 
 class CaaValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     # https://tools.ietf.org/html/rfc8659
 
     VALIDATORS = [
@@ -257,6 +259,8 @@ class CaaValue(EqualityTupleMixin, dict):
 
 
 class CaaRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc8657',
         'https://datatracker.ietf.org/doc/html/rfc8659',
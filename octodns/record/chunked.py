@@ -125,6 +125,8 @@ class _ChunkedValuesMixin(ValuesMixin):
        in 2.0.
     '''
 
+    __slots__ = ()
+
     CHUNK_SIZE = 255
 
     def chunked_value(self, value):
@@ -163,6 +165,8 @@ class _ChunkedValuesMixin(ValuesMixin):
 
 
 class _ChunkedValue(str):
+    __slots__ = ()
+
     VALIDATORS = [chunked_value_validator]
 
     @classmethod
@@ -9,6 +9,8 @@ from .validator import RecordValidator, ValidationReason
 
 
 class CnameValue(_TargetValue):
+    __slots__ = ()
+
     pass
 
 
@@ -27,6 +29,8 @@ class CnameRootValidator(RecordValidator):
 
 
 class CnameRecord(_DynamicMixin, ValueMixin, Record):
+    __slots__ = ('value', 'dynamic')
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc1035',)
     _type = 'CNAME'
     _value_type = CnameValue
@@ -8,10 +8,14 @@ from .target import _TargetValue
 
 
 class DnameValue(_TargetValue):
+    __slots__ = ()
+
     pass
 
 
 class DnameRecord(_DynamicMixin, ValueMixin, Record):
+    __slots__ = ('value', 'dynamic')
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc6672',)
     _type = 'DNAME'
     _value_type = DnameValue
@@ -286,6 +286,8 @@ class DsValueBestPracticeValidator(ValueValidator):
 
 
 class DsValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     # https://www.rfc-editor.org/rfc/rfc4034.html#section-5.1
     log = getLogger('DsValue')
 
@@ -449,6 +451,8 @@ class DsValue(EqualityTupleMixin, dict):
 
 
 class DsRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc4034',
         'https://datatracker.ietf.org/doc/html/rfc4035',
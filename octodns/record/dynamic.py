@@ -21,6 +21,8 @@ class DynamicValidator(RecordValidator):
     are defined but unused.
     '''
 
+    name_dependent = False
+
     def validate(self, record_cls, name, fqdn, data, disabled=None):
         reasons = []
 
@@ -68,6 +70,8 @@ class DynamicValidator(RecordValidator):
 
 
 class _DynamicPool(object):
+    __slots__ = ('_id', 'data')
+
     log = getLogger('_DynamicPool')
 
     def __init__(self, _id, data, value_type):
@@ -116,6 +120,8 @@ class _DynamicPool(object):
 
 
 class _DynamicRule(object):
+    __slots__ = ('i', 'data')
+
     def __init__(self, i, data):
         self.i = i
 
@@ -149,6 +155,8 @@ class _DynamicRule(object):
 
 
 class _Dynamic(object):
+    __slots__ = ('pools', 'rules')
+
     def __init__(self, pools, rules):
         self.pools = pools
         self.rules = rules
@@ -176,6 +184,8 @@ class _Dynamic(object):
 
 
 class _DynamicMixin(object):
+    __slots__ = ()
+
     VALIDATORS = [DynamicValidator('dynamic', sets={'legacy', 'strict'})]
 
     geo_re = re.compile(
@@ -9,10 +9,17 @@ from ..deprecation import deprecated
 from ..equality import EqualityTupleMixin
 from .base import ValuesMixin, _process_value_validators
 from .change import Update
-from .geo_data import geo_data
 from .validator import RecordValidator, ValidationReason
 
 
+def _geo_data():
+    # the generated data is large, it's only imported once geo codes are
+    # actually validated or looked up
+    from .geo_data import geo_data
+
+    return geo_data
+
+
 class GeoCodes(object):
     log = getLogger('GeoCodes')
 
@@ -27,6 +34,7 @@ class GeoCodes(object):
           * continent, country, & province
         '''
         reasons = []
+        geo_data = _geo_data()
 
         pieces = code.split('-')
         n = len(pieces)
@@ -83,6 +91,7 @@ class GeoCodes(object):
 
     @classmethod
     def country_to_code(cls, country):
+        geo_data = _geo_data()
         for continent, countries in geo_data.items():
             if country in countries:
                 return f'{continent}-{country}'
@@ -93,6 +102,7 @@ class GeoCodes(object):
     def province_to_code(cls, province):
         # We cheat on this one a little since we only support provinces in
         # NA-US, NA-CA
+        geo_data = _geo_data()
         if (
             province not in geo_data['NA']['US']['provinces']
             and province not in geo_data['NA']['CA']['provinces']
@@ -109,6 +119,14 @@ class GeoCodes(object):
 
 
 class GeoValue(EqualityTupleMixin):
+    __slots__ = (
+        'code',
+        'continent_code',
+        'country_code',
+        'subdivision_code',
+        'values',
+    )
+
     geo_re = re.compile(
         r'^(?P<continent_code>\w\w)(-(?P<country_code>\w\w)(-(?P<subdivision_code>\w\w))?)?$'
     )
@@ -159,6 +177,8 @@ class GeoValidator(RecordValidator):
     passes the record's value-type validation.
     '''
 
+    name_dependent = False
+
     def validate(self, record_cls, name, fqdn, data, disabled=None):
         reasons = []
         try:
@@ -191,6 +211,8 @@ class _GeoMixin(ValuesMixin):
     Must be included before `Record`.
     '''
 
+    __slots__ = ()
+
     VALIDATORS = [GeoValidator('geo', sets={'legacy'})]
 
     @classmethod
@@ -12,6 +12,8 @@ from .svcb import (
 
 
 class HttpsValue(_SvcbValueBase):
+    __slots__ = ()
+
     VALIDATORS = [
         SvcbValueValidator('https-value-rfc', sets={'legacy', 'strict'}),
         SvcbValueBestPracticeValidator(
@@ -21,6 +23,8 @@ class HttpsValue(_SvcbValueBase):
 
 
 class HttpsRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc9460',
         'https://datatracker.ietf.org/doc/html/rfc9461',
@@ -44,6 +44,8 @@ class IpValueValidator(ValueValidator):
 
 
 class _IpValue(str):
+    __slots__ = ()
+
     VALIDATORS = [IpValueValidator('ip-value-rfc', sets={'legacy', 'strict'})]
 
     @classmethod
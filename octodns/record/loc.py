@@ -141,6 +141,8 @@ class LocValueValidator(ValueValidator):
 
 
 class LocValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     # TODO: this does not really match the RFC, but it's stuck using the details
     # of how the type was impelemented. Would be nice to rework things to match
     # while maintaining backwards compatibility.
@@ -469,6 +471,8 @@ class LocValue(EqualityTupleMixin, dict):
 
 
 class LocRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc1876',)
     _type = 'LOC'
     _value_type = LocValue
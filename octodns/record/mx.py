@@ -162,6 +162,8 @@ class MxValueNotIpValidator(ValueValidator):
 
 
 class MxValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALIDATORS = [
         MxValueValidator('mx-value', sets={'legacy'}),
         MxValueRfcValidator('mx-value-rfc', sets={'strict'}),
@@ -297,6 +299,8 @@ class MxValue(EqualityTupleMixin, dict):
 
 
 class MxRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc1035',
         'https://datatracker.ietf.org/doc/html/rfc5321',
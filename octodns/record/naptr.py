@@ -177,6 +177,8 @@ class NaptrValueBestPracticeValidator(ValueValidator):
 
 
 class NaptrValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALID_FLAGS = ('S', 'A', 'U', 'P', 's', 'a', 'u', 'p')
 
     VALIDATORS = [
@@ -367,6 +369,8 @@ class NaptrValue(EqualityTupleMixin, dict):
 
 
 class NaptrRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc3401',
         'https://datatracker.ietf.org/doc/html/rfc3402',
@@ -7,10 +7,14 @@ from .target import _TargetsValue
 
 
 class NsValue(_TargetsValue):
+    __slots__ = ()
+
     pass
 
 
 class NsRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc1035',)
     _type = 'NS'
     _value_type = NsValue
@@ -30,6 +30,8 @@ class OpenpgpkeyValue(str):
     RFC 7929 - DANE Bindings for OpenPGP
     '''
 
+    __slots__ = ()
+
     VALIDATORS = [
         OpenpgpkeyValueValidator(
             'openpgpkey-value-rfc', sets={'legacy', 'strict'}
@@ -81,6 +83,8 @@ class OpenpgpkeyValue(str):
 
 
 class OpenpgpkeyRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc7929',)
     _type = 'OPENPGPKEY'
     _value_type = OpenpgpkeyValue
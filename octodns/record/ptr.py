@@ -7,10 +7,14 @@ from .target import _TargetsValue
 
 
 class PtrValue(_TargetsValue):
+    __slots__ = ()
+
     pass
 
 
 class PtrRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc1035',)
     _type = 'PTR'
     _value_type = PtrValue
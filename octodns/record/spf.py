@@ -12,6 +12,8 @@ class SpfRecordTypeValidator(RecordValidator):
     Validates that the deprecated SPF record type is not used.
     '''
 
+    name_dependent = False
+
     def validate(self, record_cls, name, fqdn, data, disabled=None):
         return [
             ValidationReason(
@@ -22,6 +24,8 @@ class SpfRecordTypeValidator(RecordValidator):
 
 
 class SpfRecord(_ChunkedValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc7208',)
     _type = 'SPF'
     _value_type = _ChunkedValue
@@ -270,6 +270,8 @@ class SrvValueNotIpValidator(ValueValidator):
 
 
 class SrvValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALIDATORS = [
         SrvValueValidator('srv-value', sets={'legacy'}),
         SrvValueRfcValidator('srv-value-rfc', sets={'strict'}),
@@ -410,6 +412,8 @@ class SrvValue(EqualityTupleMixin, dict):
 
 
 class SrvRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc2782',
         'https://datatracker.ietf.org/doc/html/rfc6335',
@@ -213,6 +213,8 @@ class SshfpValueBestPracticeValidator(ValueValidator):
 
 
 class SshfpValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALID_ALGORITHMS = (1, 2, 3, 4)
     VALID_FINGERPRINT_TYPES = (1, 2)
 
@@ -340,6 +342,8 @@ class SshfpValue(EqualityTupleMixin, dict):
 
 
 class SshfpRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc4255',
         'https://datatracker.ietf.org/doc/html/rfc6594',
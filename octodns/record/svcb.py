@@ -304,6 +304,8 @@ class SvcbValueValidator(ValueValidator):
 
 
 class _SvcbValueBase(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     @classmethod
     def _schema(cls):
         return {
@@ -477,6 +479,8 @@ class SvcbValueBestPracticeValidator(ValueValidator):
 
 
 class SvcbValue(_SvcbValueBase):
+    __slots__ = ()
+
     VALIDATORS = [
         SvcbValueValidator('svcb-value-rfc', sets={'legacy', 'strict'}),
         SvcbValueBestPracticeValidator(
@@ -486,6 +490,8 @@ class SvcbValue(_SvcbValueBase):
 
 
 class SvcbRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc9460',
         'https://datatracker.ietf.org/doc/html/rfc9461',
@@ -155,6 +155,8 @@ class TargetsValueBestPracticeValidator(ValueValidator):
 
 
 class _TargetValue(str):
+    __slots__ = ()
+
     VALIDATORS = [
         TargetValueValidator('target-value-rfc', sets={'legacy', 'strict'}),
         TargetValueNotIpValidator('target-value-not-ip', sets={'strict'}),
@@ -214,6 +216,8 @@ class _TargetValue(str):
 #
 # much like _TargetValue, but geared towards multiple values
 class _TargetsValue(str):
+    __slots__ = ()
+
     VALIDATORS = [
         TargetsValueValidator('targets-value-rfc', sets={'legacy', 'strict'}),
         TargetsValueNotIpValidator('targets-value-not-ip', sets={'strict'}),
@@ -219,6 +219,8 @@ class TlsaValueBestPracticeValidator(ValueValidator):
 
 
 class TlsaValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALIDATORS = [
         TlsaValueValidator('tlsa-value', sets={'legacy'}),
         TlsaValueRfcValidator('tlsa-value-rfc', sets={'strict'}),
@@ -381,6 +383,8 @@ class TlsaValue(EqualityTupleMixin, dict):
 
 
 class TlsaRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc6698',
         'https://datatracker.ietf.org/doc/html/rfc7671',
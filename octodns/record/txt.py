@@ -7,10 +7,14 @@ from .chunked import _ChunkedValue, _ChunkedValuesMixin
 
 
 class TxtValue(_ChunkedValue):
+    __slots__ = ()
+
     pass
 
 
 class TxtRecord(_ChunkedValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = (
         'https://datatracker.ietf.org/doc/html/rfc1035',
         'https://datatracker.ietf.org/doc/html/rfc1464',
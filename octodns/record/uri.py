@@ -139,6 +139,8 @@ class UriValueRfcValidator(ValueValidator):
 
 
 class UriValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALIDATORS = [
         UriValueValidator('uri-value', sets={'legacy'}),
         UriValueRfcValidator('uri-value-rfc', sets={'strict'}),
@@ -318,6 +320,8 @@ class UriNameRfcValidator(RecordValidator):
 
 
 class UriRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ('https://datatracker.ietf.org/doc/html/rfc7553',)
     _type = 'URI'
     _value_type = UriValue
@@ -93,6 +93,8 @@ class UrlfwdValueValidator(ValueValidator):
 
 
 class UrlfwdValue(EqualityTupleMixin, dict):
+    __slots__ = ()
+
     VALID_CODES = (301, 302)
     VALID_MASKS = (0, 1, 2)
     VALID_QUERY = (0, 1)
@@ -239,6 +241,8 @@ class UrlfwdValue(EqualityTupleMixin, dict):
 
 
 class UrlfwdRecord(ValuesMixin, Record):
+    __slots__ = ('values',)
+
     REFERENCES = ()
     _type = 'URLFWD'
     _value_type = UrlfwdValue
@@ -2,8 +2,10 @@
 #
 #
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from inspect import Parameter, signature
 from logging import getLogger
+from threading import Lock
 
 from ..deprecation import deprecated
 from .exception import RecordException
@@ -12,12 +14,57 @@ from .exception import RecordException
 class ValidatorRegistry:
     log = getLogger('Record')
 
-    def __init__(self):
+    def __init__(self, load=None):
+        # called before validators are configured or inspected so that
+        # anything that registers validators lazily, e.g. Record's built-in
+        # types, has done so
+        self._load = load
         self.available_record = defaultdict(dict)
         self.available_value = defaultdict(dict)
         self.active_record = defaultdict(dict)
         self.active_value = defaultdict(dict)
         self.configured = False
+        # compiled chains of (validator_id, validate, warn[, name_dependent]),
+        # keyed by type and the disabled ids, see _record_chain & _value_chain
+        self._chains = {}
+        # opt-in LRU of record data that has passed all of the name
+        # independent validators, see enable_cache
+        self._cache = None
+        self._cache_size = 0
+        # records are validated from the Manager's zone threads, the LRU's
+        # check, move, insert, and evict have to happen together
+        self._cache_lock = Lock()
+
+    def invalidate(self):
+        '''
+        Drops the compiled validator chains and any cached results, they'll
+        be rebuilt on demand. Called whenever the registered or active
+        validators change, only needs to be called directly when modifying
+        active_* or available_* by hand.
+        '''
+        self._chains.clear()
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache.clear()
+
+    def _loaded(self):
+        if self._load is not None:
+            self._load()
+
+    def enable_cache(self, size):
+        '''
+        Enables caching of validation results for up to size distinct
+        record payloads, evicting the least recently used. A size of 0, or
+        None, disables the cache.
+
+        Record data, minus its name, that has already passed all of the
+        validators that aren't `name_dependent` will only have the name
+        dependent ones run against it. This pays off when the same data is
+        repeated a lot, e.g. the same MX or NS values in thousands of zones.
+        '''
+        with self._cache_lock:
+            self._cache_size = size or 0
+            self._cache = OrderedDict() if self._cache_size > 0 else None
 
     def register(self, validator, types=None, replace=False):
         if isinstance(validator, RecordValidator):
@@ -42,8 +89,10 @@ class ValidatorRegistry:
                     key,
                 )
             bucket[validator.id] = validator
+        self.invalidate()
 
     def enable_sets(self, sets):
+        self._loaded()
         self.configured = True
         self.reset_active()
         sets = set(sets)
@@ -55,8 +104,10 @@ class ValidatorRegistry:
                 for validator in validators.values():
                     if validator.sets is None or sets & validator.sets:
                         active[_type][validator.id] = validator
+        self.invalidate()
 
     def enable(self, id, types=None):
+        self._loaded()
         validator = None
         for available in (self.available_record, self.available_value):
             for bucket in available.values():
@@ -75,8 +126,10 @@ class ValidatorRegistry:
         keys = ('*',) if types is None else types
         for key in keys:
             active[key][id] = validator
+        self.invalidate()
 
     def disable(self, validator_id, types=None):
+        self._loaded()
         if validator_id.startswith('_'):
             raise RecordException(
                 f'Cannot disable bridge validator "{validator_id}"'
@@ -95,13 +148,16 @@ class ValidatorRegistry:
                         and registry[key].pop(validator_id, None) is not None
                     ):
                         removed += 1
+        self.invalidate()
         return removed
 
     def reset_active(self):
         self.active_record.clear()
         self.active_value.clear()
+        self.invalidate()
 
     def registered(self):
+        self._loaded()
         return {
             'record': {
                 k: list(v.values()) for k, v in self.active_record.items()
@@ -112,6 +168,7 @@ class ValidatorRegistry:
         }
 
     def available(self):
+        self._loaded()
         return {
             'record': {
                 k: list(v.values()) for k, v in self.available_record.items()
@@ -121,6 +178,65 @@ class ValidatorRegistry:
             },
         }
 
+    def _active(self, active, _type, disabled):
+        for key in ('*', _type):
+            skip = disabled.get(key, ())
+            for validator in active.get(key, {}).values():
+                if validator.id in skip and not validator.id.startswith('_'):
+                    continue
+                yield validator
+
+    def _record_chain(self, _type, disabled):
+        key = ('record', _type, _chain_key(disabled, _type))
+        try:
+            return self._chains[key]
+        except KeyError:
+            pass
+        chain = []
+        for validator in self._active(self.active_record, _type, disabled):
+            validate = validator.validate
+            if not _accepts_disabled(validate):
+                deprecated(
+                    f'`validate` without the `disabled` param is DEPRECATED. Will be removed in 2.0. Class {validator.__class__.__name__}',
+                    stacklevel=5,
+                )
+                validate = _without_disabled(validate)
+            chain.append(
+                (
+                    validator.id,
+                    validate,
+                    True,
+                    getattr(validator, 'name_dependent', True),
+                )
+            )
+        chain = self._chains[key] = tuple(chain)
+        return chain
+
+    def _value_chain(self, value_type, _type, disabled):
+        key = ('value', value_type, _type, _chain_key(disabled, _type))
+        try:
+            return self._chains[key]
+        except KeyError:
+            pass
+        chain = []
+        legacy = getattr(value_type, 'validate', None)
+        if legacy is not None:
+            deprecated(
+                f'`{value_type.__name__}.validate` classmethod is DEPRECATED. Add a ValueValidator to `VALIDATORS` instead. Will be removed in 2.0',
+                stacklevel=5,
+            )
+            chain.append(
+                (
+                    f'{value_type.__name__}.validate',
+                    _legacy_value_validate(legacy),
+                    False,
+                )
+            )
+        for validator in self._active(self.active_value, _type, disabled):
+            chain.append((validator.id, validator.validate, True))
+        chain = self._chains[key] = tuple(chain)
+        return chain
+
     def process_record(self, record_cls, name, fqdn, data, disabled=None):
         if not self.configured:
             self.log.warning(
@@ -128,60 +244,107 @@ class ValidatorRegistry:
             )
             self.enable_sets({'legacy'})
         disabled = disabled or {}
+        chain = self._record_chain(record_cls._type, disabled)
+
+        cache = self._cache
+        key = None
+        if cache is not None:
+            key = _cache_key(record_cls, disabled, data)
+            if key is not None:
+                with self._cache_lock:
+                    hit = key in cache
+                    if hit:
+                        cache.move_to_end(key)
+                if hit:
+                    # this data has already passed everything that doesn't
+                    # depend on the name
+                    chain = [c for c in chain if c[3]]
+                    key = None
+
         reasons = []
-        for key in ('*', record_cls._type):
-            skip = disabled.get(key, ())
-            for validator in self.active_record.get(key, {}).values():
-                if validator.id in skip and not validator.id.startswith('_'):
-                    continue
-                try:
-                    reasons.extend(
-                        _as_reason(r, validator.id)
-                        for r in validator.validate(
-                            record_cls, name, fqdn, data, disabled=disabled
-                        )
-                    )
-                except TypeError as e:
-                    if "unexpected keyword argument 'disabled'" not in str(e):
-                        raise
-                    deprecated(
-                        f'`validate` without the `disabled` param is DEPRECATED. Will be removed in 2.0. Class {validator.__class__.__name__}',
-                        stacklevel=3,
-                    )
-                    reasons.extend(
-                        _as_reason(r, validator.id)
-                        for r in validator.validate(
-                            record_cls, name, fqdn, data
-                        )
-                    )
+        passed = True
+        for validator_id, validate, warn, name_dependent in chain:
+            for r in validate(record_cls, name, fqdn, data, disabled=disabled):
+                reasons.append(_as_reason(r, validator_id, warn=warn))
+                if not name_dependent:
+                    passed = False
+
+        if key is not None and passed:
+            with self._cache_lock:
+                cache[key] = True
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+
         return reasons
 
     def process_values(self, value_type, values, _type, disabled=None):
         disabled = disabled or {}
         reasons = []
-        legacy = getattr(value_type, 'validate', None)
-        if legacy is not None:
-            deprecated(
-                f'`{value_type.__name__}.validate` classmethod is DEPRECATED. Add a ValueValidator to `VALIDATORS` instead. Will be removed in 2.0',
-                stacklevel=3,
-            )
-            legacy_id = f'{value_type.__name__}.validate'
-            reasons.extend(
-                _as_reason(r, legacy_id, warn=False)
-                for r in legacy(values, _type)
-            )
-        for key in ('*', _type):
-            skip = disabled.get(key, ())
-            for validator in self.active_value.get(key, {}).values():
-                if validator.id in skip and not validator.id.startswith('_'):
-                    continue
-                reasons.extend(
-                    _as_reason(r, validator.id)
-                    for r in validator.validate(value_type, values, _type)
-                )
+        for validator_id, validate, warn in self._value_chain(
+            value_type, _type, disabled
+        ):
+            for r in validate(value_type, values, _type):
+                reasons.append(_as_reason(r, validator_id, warn=warn))
         return reasons
 
 
+def _chain_key(disabled, _type):
+    # the parts of disabled that matter to _type's chain, hashable
+    ret = []
+    for key in ('*', _type):
+        skip = disabled.get(key)
+        if skip and not isinstance(skip, frozenset):
+            skip = frozenset(skip)
+        ret.append(skip or None)
+    return tuple(ret)
+
+
+def _freeze(data):
+    if isinstance(data, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in data.items()))
+    elif isinstance(data, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in data))
+    elif isinstance(data, str):
+        return data
+    # include the type so that e.g. 1, 1.0, and True aren't the same
+    return (data.__class__, data)
+
+
+def _cache_key(record_cls, disabled, data):
+    key = (record_cls, _chain_key(disabled, record_cls._type), _freeze(data))
+    try:
+        hash(key)
+    except TypeError:
+        # something in there isn't hashable, we can't cache it
+        return None
+    return key
+
+
+def _accepts_disabled(validate):
+    try:
+        params = signature(validate).parameters
+    except (TypeError, ValueError):
+        # can't tell, assume it's current
+        return True
+    return 'disabled' in params or any(
+        p.kind == Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _without_disabled(validate):
+    def wrapper(record_cls, name, fqdn, data, disabled=None):
+        return validate(record_cls, name, fqdn, data)
+
+    return wrapper
+
+
+def _legacy_value_validate(legacy):
+    def wrapper(value_type, values, _type):
+        return legacy(values, _type)
+
+    return wrapper
+
+
 class ValidationReason(str):
     '''
     A single validation failure reason.
@@ -274,8 +437,16 @@ class RecordValidator:
     ``NameValidator`` for the custom instance. This is the supported way
     to tweak a built-in's parameters without disabling it and inventing a
     new id.
+
+    Validators that only look at ``data``, and not ``name`` or ``fqdn``,
+    should set ``name_dependent = False``. When the validation cache is
+    enabled, see ``ValidatorRegistry.enable_cache``, they're only run once
+    for each distinct payload. It defaults to ``True`` so that validators
+    that haven't declared it are always run.
     '''
 
+    name_dependent = True
+
     def __init__(self, id, sets=None):
         '''
         :param id: Non-empty identifier for this validator instance. Used
@@ -345,9 +516,10 @@ class RecordValidator:
 
         Third-party validators that predate the ``disabled`` parameter and
         implement ``validate(self, record_cls, name, fqdn, data)`` continue to
-        work: the caller detects the ``TypeError`` and falls back to calling
-        without it, emitting a deprecation warning. Support for the
-        parameter-less form will be removed in 2.0.
+        work: the registry inspects the signature when it compiles the chain
+        of active validators and calls them without it, emitting a
+        deprecation warning. Support for the parameter-less form will be
+        removed in 2.0.
         '''
         return []
 
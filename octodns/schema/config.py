@@ -75,9 +75,34 @@ _PROVIDER_BRANCHES = [
             'disable_zonefile': {'type': 'boolean'},
             'escaped_semicolons': {'type': 'boolean'},
             'ignore_missing_zones': {'type': 'boolean'},
+            'cache_dir': {'type': ['string', 'null']},
+            'cache_max_size': _INT_GTE0,
+            'load_workers': _INT_GTE1,
+            'load_executor': {'type': 'string', 'enum': ['thread', 'process']},
         },
         required_props=['directory'],
     ),
+    _class_branch(
+        'octodns.provider.jsonl.JsonLinesProvider',
+        {
+            'directory': {'type': 'string'},
+            'default_ttl': _INT_GTE0,
+            'populate_should_replace': {'type': 'boolean'},
+            'supports_root_ns': {'type': 'boolean'},
+            'ignore_missing_zones': {'type': 'boolean'},
+        },
+        required_props=['directory'],
+    ),
+    _class_branch(
+        'octodns.provider.sqlite.SqliteProvider',
+        {
+            'path': {'type': 'string'},
+            'populate_should_replace': {'type': 'boolean'},
+            'supports_root_ns': {'type': 'boolean'},
+            'ignore_missing_zones': {'type': 'boolean'},
+        },
+        required_props=['path'],
+    ),
     _class_branch(
         'octodns.source.envvar.EnvVarSource',
         {
@@ -275,6 +300,9 @@ def _manager_def():
         'additionalProperties': False,
         'properties': {
             'max_workers': _INT_GTE1,
+            'apply_workers': _INT_GTE1,
+            'plan_workers': _INT_GTE1,
+            'executor': {'type': 'string', 'enum': ['thread', 'process']},
             'include_meta': {'type': 'boolean'},
             'enable_checksum': {'type': 'boolean'},
             'auto_arpa': {'oneOf': [{'type': 'boolean'}, _AUTO_ARPA_KWARGS]},
@@ -291,6 +319,7 @@ def _manager_def():
                         'properties': {
                             'validators': _TYPE_TO_NAMES_MAP,
                             'disable_validators': _TYPE_TO_NAMES_MAP,
+                            'cache_size': _INT_GTE0,
                         },
                     },
                     'zone': {
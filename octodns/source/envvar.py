@@ -96,7 +96,7 @@ class EnvVarSource(BaseSource):
             lenient,
         )
 
-        before = len(zone.records)
+        before = len(zone)
 
         value = self._read_variable()
 
@@ -109,6 +109,5 @@ class EnvVarSource(BaseSource):
         zone.add_record(record, lenient=lenient)
 
         self.log.info(
-            'populate:   found %s records, exists=False',
-            len(zone.records) - before,
+            'populate:   found %s records, exists=False', len(zone) - before
         )
@@ -420,7 +420,7 @@ class TinyDnsBaseSource(BaseSource):
             lenient,
         )
 
-        before = len(zone.records)
+        before = len(zone)
 
         # This is complicate b/c the mapping between tinydns line types (called
         # symbols here) is not one to one with (octoDNS) records. Some lines
@@ -454,9 +454,7 @@ class TinyDnsBaseSource(BaseSource):
                 record = Record.new(zone, name, data, lenient=lenient)
                 zone.add_record(record, lenient=lenient)
 
-        self.log.info(
-            'populate:   found %s records', len(zone.records) - before
-        )
+        self.log.info('populate:   found %s records', len(zone) - before)
 
 
 class TinyDnsFileSource(TinyDnsBaseSource):
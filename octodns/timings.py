@@ -0,0 +1,127 @@
+#
+#
+#
+
+from contextlib import contextmanager
+from json import dump
+from time import perf_counter, time
+
+
+class Timings(object):
+    '''
+    Collects how long each phase of a run takes, e.g. populating a zone from a
+    source or planning it against a target. Each entry records the phase, the
+    seconds it took, when it started relative to origin, and the labels it
+    was recorded with, zone, source, target, and/or processor.
+
+    Durations come from perf_counter while start offsets use the wall clock so
+    that entries recorded in other processes can be merged onto the same
+    timeline.
+
+    Recording is safe to do from multiple threads.
+    '''
+
+    LABELS = ('zone', 'source', 'target', 'processor')
+
+    def __init__(self):
+        self.origin = time()
+        self.entries = []
+
+    @contextmanager
+    def time(self, phase, **labels):
+        start = time()
+        counter = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, perf_counter() - counter, start=start, **labels)
+
+    def record(self, phase, seconds, start=None, **labels):
+        if start is None:
+            start = time() - seconds
+        entry = {'phase': phase}
+        for label in self.LABELS:
+            value = labels.get(label)
+            if value is not None:
+                entry[label] = value
+        entry['start'] = start - self.origin
+        entry['seconds'] = seconds
+        # list.append is atomic so no locking is required
+        self.entries.append(entry)
+
+    def reset(self):
+        self.origin = time()
+        self.entries = []
+
+    def merge(self, entries, origin):
+        '''
+        Adds entries recorded by another Timings, e.g. in a worker process,
+        whose origin was origin.
+        '''
+        offset = origin - self.origin
+        for entry in entries:
+            entry = dict(entry)
+            entry['start'] += offset
+            self.entries.append(entry)
+
+    @property
+    def data(self):
+        return {'timings': sorted(self.entries, key=lambda e: e['start'])}
+
+    def write_json(self, fh):
+        dump(self.data, fh, indent=2)
+        fh.write('\n')
+
+    def write_prometheus(self, fh):
+        '''
+        Writes the timings in the Prometheus textfile format, summing any
+        entries that share a phase and labels.
+        '''
+        seconds = {}
+        counts = {}
+        for entry in self.entries:
+            key = (entry['phase'],) + tuple(
+                entry.get(label) for label in self.LABELS
+            )
+            seconds[key] = seconds.get(key, 0) + entry['seconds']
+            counts[key] = counts.get(key, 0) + 1
+
+        for name, kind, help, values in (
+            (
+                'octodns_phase_duration_seconds',
+                'gauge',
+                'Seconds spent in each phase of the run',
+                seconds,
+            ),
+            (
+                'octodns_phase_count',
+                'gauge',
+                'Number of times each phase of the run happened',
+                counts,
+            ),
+        ):
+            fh.write(f'# HELP {name} {help}\n')
+            fh.write(f'# TYPE {name} {kind}\n')
+            for key in sorted(values, key=lambda k: [v or '' for v in k]):
+                labels = [f'phase="{_escape(key[0])}"']
+                for label, value in zip(self.LABELS, key[1:]):
+                    if value is not None:
+                        labels.append(f'{label}="{_escape(value)}"')
+                labels = ','.join(labels)
+                fh.write(f'{name}{{{labels}}} {values[key]}\n')
+
+    def write(self, filename, format='json'):
+        with open(filename, 'w') as fh:
+            if format == 'prometheus':
+                self.write_prometheus(fh)
+            else:
+                self.write_json(fh)
+
+
+def _escape(value):
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+    )
@@ -2,49 +2,157 @@
 #
 #
 
-from os.path import dirname, expanduser, isabs, join
+from collections import OrderedDict
+from contextvars import ContextVar
+from copy import deepcopy
+from hashlib import sha256
+from logging import getLogger
+from operator import itemgetter
+from os import listdir, makedirs, remove, replace, stat, utime
+from os.path import dirname, expanduser, isabs, join, realpath
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from tempfile import mkstemp
+from threading import Lock
 
 from natsort import natsort_keygen
 from yaml import SafeDumper, SafeLoader, compose, dump, load
+
+try:
+    from yaml import CSafeDumper, CSafeLoader
+except ImportError:
+    # pyyaml was built without libyaml
+    CSafeDumper = None
+    CSafeLoader = None
 from yaml.constructor import ConstructorError
-from yaml.representer import SafeRepresenter
 
+from . import __version__
 from .context import ContextDict
 
 # as of python 3.13 functools.partial is a method descriptor and must be wrapped
 # in staticmethod() to preserve the behavior natsort is expecting it to have
-_natsort_key = staticmethod(natsort_keygen())
+_natsort = natsort_keygen()
+_natsort_key = staticmethod(_natsort)
 
+# when set to a list, by YamlCache and IncludeCache, the loaders append the
+# (realpath, mtime_ns, size) of every file they !include to it
+_includes = ContextVar('octodns_yaml_includes', default=None)
 
-class ContextLoader(SafeLoader):
 
-    def construct_include(self, node):
-        mark = self.get_mark()
-        directory = dirname(mark.name)
+def _stat(filename):
+    st = stat(filename)
+    return st.st_mtime_ns, st.st_size
 
-        path = self.construct_scalar(node)
-        path = expanduser(path)
-        if isabs(path):
-            filename = path
-        else:
-            filename = join(directory, path)
 
-        with open(filename, 'r') as fh:
-            return load(fh, self.__class__)
+def _fresh(includes):
+    for path, mtime_ns, size in includes:
+        try:
+            if _stat(path) != (mtime_ns, size):
+                return False
+        except OSError:
+            return False
+    return True
+
 
-    def flatten_include(self, node):
-        mark = self.get_mark()
-        directory = dirname(mark.name)
+class IncludeCache(object):
+    '''
+    A per-process cache of !include'd files so that a fragment shared by many
+    files is only parsed once per run, so long as it, and anything it
+    includes, has the same mtime and size. Callers get their own deep copy of
+    the data each time so that the cached version can't be modified.
+
+    hits and misses count the includes that were and weren't served from the
+    cache. Once there are more than size entries the least recently used are
+    dropped.
+    '''
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load(self, loader, filename, flatten=False):
+        '''
+        Returns the data in filename loaded with loader, or its composed
+        mapping node's value, the key and value node pairs, when flatten is
+        True.
+        '''
+        # stat before reading so that changes made while we're working will
+        # be picked up next time
+        path = realpath(filename)
+        includes = [(path,) + _stat(filename)]
+        key = (loader, path, flatten)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if (
+            entry is not None
+            and entry[0][0] == includes[0]
+            and _fresh(entry[0][1:])
+        ):
+            includes, value = entry
+            with self._lock:
+                self.hits += 1
+        else:
+            # keep track of anything it includes in turn
+            token = _includes.set(includes)
+            try:
+                with open(filename, 'r') as fh:
+                    if flatten:
+                        value = compose(fh, loader).value
+                    else:
+                        value = load(fh, loader)
+            finally:
+                _includes.reset(token)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = (includes, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+
+        outer = _includes.get()
+        if outer is not None:
+            outer.extend(includes)
+
+        return deepcopy(value)
+
+
+include_cache = IncludeCache()
+
+
+class _ContextLoaderMixin(object):
+    '''
+    The octoDNS specific parts of our loaders, ContextDicts, !include, and
+    merge flattening. Mixed in to both the pure Python and libyaml (C) based
+    loaders so that they behave the same.
+    '''
+
+    def _include_filename(self, node):
+        directory = dirname(node.start_mark.name)
 
         path = self.construct_scalar(node)
         path = expanduser(path)
         if isabs(path):
-            filename = path
-        else:
-            filename = join(directory, path)
+            return path
+        return join(directory, path)
 
-        with open(filename, 'r') as fh:
-            yield compose(fh, self.__class__).value
+    def construct_include(self, node):
+        filename = self._include_filename(node)
+        return include_cache.load(self.__class__, filename)
+
+    def flatten_include(self, node):
+        filename = self._include_filename(node)
+        yield include_cache.load(self.__class__, filename, flatten=True)
 
     def construct_mapping(self, node, deep=False):
         '''
@@ -115,57 +223,90 @@ class ContextLoader(SafeLoader):
         self.flatten_mapping(node)
         yield node.value
 
+    @classmethod
+    def _setup(cls):
+        # These 2 add's are also ported out of the PR
+        cls.add_flattener('tag:yaml.org,2002:seq', cls.flatten_yaml_seq)
+        cls.add_flattener('tag:yaml.org,2002:map', cls.flatten_yaml_map)
 
-# These 2 add's are also ported out of the PR
-ContextLoader.add_flattener(
-    'tag:yaml.org,2002:seq', ContextLoader.flatten_yaml_seq
-)
-ContextLoader.add_flattener(
-    'tag:yaml.org,2002:map', ContextLoader.flatten_yaml_map
-)
-
-ContextLoader.add_constructor(
-    ContextLoader.DEFAULT_MAPPING_TAG, ContextLoader.construct_mapping
-)
-ContextLoader.add_constructor('!include', ContextLoader.construct_include)
-ContextLoader.add_flattener('!include', ContextLoader.flatten_include)
+        cls.add_constructor(cls.DEFAULT_MAPPING_TAG, cls.construct_mapping)
+        cls.add_constructor('!include', cls.construct_include)
+        cls.add_flattener('!include', cls.flatten_include)
 
 
 # Found http://stackoverflow.com/a/21912744 which guided me on how to hook in
 # here
-class SortEnforcingLoader(ContextLoader):
+class _SortEnforcingMixin(object):
+    # the most out of order keys listed in the error, any more are counted
+    MAX_PROBLEMS = 10
 
     def construct_mapping(self, node, deep=False):
         ret = super().construct_mapping(node, deep)
 
-        keys = list(ret.keys())
-        keys_sorted = sorted(keys, key=self.KEYGEN)
-        for key in keys:
-            expected = keys_sorted.pop(0)
-            if key != expected:
-                start_mark = node.start_mark
-                context = f'{start_mark.name}, line {start_mark.line+1}, column {start_mark.column+1}'
-                raise ConstructorError(
-                    None,
-                    None,
-                    f'keys out of order: expected {expected} got {key} at {context}',
-                )
+        # a single pass comparing each key to the one before it, generating
+        # the sort key for each just once
+        keygen = self.KEYGEN
+        sort_keys = [keygen(k) for k in ret.keys()]
+        if all(a <= b for a, b in zip(sort_keys, sort_keys[1:])):
+            return ret
 
-        return ret
+        keys = list(ret.keys())
+        out_of_order = [
+            i for i in range(1, len(keys)) if sort_keys[i - 1] > sort_keys[i]
+        ]
+        # where each key is, construct_object returns the already constructed
+        # keys. Merged in keys may not have a node of their own so they fall
+        # back to the mapping's
+        marks = {}
+        for key_node, _ in node.value:
+            marks.setdefault(
+                self.construct_object(key_node), key_node.start_mark
+            )
+        problems = []
+        for i in out_of_order[: self.MAX_PROBLEMS]:
+            mark = marks.get(keys[i], node.start_mark)
+            problems.append(
+                f'{keys[i]} should be before {keys[i - 1]} at {mark.name}, line {mark.line+1}, column {mark.column+1}'
+            )
+        more = len(out_of_order) - self.MAX_PROBLEMS
+        if more > 0:
+            problems.append(f'and {more} more')
+        raise ConstructorError(
+            None, None, f'keys out of order: {"; ".join(problems)}'
+        )
 
 
-class NaturalSortEnforcingLoader(SortEnforcingLoader):
+class _NaturalSortMixin(object):
     KEYGEN = _natsort_key
 
 
+class _SimpleSortMixin(object):
+    KEYGEN = lambda _, s: s
+
+
+class ContextLoader(_ContextLoaderMixin, SafeLoader):
+    pass
+
+
+ContextLoader._setup()
+
+
+class SortEnforcingLoader(_SortEnforcingMixin, ContextLoader):
+    pass
+
+
+class NaturalSortEnforcingLoader(_NaturalSortMixin, SortEnforcingLoader):
+    pass
+
+
 NaturalSortEnforcingLoader.add_constructor(
     SortEnforcingLoader.DEFAULT_MAPPING_TAG,
     NaturalSortEnforcingLoader.construct_mapping,
 )
 
 
-class SimpleSortEnforcingLoader(SortEnforcingLoader):
-    KEYGEN = lambda _, s: s
+class SimpleSortEnforcingLoader(_SimpleSortMixin, SortEnforcingLoader):
+    pass
 
 
 SimpleSortEnforcingLoader.add_constructor(
@@ -179,6 +320,43 @@ _loaders = {
     'simple': SimpleSortEnforcingLoader,
 }
 
+# When pyyaml has been built with libyaml we have equivalent loaders that do
+# the scanning, parsing, and composing in C, which is a lot faster. Only the
+# construction of objects happens in Python.
+if CSafeLoader is None:
+    CContextLoader = None
+    _c_loaders = {}
+else:
+
+    class CContextLoader(_ContextLoaderMixin, CSafeLoader):
+        pass
+
+    CContextLoader._setup()
+
+    class CSortEnforcingLoader(_SortEnforcingMixin, CContextLoader):
+        pass
+
+    class CNaturalSortEnforcingLoader(_NaturalSortMixin, CSortEnforcingLoader):
+        pass
+
+    CNaturalSortEnforcingLoader.add_constructor(
+        CSortEnforcingLoader.DEFAULT_MAPPING_TAG,
+        CNaturalSortEnforcingLoader.construct_mapping,
+    )
+
+    class CSimpleSortEnforcingLoader(_SimpleSortMixin, CSortEnforcingLoader):
+        pass
+
+    CSimpleSortEnforcingLoader.add_constructor(
+        CSortEnforcingLoader.DEFAULT_MAPPING_TAG,
+        CSimpleSortEnforcingLoader.construct_mapping,
+    )
+
+    _c_loaders = {
+        'natural': CNaturalSortEnforcingLoader,
+        'simple': CSimpleSortEnforcingLoader,
+    }
+
 
 class InvalidOrder(Exception):
 
@@ -189,19 +367,213 @@ class InvalidOrder(Exception):
         )
 
 
-def safe_load(stream, enforce_order=True, order_mode='natural'):
+def safe_load(stream, enforce_order=True, order_mode='natural', libyaml=True):
+    '''
+    Loads stream returning ContextDicts for mappings. When libyaml is True,
+    and pyyaml has libyaml support, the C based loaders are used, otherwise
+    the pure Python ones are.
+    '''
+    libyaml = libyaml and CContextLoader is not None
     if enforce_order:
         try:
-            loader = _loaders[order_mode]
+            loader = (_c_loaders if libyaml else _loaders)[order_mode]
         except KeyError as e:
             raise InvalidOrder(order_mode) from e
     else:
-        loader = ContextLoader
+        loader = CContextLoader if libyaml else ContextLoader
 
     return load(stream, loader)
 
 
-class SortingDumper(SafeDumper):
+class YamlCache(object):
+    '''
+    An on-disk cache of parsed YAML files. The parsed, and if enabled order
+    validated, data, including the context of each dict, is pickled into
+    directory and reused for as long as the file, and everything it
+    !includes, has the same mtime and size.
+
+    When the total size of the entries grows past max_size bytes the least
+    recently used ones are removed.
+
+    Since entries are pickles directory must only be writable by trusted
+    users.
+    '''
+
+    log = getLogger('YamlCache')
+
+    def __init__(self, directory, max_size=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+        makedirs(directory, exist_ok=True)
+        # the approximate total size of the entries, computed when first
+        # needed, see _evict
+        self._size = None
+        self._lock = Lock()
+
+    def __getstate__(self):
+        # locks can't be pickled, and a copy in another process will need to
+        # work out the size for itself
+        return {'directory': self.directory, 'max_size': self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _entry(self, filename, enforce_order, order_mode):
+        mode = (enforce_order, order_mode)
+        key = repr((__version__, realpath(filename), filename, mode))
+        name = sha256(key.encode()).hexdigest()
+        return join(self.directory, f'{name}.pickle')
+
+    def _read(self, entry):
+        try:
+            with open(entry, 'rb') as fh:
+                return loads(fh.read())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # corrupt, truncated, or otherwise unusable, treat it as a miss
+            self.log.warning('_read: ignoring unreadable entry %s', entry)
+            return None
+
+    def load(self, filename, enforce_order=True, order_mode='natural'):
+        '''
+        Returns the same thing as safe_load(open(filename), ...), from the
+        cache when possible.
+        '''
+        # stat before reading so that changes made while we're working will
+        # be picked up next time
+        current = _stat(filename)
+        entry = self._entry(filename, enforce_order, order_mode)
+
+        cached = self._read(entry)
+        if cached is not None:
+            stats, includes, data = cached
+            if stats == current and _fresh(includes):
+                self.log.debug('load: hit filename=%s', filename)
+                # keep track of when it was last used for eviction, it may
+                # have just been evicted by another thread or process, which
+                # is fine, we already have the data
+                try:
+                    utime(entry)
+                except FileNotFoundError:
+                    pass
+                return data
+
+        self.log.debug('load: miss filename=%s', filename)
+        token = _includes.set([])
+        try:
+            with open(filename, 'r') as fh:
+                data = safe_load(
+                    fh, enforce_order=enforce_order, order_mode=order_mode
+                )
+            includes = _includes.get()
+        finally:
+            _includes.reset(token)
+
+        self._write(entry, (current, includes, data))
+        return data
+
+    def _write(self, entry, value):
+        value = dumps(value, protocol=HIGHEST_PROTOCOL)
+        # write to a temp file and move it into place so that readers never
+        # see partial entries
+        tmp = None
+        try:
+            fd, tmp = mkstemp(dir=self.directory, suffix='.tmp')
+            with open(fd, 'wb') as fh:
+                fh.write(value)
+            replace(tmp, entry)
+        except OSError:
+            # failing to cache isn't fatal, we have the data
+            self.log.warning('_write: failed to write %s', entry, exc_info=True)
+            if tmp is not None:
+                try:
+                    remove(tmp)
+                except OSError:
+                    pass
+            return
+        self._evict(len(value))
+
+    def _entries(self):
+        ret = []
+        for name in listdir(self.directory):
+            if not name.endswith('.pickle'):
+                continue
+            path = join(self.directory, name)
+            try:
+                st = stat(path)
+            except FileNotFoundError:
+                # removed out from under us
+                continue
+            ret.append((st.st_mtime_ns, st.st_size, path))
+        return ret
+
+    def _evict(self, added):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(e[1] for e in self._entries())
+            else:
+                self._size += added
+            if self._size <= self.max_size:
+                return
+
+            # we're over, get the real picture and remove the least recently
+            # used entries until we're back under
+            entries = sorted(self._entries())
+            self._size = sum(e[1] for e in entries)
+            for _, size, path in entries:
+                if self._size <= self.max_size:
+                    break
+                try:
+                    remove(path)
+                except FileNotFoundError:
+                    pass
+                self._size -= size
+                self.log.debug('_evict: removed %s', path)
+
+
+def _sorted_items(data, keygen):
+    # generate each key's sort key just once, rather than for every comparison
+    items = sorted(
+        ((keygen(k), k, v) for k, v in data.items()), key=itemgetter(0)
+    )
+    if any(a[0] == b[0] for a, b in zip(items, items[1:])):
+        # keys that sort the same as each other, e.g. a1 and a01 with natural
+        # ordering, have always had the tie broken by their values
+        return sorted(data.items(), key=keygen)
+    return [(k, v) for _, k, v in items]
+
+
+def _libyaml_safe(data):
+    '''
+    Returns True if libyaml will emit data exactly as the pure Python emitter
+    does. The two differ on empty keys, which Python writes as complex keys,
+    and in how they escape, wrap, and measure non-ASCII and non-printable
+    characters, so only printable ASCII strings are considered safe. Python
+    also ends documents that are just a scalar with an explicit "...".
+    '''
+    if not isinstance(data, (dict, list, tuple)):
+        return False
+    stack = [data]
+    while stack:
+        data = stack.pop()
+        if isinstance(data, str):
+            if not (data.isascii() and data.isprintable()):
+                return False
+        elif isinstance(data, dict):
+            for k, v in data.items():
+                if k == '':
+                    return False
+                stack.append(k)
+                stack.append(v)
+        elif isinstance(data, (list, tuple)):
+            stack.extend(data)
+        elif data is not None and not isinstance(data, (bool, int, float)):
+            return False
+    return True
+
+
+class _SortingDumperMixin(object):
     '''
     This sorts keys alphanumerically in a "natural" manner where things with
     the number 2 come before the number 12.
@@ -211,39 +583,128 @@ class SortingDumper(SafeDumper):
     '''
 
     def _representer(self, data):
-        data = sorted(data.items(), key=self.KEYGEN)
+        data = _sorted_items(data, self.KEYGEN)
         return self.represent_mapping(self.DEFAULT_MAPPING_TAG, data)
 
+    def _represent_str(self, data):
+        # libyaml only accepts actual strs, not subclasses, the underlying
+        # value is the same for both
+        return self.represent_str(str.__str__(data))
+
+    @classmethod
+    def _setup(cls):
+        cls.add_representer(dict, cls._representer)
+        # This should handle all the record value types which are ultimately
+        # either str or dict at some point in their inheritance hierarchy
+        cls.add_multi_representer(str, cls._represent_str)
+        cls.add_multi_representer(dict, cls._representer)
 
-SortingDumper.add_representer(dict, SortingDumper._representer)
-# This should handle all the record value types which are ultimately either str
-# or dict at some point in their inheritance hierarchy
-SortingDumper.add_multi_representer(str, SafeRepresenter.represent_str)
-SortingDumper.add_multi_representer(dict, SortingDumper._representer)
 
+class SortingDumper(_SortingDumperMixin, SafeDumper):
+    pass
 
-class NaturalSortingDumper(SortingDumper):
-    KEYGEN = _natsort_key
 
+SortingDumper._setup()
 
-class SimpleSortingDumper(SortingDumper):
-    KEYGEN = lambda _, s: s
+
+class NaturalSortingDumper(_NaturalSortMixin, SortingDumper):
+    pass
+
+
+class SimpleSortingDumper(_SimpleSortMixin, SortingDumper):
+    pass
 
 
 _dumpers = {'natural': NaturalSortingDumper, 'simple': SimpleSortingDumper}
 
+if CSafeDumper is None:
+    CSortingDumper = None
+    _c_dumpers = {}
+else:
+
+    class CSortingDumper(_SortingDumperMixin, CSafeDumper):
+        pass
 
-def safe_dump(data, fh, order_mode='natural', **options):
-    kwargs = {
+    CSortingDumper._setup()
+
+    class CNaturalSortingDumper(_NaturalSortMixin, CSortingDumper):
+        pass
+
+    class CSimpleSortingDumper(_SimpleSortMixin, CSortingDumper):
+        pass
+
+    _c_dumpers = {
+        'natural': CNaturalSortingDumper,
+        'simple': CSimpleSortingDumper,
+    }
+
+
+def _dump_options(options):
+    ret = {
         'canonical': False,
         'indent': 2,
         'default_style': '',
         'default_flow_style': False,
         'explicit_start': True,
     }
-    kwargs.update(options)
+    ret.update(options)
+    return ret
+
+
+def _dumper(data, order_mode, libyaml):
     try:
         dumper = _dumpers[order_mode]
     except KeyError as e:
         raise InvalidOrder(order_mode) from e
-    dump(data, fh, dumper, **kwargs)
+    if libyaml and CSortingDumper is not None and _libyaml_safe(data):
+        return _c_dumpers[order_mode]
+    return dumper
+
+
+def safe_dump(data, fh, order_mode='natural', libyaml=True, **options):
+    '''
+    Writes data to fh with mapping keys sorted according to order_mode. When
+    libyaml is True, and pyyaml has libyaml support, the C based emitter is
+    used for data it writes identically to the pure Python one.
+    '''
+    dumper = _dumper(data, order_mode, libyaml)
+    dump(data, fh, dumper, **_dump_options(options))
+
+
+def sort_keys(keys, order_mode='natural'):
+    '''
+    Returns keys in the order safe_dump would write them, for use with
+    safe_dump_stream, or None if any of them sort the same as each other,
+    e.g. a1 and a01 with natural ordering, in which case safe_dump breaks the
+    tie using their values.
+    '''
+    if order_mode not in _dumpers:
+        raise InvalidOrder(order_mode)
+    if order_mode == 'simple':
+        return sorted(keys)
+    items = sorted(((_natsort(k), k) for k in keys), key=itemgetter(0))
+    if any(a[0] == b[0] for a, b in zip(items, items[1:])):
+        return None
+    return [k for _, k in items]
+
+
+def safe_dump_stream(items, fh, order_mode='natural', libyaml=True, **options):
+    '''
+    Writes items, an iterable of (key, value) already in order, see
+    sort_keys, to fh as a single mapping one item at a time rather than
+    requiring all of the data up front. The output is the same as safe_dump
+    of the equivalent dict, other than values that are shared between items
+    not being written as aliases. Only the default block style is supported.
+    '''
+    options = _dump_options(options)
+    first = True
+    for key, value in items:
+        data = {key: value}
+        dumper = _dumper(data, order_mode, libyaml)
+        dump(data, fh, dumper, **options)
+        if first:
+            options['explicit_start'] = False
+            first = False
+    if first:
+        # nothing was written, an empty mapping
+        safe_dump({}, fh, order_mode=order_mode, libyaml=libyaml, **options)
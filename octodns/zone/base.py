@@ -13,6 +13,25 @@ from .exception import ValidationError, ZoneException
 from .validator import ZoneValidatorRegistry
 
 
+def _record_targets(record):
+    '''
+    The names that record points at, the keys of Zone's references index,
+    normalized to have a trailing dot.
+    '''
+    _type = record._type
+    if _type in ('CNAME', 'ALIAS'):
+        targets = (record.value,)
+    elif _type == 'NS':
+        targets = record.values
+    elif _type == 'MX':
+        targets = [v.exchange for v in record.values]
+    elif _type == 'SRV':
+        targets = [v.target for v in record.values]
+    else:
+        return ()
+    return {t if t[-1] == '.' else f'{t}.' for t in targets if t}
+
+
 class SubzoneRecordException(Exception):
     '''
     Exception raised when a record belongs in a sub-zone but is added to the parent.
@@ -223,6 +242,16 @@ class Zone(object):
         # encoded thus we don't have to deal with idna/utf8 collisions
         self._records = defaultdict(set)
         self._root_ns = None
+        # Secondary indexes, maintained alongside _records, of the records of
+        # each type and of the records that point at a given name, e.g. the
+        # CNAMEs, MXs, SRVs, and NSs whose targets are www.example.com.
+        self._by_type = defaultdict(set)
+        self._references = defaultdict(set)
+        # The number of records across all nodes, kept up to date as records
+        # are added and removed, and a snapshot of them that's built on demand
+        # and thrown away whenever they change
+        self._record_count = 0
+        self._record_set = None
         # optional leading . to match empty hostname
         # optional trailing . b/c some sources don't have it on their fqdn
         self._utf8_name_re = re.compile(fr'\.?{idna_decode(name)}?$')
@@ -247,6 +276,11 @@ class Zone(object):
         # point to a location with records for this `Zone`. Once `hydrated`
         # this property will be set to None
         self._origin = None
+        # Hydrated zones share the sets in _records and the indexes with their
+        # origin, and any other copies of it, until they need to modify them.
+        # None means nothing is shared, otherwise it holds the (attribute, key)s
+        # of the sets that have since been copied and now belong to this zone.
+        self._owned = None
 
         self.log.debug('__init__: zone=%s, sub_zones=%s', self, sub_zones)
 
@@ -283,12 +317,46 @@ class Zone(object):
         Returns a set of all DNS records in the zone. If this is a shallow copy
         (not yet hydrated), returns records from the origin zone.
 
+        The returned set belongs to the caller. Iterate over the zone itself,
+        or use ``len(zone)``, to avoid making a copy.
+
         :return: Set of all records in the zone.
         :rtype: set[octodns.record.base.Record]
         '''
+        return set(self._snapshot())
+
+    def _snapshot(self):
         if self._origin:
-            return self._origin.records
-        return set([r for _, node in self._records.items() for r in node])
+            return self._origin._snapshot()
+        if self._record_set is None:
+            self._record_set = frozenset(
+                r for node in self._records.values() for r in node
+            )
+        return self._record_set
+
+    def __len__(self):
+        '''
+        The number of records in this zone, without building a set of them.
+
+        :rtype: int
+        '''
+        if self._origin:
+            return len(self._origin)
+        return self._record_count
+
+    def __iter__(self):
+        '''
+        Iterate over the records in this zone. The snapshot of the records is
+        cached until the zone is next modified and changes made while iterating
+        aren't reflected in it, so it's safe to add or remove records as you
+        go.
+        '''
+        return iter(self._snapshot())
+
+    def __bool__(self):
+        # Zones are always truthy, even when empty, as they were before
+        # __len__ existed
+        return True
 
     @property
     def root_ns(self):
@@ -373,6 +441,65 @@ class Zone(object):
             return set(records)
         return {r for r in records if r._type == type}
 
+    def get_by_type(self, type):
+        '''
+        Return all of the records of the given type.
+
+        :param type: DNS record type (e.g. ``'MX'``)
+        :type type: str
+        :return: Set of matching records; empty set when none are found.
+        :rtype: set[octodns.record.base.Record]
+        '''
+        if self._origin:
+            return self._origin.get_by_type(type)
+        return set(self._by_type.get(type, ()))
+
+    def get_by_fqdn(self, fqdn, type=None):
+        '''
+        Return records at the given fully qualified name, optionally filtered
+        by type. Names outside of this zone have no records.
+
+        :param fqdn: Fully qualified domain name, the trailing dot is optional.
+        :type fqdn: str
+        :param type: DNS record type to filter on, or ``None`` to return all
+                     types at that name.
+        :type type: str or None
+        :return: Set of matching records; empty set when none are found.
+        :rtype: set[octodns.record.base.Record]
+        '''
+        fqdn = idna_encode(fqdn)
+        if fqdn[-1] != '.':
+            fqdn = f'{fqdn}.'
+        if fqdn == self.name:
+            return self.get('', type=type)
+        elif fqdn.endswith(f'.{self.name}'):
+            return self.get(fqdn[: -len(self.name) - 1], type=type)
+        return set()
+
+    def get_references(self, fqdn, type=None):
+        '''
+        Return the ``CNAME``, ``ALIAS``, ``MX``, ``SRV``, and ``NS`` records
+        that point at the given fully qualified name, optionally filtered by
+        type.
+
+        :param fqdn: Fully qualified domain name, the trailing dot is optional.
+        :type fqdn: str
+        :param type: DNS record type of the referencing records to filter on,
+                     or ``None`` to return all of them.
+        :type type: str or None
+        :return: Set of matching records; empty set when none are found.
+        :rtype: set[octodns.record.base.Record]
+        '''
+        if self._origin:
+            return self._origin.get_references(fqdn, type=type)
+        fqdn = idna_encode(fqdn)
+        if fqdn[-1] != '.':
+            fqdn = f'{fqdn}.'
+        records = self._references.get(fqdn, ())
+        if type is None:
+            return set(records)
+        return {r for r in records if r._type == type}
+
     def get_type(self, name, type):
         '''
         Return record of the specified type at the given name.
@@ -528,24 +655,51 @@ class Zone(object):
                         raise SubzoneRecordException(msg, record)
                     break
 
-        if replace:
-            # will remove it if it exists
-            self._records[name].discard(record)
-
         node = self._records[name]
         if record in node:
             # We already have a record at this node of this type
             existing = [c for c in node if c == record][0]
-            raise DuplicateRecordException(
-                f'Duplicate record {record.fqdn}, type {record._type}',
-                existing,
-                record,
-            )
-
+            if not replace:
+                raise DuplicateRecordException(
+                    f'Duplicate record {record.fqdn}, type {record._type}',
+                    existing,
+                    record,
+                )
+            # will remove it if it exists
+            self._unstore(existing)
+
+        self._store(record)
+
+    def _writable(self, attr, key):
+        # Returns the set at self.<attr>[key], first making a copy of it if it
+        # may be shared with other zones
+        index = getattr(self, attr)
+        owned = self._owned
+        if owned is not None and (attr, key) not in owned:
+            index[key] = set(index.get(key, ()))
+            owned.add((attr, key))
+        return index[key]
+
+    def _store(self, record):
+        # Adds record to _records and the indexes, no checks are done
+        self._writable('_records', record.name).add(record)
+        self._writable('_by_type', record._type).add(record)
+        for target in _record_targets(record):
+            self._writable('_references', target).add(record)
         if record._type == 'NS' and record.name == '':
             self._root_ns = record
-
-        node.add(record)
+        self._record_count += 1
+        self._record_set = None
+
+    def _unstore(self, record):
+        # Removes record, which must be the stored instance, from _records and
+        # the indexes
+        self._writable('_records', record.name).discard(record)
+        self._writable('_by_type', record._type).discard(record)
+        for target in _record_targets(record):
+            self._writable('_references', target).discard(record)
+        self._record_count -= 1
+        self._record_set = None
 
     def remove_record(self, record):
         '''
@@ -569,7 +723,12 @@ class Zone(object):
         if record._type == 'NS' and record.name == '':
             self._root_ns = None
 
-        self._records[record.name].discard(record)
+        # the instance we're given may not be the one we have, it's the
+        # stored instance's targets that are indexed
+        for existing in self._records.get(record.name, ()):
+            if existing == record:
+                self._unstore(existing)
+                break
 
     # TODO: delete this at v2.0.0rc0
     def _remove_record(self, record):
@@ -608,12 +767,12 @@ class Zone(object):
         # Build up a hash of the desired records, thanks to our special
         # __hash__ and __cmp__ on Record we'll be able to look up records that
         # match name and _type with it
-        desired_records = {r: r for r in desired.records}
+        desired_records = {r: r for r in desired}
 
         changes = []
 
         # Find diffs & removes
-        for record in self.records:
+        for record in self:
             if record.ignored:
                 continue
             elif len(record.included) > 0 and target.id not in record.included:
@@ -681,7 +840,7 @@ class Zone(object):
         # Find additions, things that are in desired, but missing in ourselves.
         # This uses set math and our special __hash__ and __cmp__ functions as
         # well
-        for record in desired.records - self.records:
+        for record in desired._snapshot() - self._snapshot():
             if record.ignored:
                 continue
             elif len(record.included) > 0 and target.id not in record.included:
@@ -741,8 +900,10 @@ class Zone(object):
         '''
         Convert a shallow copy into a hydrated copy with its own record references.
 
-        Hydration copies all records from the origin zone into this zone,
-        making it independent. The records themselves are still the original
+        Hydration makes this zone independent of the origin zone. The
+        per-node sets of records, and the indexes, continue to be shared
+        between the two until one of them modifies a node, at which point only
+        that node is copied. The records themselves are still the original
         objects and should not be modified directly. Use :meth:`add_record`
         with ``replace=True`` or :meth:`remove_record` to make changes.
 
@@ -756,18 +917,29 @@ class Zone(object):
         .. important::
            - Only hydrates if this is a shallow copy (has an ``_origin``)
            - Clears the ``_origin`` reference after hydration
-           - Uses ``lenient=True`` when adding records from origin
+           - Takes the origin's records as-is, no validation is done
            - Records are still shared with the origin (not deep copied)
         '''
         origin = self._origin
         if origin is None:
             return False
-        # Need to clear this before the copy to prevent recursion
         self._origin = None
-        for record in origin.records:
-            # Use lenient as we're copying origin and should take its records
-            # regardless
-            self.add_record(record, lenient=True)
+        # the origin may itself be an un-hydrated copy
+        while origin._origin is not None:
+            origin = origin._origin
+
+        # Only the top-level dicts are copied, the sets in them are now shared
+        # and neither zone may modify them in place, see _writable
+        self._records = defaultdict(set, origin._records)
+        self._by_type = defaultdict(set, origin._by_type)
+        self._references = defaultdict(set, origin._references)
+        self._owned = set()
+        origin._owned = set()
+
+        self._root_ns = origin._root_ns
+        self._record_count = origin._record_count
+        # we hold exactly the origin's records so we can share its snapshot
+        self._record_set = origin._snapshot()
         return True
 
     def copy(self):
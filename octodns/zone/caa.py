@@ -77,7 +77,7 @@ class CaaZoneValidator(ZoneValidator):
             )
 
         # Collect all CAA records in the zone.
-        caa_records = [r for r in zone.records if r._type == 'CAA']
+        caa_records = zone.get_by_type('CAA')
 
         for record in caa_records:
             # Collect all tags from all record values.
@@ -52,7 +52,8 @@ class NoCnameLoopZoneValidator(ZoneValidator):
     def validate(self, zone):
         reasons = []
         targets = {
-            r.fqdn: r for r in zone.records if r._type in ('CNAME', 'ALIAS')
+            r.fqdn: r
+            for r in zone.get_by_type('CNAME') | zone.get_by_type('ALIAS')
         }
 
         overall_visited = set()
@@ -100,19 +101,16 @@ class CnameTargetResolvableInZoneZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type in ('CNAME', 'ALIAS'):
-                target = str(record.value)
-                if zone.owns('A', target):
-                    hostname = zone.hostname_from_fqdn(target)
-                    if not zone.get(hostname):
-                        reasons.append(
-                            ValidationReason(
-                                f'{record._type} record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
-                                [record],
-                                validator_id=self.id,
-                            )
-                        )
+        for record in zone.get_by_type('CNAME') | zone.get_by_type('ALIAS'):
+            target = str(record.value)
+            if not zone.get_by_fqdn(target) and zone.owns('A', target):
+                reasons.append(
+                    ValidationReason(
+                        f'{record._type} record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
+                        [record],
+                        validator_id=self.id,
+                    )
+                )
         return reasons
 
 
@@ -143,20 +141,20 @@ class CnameTargetNotCnameZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'CNAME':
+        # work back from the CNAMEs, there are generally far fewer of them
+        # than there are records that could point at them
+        for cname in zone.get_by_type('CNAME'):
+            if not zone.owns('CNAME', cname.fqdn):
+                continue
+            for record in zone.get_references(cname.fqdn, type='CNAME'):
                 target = str(record.value)
-                if zone.owns('CNAME', target):
-                    hostname = zone.hostname_from_fqdn(target)
-                    cnames = zone.get(hostname, type='CNAME')
-                    if cnames:
-                        reasons.append(
-                            ValidationReason(
-                                f'CNAME record "{record.decoded_fqdn}" points to target "{target}" which is also a CNAME',
-                                [record],
-                                validator_id=self.id,
-                            )
-                        )
+                reasons.append(
+                    ValidationReason(
+                        f'CNAME record "{record.decoded_fqdn}" points to target "{target}" which is also a CNAME',
+                        [record],
+                        validator_id=self.id,
+                    )
+                )
         return reasons
 
 
@@ -43,7 +43,7 @@ class DnameCoexistenceValidator(ZoneValidator):
 
         for dname in dnames:
             parent = dname.name
-            for record in zone.records:
+            for record in zone:
                 name = record.name
                 is_child = (
                     name != '' if parent == '' else name.endswith(f'.{parent}')
@@ -362,9 +362,7 @@ class MailZoneValidator(ZoneValidator):
 
         mode = self.mode
 
-        non_apex_mx = [
-            r for r in zone.records if r.name != '' and r._type == 'MX'
-        ]
+        non_apex_mx = [r for r in zone.get_by_type('MX') if r.name != '']
 
         apex_mx_record = zone.get_type('', 'MX')
 
@@ -501,23 +499,21 @@ class MxTargetNotCnameZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'MX':
-                for value in record.values:
-                    target = value.exchange
-                    if target == '.':
-                        continue
-                    if zone.owns('CNAME', target):
-                        hostname = zone.hostname_from_fqdn(target)
-                        cnames = zone.get(hostname, type='CNAME')
-                        if cnames:
-                            reasons.append(
-                                ValidationReason(
-                                    f'MX record "{record.fqdn}" points to exchange "{target}" which is a CNAME',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+        for record in zone.get_by_type('MX'):
+            for value in record.values:
+                target = value.exchange
+                if target == '.':
+                    continue
+                if zone.get_by_fqdn(target, type='CNAME') and zone.owns(
+                    'CNAME', target
+                ):
+                    reasons.append(
+                        ValidationReason(
+                            f'MX record "{record.fqdn}" points to exchange "{target}" which is a CNAME',
+                            [record],
+                            validator_id=self.id,
+                        )
+                    )
         return reasons
 
 
@@ -536,20 +532,17 @@ class MxTargetResolvableInZoneZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'MX':
-                for value in record.values:
-                    target = value.exchange
-                    if zone.owns('A', target):
-                        hostname = zone.hostname_from_fqdn(target)
-                        if not zone.get(hostname):
-                            reasons.append(
-                                ValidationReason(
-                                    f'MX record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+        for record in zone.get_by_type('MX'):
+            for value in record.values:
+                target = value.exchange
+                if not zone.get_by_fqdn(target) and zone.owns('A', target):
+                    reasons.append(
+                        ValidationReason(
+                            f'MX record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
+                            [record],
+                            validator_id=self.id,
+                        )
+                    )
         return reasons
 
 
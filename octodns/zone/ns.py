@@ -24,25 +24,19 @@ class GlueForInZoneNsZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'NS':
-                for target in record.values:
-                    # Is target in zone?
-                    if zone.owns('A', target):
-                        # Check if address records exist at this target
-                        hostname = zone.hostname_from_fqdn(target)
-                        # We need at least one A or AAAA
-                        addresses = zone.get(hostname, type='A') | zone.get(
-                            hostname, type='AAAA'
+        for record in zone.get_by_type('NS'):
+            for target in record.values:
+                # We need at least one A or AAAA at an in-zone target
+                addresses = zone.get_by_fqdn(target, type='A')
+                addresses |= zone.get_by_fqdn(target, type='AAAA')
+                if not addresses and zone.owns('A', target):
+                    reasons.append(
+                        ValidationReason(
+                            f'NS record "{record.fqdn}" points to in-zone target "{target}" without glue records (A/AAAA)',
+                            [record],
+                            validator_id=self.id,
                         )
-                        if not addresses:
-                            reasons.append(
-                                ValidationReason(
-                                    f'NS record "{record.fqdn}" points to in-zone target "{target}" without glue records (A/AAAA)',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+                    )
         return reasons
 
 
@@ -55,20 +49,18 @@ class NsTargetNotCnameZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'NS':
-                for target in record.values:
-                    if zone.owns('CNAME', target):
-                        hostname = zone.hostname_from_fqdn(target)
-                        cnames = zone.get(hostname, type='CNAME')
-                        if cnames:
-                            reasons.append(
-                                ValidationReason(
-                                    f'NS record "{record.fqdn}" points to target "{target}" which is a CNAME',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+        for record in zone.get_by_type('NS'):
+            for target in record.values:
+                if zone.get_by_fqdn(target, type='CNAME') and zone.owns(
+                    'CNAME', target
+                ):
+                    reasons.append(
+                        ValidationReason(
+                            f'NS record "{record.fqdn}" points to target "{target}" which is a CNAME',
+                            [record],
+                            validator_id=self.id,
+                        )
+                    )
         return reasons
 
 
@@ -81,16 +73,15 @@ class MultiValueNsZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'NS':
-                if len(record.values) < 2:
-                    reasons.append(
-                        ValidationReason(
-                            f'NS record "{record.fqdn}" has only {len(record.values)} value; at least 2 are recommended for redundancy',
-                            [record],
-                            validator_id=self.id,
-                        )
+        for record in zone.get_by_type('NS'):
+            if len(record.values) < 2:
+                reasons.append(
+                    ValidationReason(
+                        f'NS record "{record.fqdn}" has only {len(record.values)} value; at least 2 are recommended for redundancy',
+                        [record],
+                        validator_id=self.id,
                     )
+                )
         return reasons
 
 
@@ -15,23 +15,21 @@ class SrvTargetNotCnameZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'SRV':
-                for value in record.values:
-                    target = value.target
-                    if target == '.':
-                        continue
-                    if zone.owns('CNAME', target):
-                        hostname = zone.hostname_from_fqdn(target)
-                        cnames = zone.get(hostname, type='CNAME')
-                        if cnames:
-                            reasons.append(
-                                ValidationReason(
-                                    f'SRV record "{record.decoded_fqdn}" points to target "{target}" which is a CNAME',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+        for record in zone.get_by_type('SRV'):
+            for value in record.values:
+                target = value.target
+                if target == '.':
+                    continue
+                if zone.get_by_fqdn(target, type='CNAME') and zone.owns(
+                    'CNAME', target
+                ):
+                    reasons.append(
+                        ValidationReason(
+                            f'SRV record "{record.decoded_fqdn}" points to target "{target}" which is a CNAME',
+                            [record],
+                            validator_id=self.id,
+                        )
+                    )
         return reasons
 
 
@@ -43,20 +41,17 @@ class SrvTargetResolvableInZoneZoneValidator(ZoneValidator):
 
     def validate(self, zone):
         reasons = []
-        for record in zone.records:
-            if record._type == 'SRV':
-                for value in record.values:
-                    target = value.target
-                    if zone.owns('A', target):
-                        hostname = zone.hostname_from_fqdn(target)
-                        if not zone.get(hostname):
-                            reasons.append(
-                                ValidationReason(
-                                    f'SRV record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
-                                    [record],
-                                    validator_id=self.id,
-                                )
-                            )
+        for record in zone.get_by_type('SRV'):
+            for value in record.values:
+                target = value.target
+                if not zone.get_by_fqdn(target) and zone.owns('A', target):
+                    reasons.append(
+                        ValidationReason(
+                            f'SRV record "{record.decoded_fqdn}" points to in-zone target "{target}" that does not exist',
+                            [record],
+                            validator_id=self.id,
+                        )
+                    )
         return reasons
 
 
@@ -94,7 +94,8 @@ class ZoneValidator:
     Zone and may examine any records within it. Because zone validators see
     the whole zone at once, they are suited for cross-record checks (e.g.
     requiring at least two MX values at the apex) that per-record validators
-    cannot perform.
+    cannot perform. Prefer ``Zone.get_by_type``, ``Zone.get_by_fqdn``, and
+    ``Zone.get_references`` over scanning every record, they're indexed.
 
     Every zone validator instance has a non-empty ``id`` — a short, stable,
     kebab-case identifier (e.g. ``'multi-value-mx'``). Config-registered
@@ -41,6 +41,7 @@ def validators_snapshot():
     active_value_snap = {k: dict(v) for k, v in reg.active_value.items()}
     avail_record_snap = {k: dict(v) for k, v in reg.available_record.items()}
     avail_value_snap = {k: dict(v) for k, v in reg.available_value.items()}
+    cache_size_snap = reg._cache_size
     try:
         yield
     finally:
@@ -53,6 +54,8 @@ def validators_snapshot():
         reg.available_record.update(avail_record_snap)
         reg.available_value.clear()
         reg.available_value.update(avail_value_snap)
+        reg.invalidate()
+        reg.enable_cache(cache_size_snap)
 
 
 class SimpleSource(object):
@@ -0,0 +1,137 @@
+#
+#
+#
+
+from collections import Counter
+from os.path import isdir, isfile, join
+from unittest import TestCase
+
+from helpers import TemporaryDirectory
+
+from octodns.bench.generate import KINDS, Generator
+from octodns.bench.runner import BENCHMARKS, Runner, compare
+from octodns.manager import Manager
+from octodns.record import Record
+from octodns.zone import Zone
+
+
+class TestBenchGenerator(TestCase):
+    def test_data(self):
+        generator = Generator(zones=3, records=200, seed=1)
+        data = generator.data()
+        self.assertEqual(
+            ['zone-00000.bench.', 'zone-00001.bench.', 'zone-00002.bench.'],
+            list(data.keys()),
+        )
+        # records are spread across the zones, plus a root NS in each
+        self.assertEqual(
+            [67, 67, 66], [len(records) - 1 for records in data.values()]
+        )
+        # deterministic for a given seed
+        self.assertEqual(data, Generator(zones=3, records=200, seed=1).data())
+        self.assertNotEqual(
+            data, Generator(zones=3, records=200, seed=2).data()
+        )
+
+        # everything is valid and all of the kinds show up
+        kinds = Counter()
+        for zone_name, records in data.items():
+            zone = Zone(zone_name, [])
+            for name, record_data in records.items():
+                record = Record.new(zone, name, record_data)
+                zone.add_record(record)
+                if 'dynamic' in record_data:
+                    kinds['dynamic'] += 1
+                elif 'geo' in record_data:
+                    kinds['geo'] += 1
+                else:
+                    kinds[record._type] += 1
+            zone.validate()
+        self.assertEqual(set(k for k, _ in KINDS) | {'NS'}, set(kinds.keys()))
+        self.assertEqual(3, kinds['NS'])
+
+    def test_write(self):
+        generator = Generator(zones=2, records=20)
+        with TemporaryDirectory() as td:
+            config_file, data = generator.write(td.dirname)
+            self.assertEqual(join(td.dirname, 'config.yaml'), config_file)
+            for zone_name in data:
+                self.assertTrue(
+                    isfile(join(td.dirname, 'zones', f'{zone_name}yaml'))
+                )
+
+            manager = Manager(config_file)
+            self.assertEqual(set(data.keys()), set(manager.config['zones']))
+            zone = Zone('zone-00001.bench.', [])
+            manager.providers['config'].populate(zone)
+            self.assertEqual(len(data['zone-00001.bench.']), len(zone.records))
+
+
+class TestBenchRunner(TestCase):
+    def test_run(self):
+        runner = Runner(zones=2, records=30, repeat=2)
+        results = runner.run()
+        self.assertEqual(
+            {'zones': 2, 'records': 30, 'seed': 42, 'repeat': 2},
+            results['parameters'],
+        )
+        self.assertEqual(list(BENCHMARKS.keys()), list(results['benchmarks']))
+        for name, result in results['benchmarks'].items():
+            self.assertEqual(2, len(result['seconds']), name)
+            self.assertEqual(min(result['seconds']), result['min'])
+            self.assertTrue(result['ops'] > 0, name)
+            self.assertTrue(result['ops_per_second'] > 0, name)
+        # records, including root NSs
+        self.assertEqual(32, results['benchmarks']['record_new']['ops'])
+        # zones
+        self.assertEqual(2, results['benchmarks']['zone_validate']['ops'])
+
+    def test_run_some(self):
+        results = Runner(zones=1, records=5, repeat=1).run(['zone_validate'])
+        self.assertEqual(['zone_validate'], list(results['benchmarks']))
+
+        with self.assertRaises(ValueError) as ctx:
+            Runner(zones=1, records=5).run(['zone_validate', 'nope', 'nada'])
+        self.assertEqual('Unknown benchmark(s): nope, nada', str(ctx.exception))
+
+    def test_run_memory(self):
+        results = Runner(zones=2, records=30, repeat=1).run(['zone_validate'])
+        self.assertNotIn('memory', results)
+
+        results = Runner(zones=2, records=30, repeat=1).run(
+            ['zone_validate'], memory=True
+        )
+        memory = results['memory']
+        self.assertEqual(32, memory['records'])
+        self.assertTrue(memory['bytes'] > 0)
+        self.assertEqual(memory['bytes'] / 32, memory['bytes_per_record'])
+
+    def test_temp_dir_cleaned_up(self):
+        runner = Runner(zones=1, records=5, repeat=1)
+        directories = []
+        bench = BENCHMARKS['zone_validate']
+
+        def spy(ctx):
+            directories.append(ctx.directory)
+            return bench(ctx)
+
+        BENCHMARKS['spy'] = spy
+        try:
+            runner.run(['spy'])
+        finally:
+            del BENCHMARKS['spy']
+        self.assertEqual(1, len(directories))
+        self.assertFalse(isdir(directories[0]))
+
+    def test_compare(self):
+        baseline = {
+            'benchmarks': {'a': {'min': 2.0}, 'b': {'min': 1.0}, 'c': {}}
+        }
+        results = {
+            'benchmarks': {
+                'a': {'min': 1.0},
+                'b': {'min': 1.5},
+                'new': {'min': 1.0},
+            }
+        }
+        self.assertEqual({'a': 0.5, 'b': 1.5}, compare(baseline, results))
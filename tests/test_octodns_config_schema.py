@@ -66,6 +66,9 @@ class TestConfigSchema(TestCase):
             self._base(
                 manager={
                     'max_workers': 4,
+                    'apply_workers': 2,
+                    'plan_workers': 3,
+                    'executor': 'process',
                     'include_meta': True,
                     'enable_checksum': True,
                     'auto_arpa': True,
@@ -76,6 +79,7 @@ class TestConfigSchema(TestCase):
                         'record': {
                             'validators': {'A': ['v1'], '*': ['v2']},
                             'disable_validators': {'AAAA': ['bad-v']},
+                            'cache_size': 10000,
                         },
                         'zone': {
                             'validators': ['my-zone-v'],
@@ -121,6 +125,19 @@ class TestConfigSchema(TestCase):
             self._base(manager={'validators': {'typo_enabled': ['legacy']}})
         )
 
+    def test_validators_record_cache_size(self):
+        self._valid(
+            self._base(manager={'validators': {'record': {'cache_size': 0}}})
+        )
+        self._invalid(
+            self._base(manager={'validators': {'record': {'cache_size': -1}}})
+        )
+        self._invalid(
+            self._base(
+                manager={'validators': {'record': {'cache_size': 'lots'}}}
+            )
+        )
+
     def test_validators_record_unknown_key_rejected(self):
         self._invalid(
             self._base(
@@ -233,6 +250,10 @@ class TestConfigSchema(TestCase):
                         'disable_zonefile': False,
                         'escaped_semicolons': True,
                         'ignore_missing_zones': False,
+                        'cache_dir': './cache',
+                        'cache_max_size': 1048576,
+                        'load_workers': 4,
+                        'load_executor': 'process',
                     }
                 },
                 'zones': {},
@@ -253,6 +274,113 @@ class TestConfigSchema(TestCase):
             }
         )
 
+    def test_yaml_provider_bad_cache_fails(self):
+        for kwargs in (
+            {'cache_dir': 42},
+            {'cache_max_size': -1},
+            {'cache_max_size': '256MiB'},
+        ):
+            self._invalid(
+                {
+                    'providers': {
+                        'config': {
+                            'class': 'octodns.provider.yaml.YamlProvider',
+                            'directory': './zones',
+                            **kwargs,
+                        }
+                    },
+                    'zones': {},
+                }
+            )
+
+    def test_yaml_provider_bad_load_workers_fails(self):
+        for kwargs in (
+            {'load_workers': 0},
+            {'load_workers': '4'},
+            {'load_executor': 'fiber'},
+        ):
+            self._invalid(
+                {
+                    'providers': {
+                        'config': {
+                            'class': 'octodns.provider.yaml.YamlProvider',
+                            'directory': './zones',
+                            **kwargs,
+                        }
+                    },
+                    'zones': {},
+                }
+            )
+
+    def test_json_lines_provider(self):
+        provider = {
+            'class': 'octodns.provider.jsonl.JsonLinesProvider',
+            'directory': './zones',
+        }
+        self._valid({'providers': {'jsonl': provider}, 'zones': {}})
+        self._valid(
+            {
+                'providers': {
+                    'jsonl': {
+                        **provider,
+                        'default_ttl': 3600,
+                        'populate_should_replace': False,
+                        'supports_root_ns': True,
+                        'ignore_missing_zones': True,
+                    }
+                },
+                'zones': {},
+            }
+        )
+        self._invalid(
+            {
+                'providers': {
+                    'jsonl': {
+                        'class': 'octodns.provider.jsonl.JsonLinesProvider'
+                    }
+                },
+                'zones': {},
+            }
+        )
+        for kwargs in ({'default_ttl': -1}, {'ignore_missing_zones': 'yes'}):
+            self._invalid(
+                {'providers': {'jsonl': {**provider, **kwargs}}, 'zones': {}}
+            )
+
+    def test_sqlite_provider(self):
+        provider = {
+            'class': 'octodns.provider.sqlite.SqliteProvider',
+            'path': './zones.db',
+        }
+        self._valid({'providers': {'sqlite': provider}, 'zones': {}})
+        self._valid(
+            {
+                'providers': {
+                    'sqlite': {
+                        **provider,
+                        'populate_should_replace': False,
+                        'supports_root_ns': True,
+                        'ignore_missing_zones': True,
+                    }
+                },
+                'zones': {},
+            }
+        )
+        self._invalid(
+            {
+                'providers': {
+                    'sqlite': {
+                        'class': 'octodns.provider.sqlite.SqliteProvider'
+                    }
+                },
+                'zones': {},
+            }
+        )
+        for kwargs in ({'path': 42}, {'ignore_missing_zones': 'yes'}):
+            self._invalid(
+                {'providers': {'sqlite': {**provider, **kwargs}}, 'zones': {}}
+            )
+
     def test_env_var_source_valid(self):
         self._valid(
             {
@@ -3,8 +3,11 @@
 #
 
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from os import environ, listdir, remove
 from os.path import dirname, isfile, join
+from threading import Event
+from time import sleep
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -22,6 +25,7 @@ from helpers import TestZoneValidator as _TestZoneValidator
 from helpers import validators_snapshot, zone_validators_snapshot
 
 from octodns import __version__
+from octodns import manager as manager_module
 from octodns.context import ContextDict
 from octodns.idna import IdnaDict, idna_encode
 from octodns.manager import (
@@ -29,8 +33,10 @@ from octodns.manager import (
     Manager,
     ManagerException,
     _AggregateTarget,
+    _LazyObjects,
 )
 from octodns.processor.base import BaseProcessor
+from octodns.provider.plan import Plan
 from octodns.provider.yaml import YamlProvider
 from octodns.record import Create, Delete, Record, Update
 from octodns.record.exception import ValidationError as RecordValidationError
@@ -62,33 +68,76 @@ class TestManager(TestCase):
 
     def test_bad_provider_class(self):
         with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('bad-provider-class.yaml')).sync()
+            Manager(
+                get_config_filename('bad-provider-class.yaml')
+            ).validate_configs()
         self.assertIn('Unknown provider class', str(ctx.exception))
 
     def test_bad_provider_class_module(self):
         with self.assertRaises(ManagerException) as ctx:
             Manager(
                 get_config_filename('bad-provider-class-module.yaml')
-            ).sync()
+            ).validate_configs()
         self.assertIn('Unknown provider class', str(ctx.exception))
 
     def test_bad_provider_class_no_module(self):
         with self.assertRaises(ManagerException) as ctx:
             Manager(
                 get_config_filename('bad-provider-class-no-module.yaml')
-            ).sync()
+            ).validate_configs()
+        self.assertIn('Unknown provider class', str(ctx.exception))
+
+    def test_lazy_providers(self):
+        # problems with providers that aren't used don't get in the way
+        manager = Manager(get_config_filename('bad-provider-class.yaml'))
+        self.assertEqual(0, manager.sync())
+        self.assertEqual(['dne'], list(manager.providers))
+        self.assertEqual([], manager.providers.created())
+        # until they're looked up
+        with self.assertRaises(ManagerException) as ctx:
+            manager.providers['dne']
         self.assertIn('Unknown provider class', str(ctx.exception))
 
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+            manager = Manager(get_config_filename('simple.yaml'))
+            self.assertEqual(
+                {'init'}, set(e['phase'] for e in manager.timings.entries)
+            )
+            # only the source and target of the zone we sync are created
+            manager.sync(['unit.tests.'])
+            self.assertEqual(
+                ['in', 'dump'], [n for n, _ in manager.providers.created()]
+            )
+
+        # with a process executor every processor is created up front so
+        # that workers agree with us on things like MetaProcessor's uuid
+        manager = Manager(
+            get_config_filename('processors.yaml'), executor='process'
+        )
+        try:
+            self.assertEqual(
+                list(manager.processors),
+                [n for n, _ in manager.processors.created()],
+            )
+        finally:
+            manager._executor.shutdown()
+
     def test_missing_provider_config(self):
         # Missing provider config
         with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('missing-provider-config.yaml')).sync()
+            Manager(
+                get_config_filename('missing-provider-config.yaml')
+            ).validate_configs()
         self.assertIn('provider config', str(ctx.exception))
 
     def test_missing_env_config(self):
         # details of the EnvironSecrets will be tested in dedicated tests
         with self.assertRaises(EnvironSecretsException) as ctx:
-            Manager(get_config_filename('missing-provider-env.yaml')).sync()
+            Manager(
+                get_config_filename('missing-provider-env.yaml')
+            ).validate_configs()
         self.assertIn('missing env var', str(ctx.exception))
 
     def test_missing_source(self):
@@ -224,6 +273,29 @@ class TestManager(TestCase):
                 any(v.id == 'healthcheck' for v in global_validators)
             )
 
+    def test_config_cache_dir(self):
+        with TemporaryDirectory() as td:
+            config_file = get_config_filename('simple.yaml')
+            expected = Manager(config_file).config
+            manager = Manager(config_file, config_cache_dir=td.dirname)
+            self.assertEqual(expected, manager.config)
+            self.assertEqual(1, len(listdir(td.dirname)))
+            with patch('octodns.yaml.safe_load') as safe_load_mock:
+                manager = Manager(config_file, config_cache_dir=td.dirname)
+            safe_load_mock.assert_not_called()
+            self.assertEqual(expected, manager.config)
+
+    def test_validators_cache(self):
+        with validators_snapshot():
+            Manager(get_config_filename('validators-cache.yaml'))
+            self.assertEqual(42, Record.validators._cache_size)
+            self.assertIsNotNone(Record.validators._cache)
+
+            # it's off by default
+            Manager(get_config_filename('validators-disable.yaml'))
+            self.assertEqual(0, Record.validators._cache_size)
+            self.assertIsNone(Record.validators._cache)
+
     def test_validators_disable_type(self):
         with validators_snapshot():
             Manager(get_config_filename('validators-disable-type.yaml'))
@@ -719,6 +791,587 @@ class TestManager(TestCase):
             # only the stuff from subzone, unit.tests. is always-dry-run
             self.assertEqual(3, tc)
 
+    def test_apply_workers(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+            # not configured, shares the planning executor
+            manager = Manager(get_config_filename('simple.yaml'))
+            self.assertEqual(manager._executor, manager._apply_executor)
+
+            # explicitly configured, dedicated pool
+            manager = Manager(
+                get_config_filename('simple.yaml'), apply_workers=3
+            )
+            self.assertNotEqual(manager._executor, manager._apply_executor)
+            self.assertEqual(3, manager._apply_executor._max_workers)
+            self.assertEqual(28, manager.sync(dry_run=False))
+
+            # single worker, applies on the main thread
+            manager = Manager(
+                get_config_filename('simple.yaml'), apply_workers=1
+            )
+            self.assertIsInstance(manager._apply_executor, MainThreadExecutor)
+
+    def test_plan_workers(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+            # default, targets are planned one after the other
+            manager = Manager(get_config_filename('simple.yaml'))
+            self.assertIsInstance(manager._plan_executor, MainThreadExecutor)
+
+            manager = Manager(
+                get_config_filename('simple.yaml'), plan_workers=3
+            )
+            self.assertIsInstance(manager._plan_executor, ThreadPoolExecutor)
+            self.assertEqual(3, manager._plan_executor._max_workers)
+            self.assertEqual(28, manager.sync(dry_run=False))
+
+        planned = [Event() for _ in range(3)]
+
+        class OrderedTarget(SimpleProvider):
+            def __init__(self, i):
+                self.i = i
+                self.id = f'target-{i}'
+
+            def plan(self, desired, processors=[], lenient=False):
+                # wait for the following target to finish first so that they
+                # complete in reverse order, only possible when concurrent
+                if self.i + 1 < len(planned):
+                    assert planned[self.i + 1].wait(5)
+                planned[self.i].set()
+                return Plan(desired, desired, [], True, meta={'i': self.i})
+
+        targets = [OrderedTarget(i) for i in range(3)]
+        plans, _ = manager._populate_and_plan(
+            'unit.tests.', [], [], targets, zone=Zone('unit.tests.', [])
+        )
+        # results are in targets order regardless of completion order
+        self.assertEqual(targets, [t for t, _ in plans])
+        self.assertEqual([0, 1, 2], [p.meta['i'] for _, p in plans])
+
+    def test_schedule_zones(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+            manager = Manager(get_config_filename('simple.yaml'))
+
+        executor = ThreadPoolExecutor(max_workers=3)
+        alias_planned = Event()
+        started = []
+
+        def populate_and_plan(zone_name, targets, desired=None):
+            if zone_name == 'slow.tests.':
+                # only finishes once the alias, which depends on fast, has
+                # been planned so a slow zone can't hold up unrelated work
+                assert alias_planned.wait(5)
+                sleep(0.05)
+            elif zone_name == 'alias.tests.':
+                assert desired.name == 'fast.tests.'
+                alias_planned.set()
+            return [], Zone(zone_name, [])
+
+        def submit(**kwargs):
+            started.append(kwargs['zone_name'])
+            return executor.submit(populate_and_plan, **kwargs)
+
+        nodes = {
+            'slow.tests.': (
+                submit,
+                {'zone_name': 'slow.tests.', 'targets': []},
+            ),
+            'fast.tests.': (
+                submit,
+                {'zone_name': 'fast.tests.', 'targets': []},
+            ),
+            'alias.tests.': (
+                submit,
+                {'zone_name': 'alias.tests.', 'targets': []},
+            ),
+            '3.2.1.in-addr.arpa.': (
+                submit,
+                {'zone_name': '3.2.1.in-addr.arpa.', 'targets': []},
+            ),
+        }
+        deps = {
+            'slow.tests.': (),
+            'fast.tests.': (),
+            'alias.tests.': ('fast.tests.',),
+            '3.2.1.in-addr.arpa.': (
+                'slow.tests.',
+                'fast.tests.',
+                'alias.tests.',
+            ),
+        }
+        with self.assertLogs('Manager', level='INFO') as ctx:
+            results = manager._schedule_zones(
+                nodes, deps, {'alias.tests.': 'fast.tests.'}
+            )
+        self.assertEqual(set(nodes.keys()), set(results.keys()))
+        for zone_name, (plans, desired) in results.items():
+            self.assertEqual([], plans)
+            self.assertEqual(zone_name, desired.name)
+        # fast has the longest chain waiting on it so it's started first and
+        # arpa waits on everything
+        self.assertEqual(
+            [
+                'fast.tests.',
+                'slow.tests.',
+                'alias.tests.',
+                '3.2.1.in-addr.arpa.',
+            ],
+            started,
+        )
+        self.assertIn(
+            '_schedule_zones: critical path=slow.tests. (', ctx.output[-1]
+        )
+        self.assertIn(') -> 3.2.1.in-addr.arpa. (', ctx.output[-1])
+
+    def test_timings(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+            manager = Manager(get_config_filename('simple.yaml'))
+            manager.sync(dry_run=False)
+            entries = manager.timings.entries
+            self.assertEqual(
+                {'init', 'populate', 'validate', 'plan', 'apply', 'sync'},
+                set(e['phase'] for e in entries),
+            )
+            self.assertIn(
+                {'zone': 'unit.tests.', 'source': 'in'},
+                [
+                    {'zone': e['zone'], 'source': e['source']}
+                    for e in entries
+                    if e['phase'] == 'populate'
+                ],
+            )
+            self.assertEqual(
+                {'dump', 'dump2'},
+                set(
+                    e['target']
+                    for e in entries
+                    if e['phase'] == 'plan'
+                    and e['zone'] == 'subzone.unit.tests.'
+                ),
+            )
+            self.assertEqual(
+                1, len([e for e in entries if e['phase'] == 'sync'])
+            )
+
+            # dry-runs get a sync entry too
+            manager.timings.reset()
+            manager.sync()
+            self.assertEqual(
+                1,
+                len(
+                    [e for e in manager.timings.entries if e['phase'] == 'sync']
+                ),
+            )
+
+            manager.timings.reset()
+            manager.validate_configs()
+            self.assertEqual(
+                {'populate', 'validate'},
+                set(e['phase'] for e in manager.timings.entries),
+            )
+
+            manager.timings.reset()
+            manager.dump(
+                zone='unit.tests.', output_dir=tmpdir.dirname, sources=['in']
+            )
+            self.assertEqual(
+                {'populate', 'validate', 'plan', 'apply'},
+                set(e['phase'] for e in manager.timings.entries),
+            )
+
+    def _apply_plan(self, zone_name):
+        zone = Zone(zone_name, [])
+        return Plan(zone, zone, [], True)
+
+    def test_apply_waves(self):
+        plans = [
+            (SimpleProvider(), self._apply_plan(name))
+            for name in (
+                'unit.tests.',
+                'sub.unit.tests.',
+                'deep.sub.unit.tests.',
+                'gap.missing.unit.tests.',
+                'other.tests.',
+            )
+        ]
+        waves = Manager._apply_waves(plans)
+        self.assertEqual(
+            [
+                [
+                    'deep.sub.unit.tests.',
+                    'gap.missing.unit.tests.',
+                    'other.tests.',
+                ],
+                ['sub.unit.tests.'],
+                ['unit.tests.'],
+            ],
+            [[p.desired.name for _, p in wave] for wave in waves],
+        )
+
+        # the same zone to multiple targets shares a wave
+        a = self._apply_plan('unit.tests.')
+        b = self._apply_plan('unit.tests.')
+        self.assertEqual(
+            [[(None, a), (None, b)]],
+            Manager._apply_waves([(None, a), (None, b)]),
+        )
+
+        self.assertEqual([], Manager._apply_waves([]))
+
+    def test_apply_plans(self):
+        applied = []
+
+        class ApplyingTarget:
+            def __init__(self, id, fail=()):
+                self.id = id
+                self.fail = fail
+
+            def apply(self, plan):
+                name = plan.desired.name
+                if name in self.fail:
+                    raise Exception(f'boom {name}')
+                applied.append((self.id, name))
+                return 2
+
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+            manager = Manager(get_config_filename('simple.yaml'))
+
+        one = ApplyingTarget('one')
+        two = ApplyingTarget('two', fail=('sub.unit.tests.',))
+        plans = [
+            (one, self._apply_plan('unit.tests.')),
+            (two, self._apply_plan('unit.tests.')),
+            (one, self._apply_plan('sub.unit.tests.')),
+            (one, self._apply_plan('other.tests.')),
+        ]
+        self.assertEqual(8, manager._apply_plans(plans))
+        # children before parents
+        self.assertEqual(
+            [
+                ('one', 'sub.unit.tests.'),
+                ('one', 'other.tests.'),
+                ('one', 'unit.tests.'),
+                ('two', 'unit.tests.'),
+            ],
+            applied,
+        )
+
+        # failures are collected, independent plans still apply, and parents
+        # of failed zones are skipped
+        applied.clear()
+        plans.append((two, self._apply_plan('sub.unit.tests.')))
+        with self.assertRaises(ManagerException) as ctx:
+            manager._apply_plans(plans)
+        msg = str(ctx.exception)
+        self.assertTrue(msg.startswith('3 of 5 plans failed to apply'))
+        self.assertIn('sub.unit.tests. (two): boom sub.unit.tests.', msg)
+        self.assertIn('unit.tests. (one): skipped, sub-zone apply failed', msg)
+        self.assertIn('unit.tests. (two): skipped, sub-zone apply failed', msg)
+        self.assertEqual('boom sub.unit.tests.', str(ctx.exception.__cause__))
+        self.assertEqual(
+            [('one', 'sub.unit.tests.'), ('one', 'other.tests.')], applied
+        )
+
+        # a zone's targets are applied one at a time, even with workers to
+        # spare, as they may share resources
+        active = []
+        overlapped = []
+
+        class SlowTarget:
+            def __init__(self, id):
+                self.id = id
+
+            def apply(self, plan):
+                active.append(self.id)
+                if len(active) > 1:
+                    overlapped.append(self.id)
+                sleep(0.02)
+                active.remove(self.id)
+                return 1
+
+        manager._apply_executor = ThreadPoolExecutor(max_workers=3)
+        plans = [
+            (SlowTarget(str(i)), self._apply_plan('unit.tests.'))
+            for i in range(3)
+        ]
+        self.assertEqual(3, manager._apply_plans(plans))
+        self.assertEqual([], overlapped)
+
+    def test_process_executor(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+            manager = Manager(
+                get_config_filename('simple.yaml'), executor='process'
+            )
+            self.assertIsInstance(manager._executor, ProcessPoolExecutor)
+            # applies can't happen in workers, they get their own threads
+            self.assertIsInstance(manager._apply_executor, ThreadPoolExecutor)
+            self.assertEqual(2, manager._apply_executor._max_workers)
+            try:
+                self.assertEqual(28, manager.sync(dry_run=False))
+            finally:
+                manager._executor.shutdown()
+
+            # single worker applies on the main thread
+            manager = Manager(
+                get_config_filename('simple.yaml'),
+                executor='process',
+                max_workers=1,
+            )
+            self.assertIsInstance(manager._apply_executor, MainThreadExecutor)
+
+            with self.assertRaises(ManagerException) as ctx:
+                Manager(get_config_filename('simple.yaml'), executor='nope')
+            self.assertEqual(
+                'Unknown executor "nope", options are "thread" and "process"',
+                str(ctx.exception),
+            )
+
+    def test_process_executor_auto_arpa_and_aliases(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+            for config, expected in (
+                ('simple-arpa.yaml', 26),
+                ('simple-alias-zone.yaml', 44),
+            ):
+                reset(tmpdir.dirname)
+                manager = Manager(
+                    get_config_filename(config), executor='process'
+                )
+                try:
+                    self.assertEqual(expected, manager.sync(dry_run=False))
+                finally:
+                    manager._executor.shutdown()
+
+    def test_process_worker(self):
+        # exercises the worker side in-process so that we can poke at it
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+
+            filename = get_config_filename('simple-arpa.yaml')
+            manager_module._process_worker_init(
+                filename,
+                {'include_meta': True},
+                {'meta': {'meta': ('the-time', 'the-uuid')}},
+            )
+            worker = manager_module._worker_manager
+            self.assertIsInstance(worker._executor, MainThreadExecutor)
+            self.assertEqual('the-time', worker.processors['meta'].time)
+            self.assertEqual('the-uuid', worker.processors['meta'].uuid)
+
+            manager = Manager(filename, max_workers=1, include_meta=True)
+            self.assertEqual(
+                {'meta': {'meta': (None, None)}}, manager._worker_state
+            )
+            manager_module._process_worker_init(
+                filename, {'include_meta': True}, manager._worker_state
+            )
+            worker = manager_module._worker_manager
+            # stale state from a previous zone is dropped
+            worker.processors['auto-arpa']._records['junk.'].append(None)
+            memo = {}
+            plans, desired, arpa, timings = (
+                manager_module._process_populate_and_plan(
+                    manager_module._pack_zone(
+                        manager.get_zone('unit.tests.'), memo
+                    ),
+                    [p.id for p in manager._get_processors('unit.tests.', {})],
+                    ['in'],
+                    ['dump'],
+                )
+            )
+            self.assertNotIn('junk.', arpa)
+            # the worker's timings are shipped back and only cover this zone
+            origin, entries = timings
+            self.assertEqual(worker.timings.origin, origin)
+            self.assertEqual(
+                {
+                    'populate',
+                    'process_source_zone',
+                    'validate',
+                    'plan',
+                    'process_plan',
+                },
+                set(e['phase'] for e in entries),
+            )
+            self.assertIn('4.3.2.1.in-addr.arpa.', arpa)
+
+            # unpack it like the manager would and compare with what we get
+            # planning locally
+            future = manager_module._PackedPlansFuture(manager, MagicMock())
+            future.future.result.return_value = (plans, desired, arpa, timings)
+            plans, desired = future.result()
+            # and merged into ours
+            self.assertEqual(
+                len(entries),
+                len(
+                    [
+                        e
+                        for e in manager.timings.entries
+                        if e.get('zone') == 'unit.tests.'
+                    ]
+                ),
+            )
+            expected, expected_desired = manager._populate_and_plan(
+                'unit.tests.',
+                manager._get_processors('unit.tests.', {}),
+                [manager.providers['in']],
+                [manager.providers['dump']],
+            )
+            self.assertEqual(
+                [(t.id, p.data) for t, p in expected],
+                [(t.id, p.data) for t, p in plans],
+            )
+            self.assertEqual(
+                {(r.name, r._type): r.data for r in expected_desired.records},
+                {(r.name, r._type): r.data for r in desired.records},
+            )
+            self.assertEqual(expected_desired.root_ns, desired.root_ns)
+            # the records were contributed to our auto-arpa, twice, once via
+            # the worker and once locally
+            auto_arpa = manager.processors['auto-arpa']
+            self.assertEqual(
+                2, len(auto_arpa._records['4.3.2.1.in-addr.arpa.'])
+            )
+
+            # targets are populated in this process before applying plans
+            # made by workers, but only once and not for local plans
+            target, plan = plans[0]
+            self.assertEqual({id(plan)}, manager._worker_plans)
+            local_target, local_plan = expected[0]
+            with patch.object(
+                target, 'populate', wraps=target.populate
+            ) as populate_mock:
+                self.assertTrue(manager._apply_plan(target, plan))
+                populate_mock.assert_called_once()
+                existing = populate_mock.call_args[0][0]
+                self.assertEqual('unit.tests.', existing.name)
+                self.assertEqual(
+                    {'target': True, 'lenient': True},
+                    populate_mock.call_args[1],
+                )
+                self.assertEqual(set(), manager._worker_plans)
+                populate_mock.reset_mock()
+                manager._apply_plan(local_target, local_plan)
+                populate_mock.assert_not_called()
+
+            # records w/sources are hooked back up to ours
+            record = next(iter(desired.records))
+            self.assertEqual(manager.providers['in'], record.source)
+            self.assertIsNone(manager._find_source(None))
+            self.assertEqual(auto_arpa, manager._find_source('auto-arpa'))
+            self.assertIsNone(manager._find_source('unknown'))
+
+            # alias zones ship their desired state to the worker
+            plans, aliased, _, _ = manager_module._process_populate_and_plan(
+                manager_module._pack_zone(
+                    manager.get_zone('unit.tests.'), memo
+                ),
+                [],
+                [],
+                ['dump'],
+                desired=manager_module._pack_zone(desired, memo),
+            )
+            aliased = manager._unpack_zone(aliased, {})
+            self.assertEqual(len(desired.records), len(aliased.records))
+
+            # without auto-arpa there's nothing to ship back
+            manager_module._process_worker_init(
+                get_config_filename('simple.yaml'), {}, {}
+            )
+            _, _, arpa, _ = manager_module._process_populate_and_plan(
+                manager_module._pack_zone(Zone('unit.tests.', []), {}),
+                [],
+                ['in'],
+                ['dump'],
+            )
+            self.assertIsNone(arpa)
+
+    def test_pack_plan(self):
+        with TemporaryDirectory() as tmpdir:
+            environ['YAML_TMP_DIR'] = tmpdir.dirname
+            environ['YAML_TMP_DIR2'] = tmpdir.dirname
+            manager = Manager(get_config_filename('simple.yaml'))
+        source = manager.providers['in']
+
+        existing = Zone('unit.tests.', [])
+        desired = Zone('unit.tests.', [])
+        for name, zone, value in (
+            ('deleted', existing, '1.1.1.1'),
+            ('updated', existing, '2.2.2.2'),
+            ('updated', desired, '3.3.3.3'),
+            ('created', desired, '4.4.4.4'),
+        ):
+            record = Record.new(
+                zone,
+                name,
+                {'type': 'A', 'ttl': 42, 'value': value},
+                source=source,
+            )
+            zone.add_record(record)
+        ns = Record.new(
+            desired, '', {'type': 'NS', 'ttl': 42, 'value': 'ns.unit.tests.'}
+        )
+        desired.add_record(ns)
+        plan = Plan(
+            existing,
+            desired,
+            [
+                Delete(existing.get_type('deleted', 'A')),
+                Update(
+                    existing.get_type('updated', 'A'),
+                    desired.get_type('updated', 'A'),
+                ),
+                Create(desired.get_type('created', 'A')),
+                Create(ns),
+            ],
+            True,
+            meta={'some': 'thing'},
+        )
+
+        memo = {}
+        unpacked = manager._unpack_plan(
+            manager_module._pack_plan(plan, memo), {}
+        )
+        self.assertEqual(plan.data, unpacked.data)
+        self.assertEqual(plan.exists, unpacked.exists)
+        self.assertEqual(plan.meta, unpacked.meta)
+        self.assertEqual(
+            [c.__class__ for c in plan.changes],
+            [c.__class__ for c in unpacked.changes],
+        )
+        self.assertEqual(3, len(unpacked.desired.records))
+        self.assertEqual(ns, unpacked.desired.root_ns)
+        # records are shared between the zones and changes rather than
+        # shipped/built twice
+        created = unpacked.desired.get_type('created', 'A')
+        self.assertIs(
+            created,
+            [
+                c.new
+                for c in unpacked.changes
+                if isinstance(c, Create) and c.new.name == 'created'
+            ][0],
+        )
+        self.assertEqual(source, created.source)
+        self.assertIsNone(unpacked.desired.root_ns.source)
+
     def test_simple(self):
         with TemporaryDirectory() as tmpdir:
             environ['YAML_TMP_DIR'] = tmpdir.dirname
@@ -1497,7 +2150,9 @@ class TestManager(TestCase):
         )
 
         with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('processors-wants-config.yaml'))
+            Manager(
+                get_config_filename('processors-wants-config.yaml')
+            ).validate_configs()
         self.assertTrue(
             'Incorrect processor config for wants-config' in str(ctx.exception)
         )
@@ -2501,6 +3156,101 @@ class TestManager(TestCase):
         )
 
 
+class TestLazyObjects(TestCase):
+    def test_lazy(self):
+        created = []
+
+        def factory(name):
+            def create():
+                created.append(name)
+                return f'obj-{name}'
+
+            return create
+
+        objects = _LazyObjects()
+        objects.add_factory('a', factory('a'))
+        objects.add_factory('b', factory('b'))
+        objects['c'] = 'obj-c'
+
+        # none of these create anything
+        self.assertEqual(['a', 'b', 'c'], list(objects))
+        self.assertEqual(3, len(objects))
+        self.assertIn('a', objects)
+        self.assertNotIn('d', objects)
+        self.assertEqual([('c', 'obj-c')], objects.created())
+        self.assertEqual([], created)
+
+        # look ups do, once
+        self.assertEqual('obj-b', objects['b'])
+        self.assertEqual('obj-b', objects.get('b'))
+        self.assertEqual(['b'], created)
+        self.assertIsNone(objects.get('d'))
+        with self.assertRaises(KeyError):
+            objects['d']
+
+        # replacing or removing a pending object means it's never created
+        objects['a'] = 'other-a'
+        objects.add_factory('e', factory('e'))
+        del objects['e']
+        self.assertEqual(
+            {'a': 'other-a', 'b': 'obj-b', 'c': 'obj-c'}, dict(objects.items())
+        )
+        self.assertEqual(['b'], created)
+        with self.assertRaises(KeyError):
+            del objects['e']
+
+        objects.add_factory('f', factory('f'))
+        objects.create_all()
+        self.assertEqual(['b', 'f'], created)
+        self.assertEqual(4, len(objects.created()))
+
+    def test_failed_create(self):
+        attempts = []
+
+        def create():
+            attempts.append(True)
+            if len(attempts) < 3:
+                raise ValueError('bad config')
+            return 'obj'
+
+        objects = _LazyObjects()
+        objects.add_factory('p', create)
+        # the error is raised every time until it succeeds
+        for _ in range(2):
+            with self.assertRaises(ValueError) as ctx:
+                objects['p']
+            self.assertEqual('bad config', str(ctx.exception))
+            self.assertIn('p', objects)
+            self.assertEqual([], objects.created())
+        self.assertEqual('obj', objects['p'])
+        self.assertEqual('obj', objects['p'])
+        self.assertEqual(3, len(attempts))
+        self.assertEqual({}, objects._factories)
+
+    def test_concurrent(self):
+        # only one of several threads looking up the same thing creates it
+        started = Event()
+        created = []
+
+        def create():
+            started.set()
+            sleep(0.05)
+            created.append(True)
+            return object()
+
+        objects = _LazyObjects()
+        objects.add_factory('slow', create)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(objects.__getitem__, 'slow')]
+            started.wait()
+            futures += [
+                executor.submit(objects.__getitem__, 'slow') for _ in range(3)
+            ]
+            results = set(id(f.result()) for f in futures)
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, len(created))
+
+
 class TestMainThreadExecutor(TestCase):
     def test_success(self):
         mte = MainThreadExecutor()
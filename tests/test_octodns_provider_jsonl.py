@@ -0,0 +1,459 @@
+#
+#
+#
+
+from json import loads
+from os import environ, listdir, makedirs
+from os.path import dirname, isfile, join
+from unittest import TestCase
+from unittest.mock import patch
+
+from helpers import TemporaryDirectory
+
+from octodns.manager import Manager
+from octodns.provider import ProviderException
+from octodns.provider.jsonl import JsonLinesProvider
+from octodns.provider.yaml import YamlProvider
+from octodns.record import Create, Delete, Record, Update
+from octodns.zone import DuplicateRecordException, Zone
+
+
+def write_lines(filename, *lines):
+    with open(filename, 'w') as fh:
+        fh.write(''.join(lines))
+
+
+class TestJsonLinesProvider(TestCase):
+    def test_provider(self):
+        source = YamlProvider('test', join(dirname(__file__), 'config'))
+        zone = Zone('unit.tests.', [])
+        source.populate(zone)
+        self.assertEqual(25, len(zone.records))
+        dynamic_zone = Zone('dynamic.tests.', [])
+        source.populate(dynamic_zone)
+        self.assertEqual(6, len(dynamic_zone.records))
+
+        with TemporaryDirectory() as td:
+            # Add some subdirs to make sure that it can create them
+            directory = join(td.dirname, 'sub', 'dir')
+            filename = join(directory, 'unit.tests.jsonl')
+            target = JsonLinesProvider(
+                'test', directory, supports_root_ns=False, strict_supports=False
+            )
+
+            # We add everything
+            plan = target.plan(zone)
+            self.assertEqual(
+                22, len([c for c in plan.changes if isinstance(c, Create)])
+            )
+            self.assertFalse(isfile(filename))
+            self.assertEqual(22, target.apply(plan))
+            self.assertTrue(isfile(filename))
+
+            plan = target.plan(dynamic_zone)
+            self.assertEqual(6, target.apply(plan))
+
+            # one record per line, sorted, with its name and type
+            with open(filename) as fh:
+                lines = [loads(line) for line in fh]
+            self.assertEqual(22, len(lines))
+            self.assertEqual(
+                {'name': '', 'type': 'A'},
+                {k: lines[0][k] for k in ('name', 'type')},
+            )
+            self.assertIn('geo', lines[0])
+
+            # There should be no changes after the round trip
+            for zone_name, expected in (
+                ('unit.tests.', zone),
+                ('dynamic.tests.', dynamic_zone),
+            ):
+                reloaded = Zone(zone_name, [])
+                target.populate(reloaded)
+                if expected.root_ns:
+                    reloaded.add_record(expected.root_ns)
+                self.assertFalse(expected.changes(reloaded, target=source))
+
+            # A 2nd sync should result in no changes, thus no plan
+            self.assertFalse(target.plan(zone))
+
+            self.assertEqual(
+                ['dynamic.tests.', 'unit.tests.'], target.list_zones()
+            )
+
+    def test_list_zones(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            for name in (
+                'unit.tests.jsonl',
+                'sub.unit.tests.jsonl',
+                'other.tests.yaml',
+                'tests.jsonl',
+            ):
+                write_lines(join(directory, name))
+            makedirs(join(directory, 'dir.tests.jsonl'))
+
+            provider = JsonLinesProvider('test', directory)
+            self.assertEqual(
+                ['sub.unit.tests.', 'unit.tests.'], provider.list_zones()
+            )
+
+    def test_missing(self):
+        with TemporaryDirectory() as td:
+            provider = JsonLinesProvider('test', td.dirname)
+            zone = Zone('unit.tests.', [])
+            with self.assertRaises(ProviderException) as ctx:
+                provider.populate(zone)
+            self.assertEqual(
+                'no JSON Lines file found for unit.tests.', str(ctx.exception)
+            )
+
+            # fine as a target
+            self.assertFalse(provider.populate(zone, target=True))
+
+            # and when told to ignore them
+            provider = JsonLinesProvider(
+                'test', td.dirname, ignore_missing_zones=True
+            )
+            self.assertFalse(provider.populate(zone))
+            self.assertEqual(0, len(zone.records))
+
+    def test_idna(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            provider = JsonLinesProvider('test', directory)
+            zone = Zone('déjà.vu.', [])
+            utf8 = join(directory, 'déjà.vu.jsonl')
+            idna = join(directory, 'xn--dj-kia8a.vu.jsonl')
+
+            # UTF-8 is preferred
+            self.assertEqual(utf8, provider._filename(zone))
+
+            # but IDNA is used if it's what's there
+            write_lines(idna, '{"name":"a","type":"A","value":"1.2.3.4"}\n')
+            self.assertEqual(idna, provider._filename(zone))
+            self.assertTrue(provider.populate(zone))
+            self.assertEqual(1, len(zone.records))
+
+            # both is an error
+            write_lines(utf8)
+            with self.assertRaises(ProviderException) as ctx:
+                provider._filename(zone)
+            self.assertEqual(
+                f'Both UTF-8 "{utf8}" and IDNA "{idna}" exist for déjà.vu.',
+                str(ctx.exception),
+            )
+
+    def test_populate_lines(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            filename = join(directory, 'unit.tests.jsonl')
+            write_lines(
+                filename,
+                '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                '{"name":"b","type":"A","value":"2.3.4.5","ttl":42}\n',
+                '\n',
+                '{"name":"c","type":"A","value":"3.4.5.6"}\n',
+                # replaces the first a
+                '{"name":"a","type":"A","value":"4.5.6.7"}\n',
+                # removes c
+                '{"deleted":true,"name":"c","type":"A"}\n',
+                # deleting something that doesn't exist is a no-op
+                '{"deleted":true,"name":"d","type":"A"}\n',
+                # adds a different type with the same name
+                '{"name":"a","type":"AAAA","value":"2601::1"}\n',
+            )
+
+            provider = JsonLinesProvider('test', directory, default_ttl=300)
+            zone = Zone('unit.tests.', [])
+            self.assertTrue(provider.populate(zone))
+            records = {(r.name, r._type): r for r in zone.records}
+            self.assertEqual(
+                {('a', 'A'), ('a', 'AAAA'), ('b', 'A')}, set(records.keys())
+            )
+            self.assertEqual(['4.5.6.7'], records[('a', 'A')].values)
+            self.assertEqual(300, records[('a', 'A')].ttl)
+            self.assertEqual(42, records[('b', 'A')].ttl)
+            self.assertEqual(8, provider._lines['unit.tests.'])
+
+            # duplicates across populates aren't replaced unless configured
+            with self.assertRaises(DuplicateRecordException):
+                provider.populate(zone)
+            provider = JsonLinesProvider(
+                'test', directory, populate_should_replace=True
+            )
+            self.assertTrue(provider.populate(zone))
+            self.assertEqual(3, len(zone.records))
+
+    def test_populate_invalid(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            filename = join(directory, 'unit.tests.jsonl')
+            provider = JsonLinesProvider('test', directory)
+
+            write_lines(
+                filename,
+                '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                '{"name":"b",\n',
+                '{"name":"c","type":"A","value":"1.2.3.4"}\n',
+            )
+            with self.assertRaises(ProviderException) as ctx:
+                provider.populate(Zone('unit.tests.', []))
+            self.assertEqual(
+                f'Invalid JSON, {filename}, line 2', str(ctx.exception)
+            )
+
+            # every line needs a name, and so has to be an object
+            for line in (
+                '{"type":"A","value":"1.2.3.4"}\n',
+                '["b","A"]\n',
+                '"b"\n',
+            ):
+                write_lines(
+                    filename,
+                    '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                    line,
+                )
+                with self.assertRaises(ProviderException) as ctx:
+                    provider.populate(Zone('unit.tests.', []))
+                self.assertEqual(
+                    f'Missing name, {filename}, line 2', str(ctx.exception)
+                )
+
+            # validation errors include the file and line
+            write_lines(
+                filename,
+                '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                '{"name":"b","type":"A","value":"nope"}\n',
+            )
+            with self.assertRaises(Exception) as ctx:
+                provider.populate(Zone('unit.tests.', []))
+            self.assertIn(f'{filename}, line 2', str(ctx.exception))
+
+            # an incomplete last line is ignored, e.g. an interrupted append
+            write_lines(
+                filename,
+                '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                '{"name":"b","type":"A","val',
+            )
+            zone = Zone('unit.tests.', [])
+            with self.assertLogs('JsonLinesProvider[test]', 'WARNING') as logs:
+                self.assertTrue(provider.populate(zone))
+            self.assertIn('line 2', logs.output[0])
+            self.assertEqual(['a'], [r.name for r in zone.records])
+            # and the file can't be appended to
+            self.assertIsNone(provider._lines['unit.tests.'])
+
+            # which means the next apply rewrites it
+            record = Record.new(
+                zone, 'c', {'type': 'A', 'ttl': 30, 'value': '2.3.4.5'}
+            )
+            desired = zone.copy()
+            desired.add_record(record)
+            provider.apply(provider.plan(desired))
+            with open(filename) as fh:
+                self.assertEqual(
+                    [
+                        '{"name":"a","ttl":3600,"type":"A","value":"1.2.3.4"}\n',
+                        '{"name":"c","ttl":30,"type":"A","value":"2.3.4.5"}\n',
+                    ],
+                    fh.readlines(),
+                )
+
+            # a complete last line without a newline, e.g. written by hand,
+            # is loaded but can't be appended to either
+            write_lines(
+                filename,
+                '{"name":"a","type":"A","value":"1.2.3.4"}\n',
+                '{"name":"b","type":"A","value":"2.3.4.5"}',
+            )
+            zone = Zone('unit.tests.', [])
+            self.assertTrue(provider.populate(zone))
+            self.assertEqual(2, len(zone))
+            self.assertIsNone(provider._lines['unit.tests.'])
+            desired = zone.copy()
+            desired.add_record(record)
+            provider.apply(provider.plan(desired))
+            reloaded = Zone('unit.tests.', [])
+            provider.populate(reloaded)
+            self.assertEqual(['a', 'b', 'c'], sorted(r.name for r in reloaded))
+            self.assertEqual(3, provider._lines['unit.tests.'])
+
+    def test_apply_append(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            filename = join(directory, 'unit.tests.jsonl')
+            provider = JsonLinesProvider('test', directory)
+
+            def read():
+                with open(filename) as fh:
+                    return fh.readlines()
+
+            zone = Zone('unit.tests.', [])
+            for name in ('a', 'b', 'c', 'd'):
+                zone.add_record(
+                    Record.new(
+                        zone, name, {'type': 'A', 'ttl': 30, 'value': '1.1.1.1'}
+                    )
+                )
+            # nothing there yet so it's written out in full
+            provider.apply(provider.plan(zone))
+            initial = read()
+            self.assertEqual(4, len(initial))
+
+            # an update and a delete are appended
+            desired = zone.copy()
+            a = Record.new(
+                desired, 'a', {'type': 'A', 'ttl': 30, 'value': '2.2.2.2'}
+            )
+            desired.add_record(a, replace=True)
+            desired.remove_record(
+                next(r for r in zone.records if r.name == 'd')
+            )
+            plan = provider.plan(desired)
+            self.assertEqual(
+                [Delete, Update], [c.__class__ for c in plan.changes]
+            )
+            provider.apply(plan)
+            self.assertEqual(
+                initial
+                + [
+                    '{"deleted":true,"name":"d","type":"A"}\n',
+                    '{"name":"a","ttl":30,"type":"A","value":"2.2.2.2"}\n',
+                ],
+                read(),
+            )
+
+            # and it all reads back
+            reloaded = Zone('unit.tests.', [])
+            provider.populate(reloaded)
+            self.assertFalse(desired.changes(reloaded, provider))
+
+            # appending only happens when we populated the existing zone
+            del provider._lines['unit.tests.']
+            desired = reloaded.copy()
+            e = Record.new(
+                desired, 'e', {'type': 'A', 'ttl': 30, 'value': '3.3.3.3'}
+            )
+            desired.add_record(e)
+            plan = provider.plan(desired)
+            provider._lines.clear()
+            provider.apply(plan)
+            lines = read()
+            self.assertEqual(4, len(lines))
+            self.assertEqual(
+                '{"name":"e","ttl":30,"type":"A","value":"3.3.3.3"}\n',
+                lines[-1],
+            )
+
+            # once the file would be more than twice the size of the zone it's
+            # rewritten
+            desired = desired.copy()
+            for name in ('a', 'b', 'c'):
+                desired.add_record(
+                    Record.new(
+                        desired,
+                        name,
+                        {'type': 'A', 'ttl': 60, 'value': '4.4.4.4'},
+                    ),
+                    replace=True,
+                )
+            # 4 + 3 is fine
+            provider.apply(provider.plan(desired))
+            self.assertEqual(7, len(read()))
+            # 7 + 2 is too many
+            desired = desired.copy()
+            for name in ('a', 'b'):
+                desired.add_record(
+                    Record.new(
+                        desired,
+                        name,
+                        {'type': 'A', 'ttl': 90, 'value': '4.4.4.4'},
+                    ),
+                    replace=True,
+                )
+            provider.apply(provider.plan(desired))
+            lines = read()
+            self.assertEqual(4, len(lines))
+            self.assertEqual(
+                '{"name":"a","ttl":90,"type":"A","value":"4.4.4.4"}\n', lines[0]
+            )
+
+    def test_apply_atomic(self):
+        with TemporaryDirectory() as td:
+            directory = td.dirname
+            filename = join(directory, 'unit.tests.jsonl')
+            write_lines(filename, '{"name":"a","type":"A","value":"1.2.3.4"}')
+            provider = JsonLinesProvider('test', directory)
+
+            zone = Zone('unit.tests.', [])
+            zone.add_record(
+                Record.new(
+                    zone, 'b', {'type': 'A', 'ttl': 30, 'value': '2.3.4.5'}
+                )
+            )
+            with self.assertLogs('JsonLinesProvider[test]', 'WARNING'):
+                plan = provider.plan(zone)
+
+            with patch('octodns.provider.jsonl.replace') as replace_mock:
+                replace_mock.side_effect = OSError('boom')
+                with self.assertRaises(OSError):
+                    provider.apply(plan)
+            # original untouched and the temp file cleaned up
+            with open(filename) as fh:
+                self.assertEqual(
+                    '{"name":"a","type":"A","value":"1.2.3.4"}', fh.read()
+                )
+            self.assertEqual(['unit.tests.jsonl'], listdir(directory))
+
+            # failing to create the temp file has nothing to clean up
+            with patch('builtins.open') as open_mock:
+                open_mock.side_effect = OSError('boom')
+                with self.assertRaises(OSError):
+                    provider.apply(plan)
+            self.assertEqual(['unit.tests.jsonl'], listdir(directory))
+
+    def test_copy(self):
+        provider = JsonLinesProvider(
+            'test', 'some/dir', default_ttl=42, ignore_missing_zones=True
+        )
+        provider._lines['unit.tests.'] = 4
+        copy = provider.copy()
+        self.assertEqual('test-copy', copy.id)
+        self.assertEqual('some/dir', copy.directory)
+        self.assertEqual(42, copy.default_ttl)
+        self.assertTrue(copy.ignore_missing_zones)
+        self.assertEqual({}, copy._lines)
+
+    def test_supports(self):
+        provider = JsonLinesProvider('test', 'some/dir')
+        self.assertTrue(provider.supports(None))
+        self.assertIn('A', provider.SUPPORTS)
+        self.assertTrue(provider.SUPPORTS_ROOT_NS)
+        provider = JsonLinesProvider('test', 'some/dir', supports_root_ns=False)
+        self.assertFalse(provider.SUPPORTS_ROOT_NS)
+
+    def test_dump_output_provider(self):
+        with TemporaryDirectory() as td:
+            environ['YAML_TMP_DIR'] = td.dirname
+            environ['YAML_TMP_DIR2'] = td.dirname
+            manager = Manager(join(dirname(__file__), 'config', 'simple.yaml'))
+            manager.providers['jsonl'] = JsonLinesProvider(
+                'jsonl', join(td.dirname, 'elsewhere')
+            )
+            output_dir = join(td.dirname, 'dump')
+            manager.dump(
+                zone='unit.tests.',
+                output_dir=output_dir,
+                output_provider='jsonl',
+                sources=['in'],
+            )
+            self.assertEqual(['unit.tests.jsonl'], listdir(output_dir))
+
+            # which can then be used as a source
+            source = JsonLinesProvider('jsonl', output_dir)
+            zone = Zone('unit.tests.', [])
+            source.populate(zone)
+            expected = Zone('unit.tests.', [])
+            manager.providers['in'].populate(expected)
+            self.assertFalse(expected.changes(zone, source))
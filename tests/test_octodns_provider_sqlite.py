@@ -0,0 +1,238 @@
+#
+#
+#
+
+import sqlite3
+from json import loads
+from os.path import dirname, isfile, join
+from unittest import TestCase
+from unittest.mock import patch
+
+from helpers import TemporaryDirectory
+
+from octodns.idna import idna_encode
+from octodns.provider import ProviderException
+from octodns.provider.sqlite import SqliteProvider
+from octodns.provider.yaml import YamlProvider
+from octodns.record import Create, Record
+from octodns.record.exception import ValidationError
+from octodns.zone import DuplicateRecordException, Zone
+
+
+class TestSqliteProvider(TestCase):
+    def test_provider(self):
+        source = YamlProvider('test', join(dirname(__file__), 'config'))
+        zone = Zone('unit.tests.', [])
+        source.populate(zone)
+        self.assertEqual(25, len(zone.records))
+        dynamic_zone = Zone('dynamic.tests.', [])
+        source.populate(dynamic_zone)
+        self.assertEqual(6, len(dynamic_zone.records))
+
+        with TemporaryDirectory() as td:
+            # Add some subdirs to make sure that it can create them
+            path = join(td.dirname, 'sub', 'dir', 'zones.db')
+            target = SqliteProvider(
+                'test', path, supports_root_ns=False, strict_supports=False
+            )
+
+            # We add everything
+            plan = target.plan(zone)
+            self.assertEqual(
+                22, len([c for c in plan.changes if isinstance(c, Create)])
+            )
+            self.assertEqual(22, target.apply(plan))
+            self.assertTrue(isfile(path))
+
+            plan = target.plan(dynamic_zone)
+            self.assertEqual(6, target.apply(plan))
+
+            self.assertEqual(
+                ['dynamic.tests.', 'unit.tests.'], target.list_zones()
+            )
+
+            # There should be no changes after the round trip
+            for zone_name, expected in (
+                ('unit.tests.', zone),
+                ('dynamic.tests.', dynamic_zone),
+            ):
+                reloaded = Zone(zone_name, [])
+                self.assertTrue(target.populate(reloaded))
+                if expected.root_ns:
+                    reloaded.add_record(expected.root_ns)
+                self.assertFalse(expected.changes(reloaded, target=source))
+
+            # A 2nd sync should result in no changes, thus no plan
+            self.assertFalse(target.plan(zone))
+
+            # the data is stored as we'd expect and the database is in WAL
+            # mode
+            target.close()
+            conn = sqlite3.connect(path)
+            self.assertEqual(
+                'wal', conn.execute('PRAGMA journal_mode').fetchone()[0]
+            )
+            _type, data = conn.execute(
+                'SELECT type, data FROM records WHERE zone = ? AND name = ?',
+                ('unit.tests.', 'www'),
+            ).fetchone()
+            conn.close()
+            self.assertEqual('A', _type)
+            self.assertEqual({'ttl': 300, 'value': '2.2.3.6'}, loads(data))
+
+    def test_apply_changes(self):
+        with TemporaryDirectory() as td:
+            path = join(td.dirname, 'zones.db')
+            provider = SqliteProvider('test', path, supports_root_ns=False)
+
+            zone = Zone('unit.tests.', [])
+            for name in ('a', 'b', 'c'):
+                zone.add_record(
+                    Record.new(
+                        zone, name, {'type': 'A', 'ttl': 30, 'value': '1.1.1.1'}
+                    )
+                )
+            provider.apply(provider.plan(zone))
+
+            desired = zone.copy()
+            desired.add_record(
+                Record.new(
+                    desired, 'a', {'type': 'A', 'ttl': 60, 'value': '2.2.2.2'}
+                ),
+                replace=True,
+            )
+            desired.remove_record(
+                next(r for r in zone.records if r.name == 'c')
+            )
+            desired.add_record(
+                Record.new(
+                    desired, 'd', {'type': 'A', 'ttl': 30, 'value': '3.3.3.3'}
+                )
+            )
+            plan = provider.plan(desired)
+            self.assertEqual(3, len(plan.changes))
+
+            # only the rows of changed records are touched
+            statements = []
+            provider.conn.set_trace_callback(statements.append)
+            provider.apply(plan)
+            provider.conn.set_trace_callback(None)
+            self.assertEqual('BEGIN', statements[0])
+            self.assertEqual('COMMIT', statements[-1])
+            self.assertFalse([s for s in statements if "'b'" in s])
+
+            reloaded = Zone('unit.tests.', [])
+            provider.populate(reloaded)
+            self.assertFalse(desired.changes(reloaded, provider))
+
+            # an apply that fails part way through changes nothing
+            desired = reloaded.copy()
+            for record in list(reloaded.records):
+                desired.remove_record(record)
+            plan = provider.plan(desired)
+            self.assertEqual(3, len(plan.changes))
+            conn = provider.conn
+            with patch.object(provider, '_conn') as conn_mock:
+                conn_mock.execute.side_effect = conn.execute
+
+                def fail(*args, **kwargs):
+                    raise sqlite3.OperationalError('boom')
+
+                conn_mock.executemany.side_effect = fail
+                with self.assertRaises(sqlite3.OperationalError):
+                    provider.apply(plan)
+            reloaded = Zone('unit.tests.', [])
+            provider.populate(reloaded)
+            self.assertEqual(3, len(reloaded.records))
+
+            # emptied zones still exist and are listed
+            provider.apply(plan)
+            reloaded = Zone('unit.tests.', [])
+            self.assertTrue(provider.populate(reloaded))
+            self.assertEqual(0, len(reloaded.records))
+            self.assertEqual(['unit.tests.'], provider.list_zones())
+
+            # zones are independent
+            other = Zone('other.tests.', [])
+            self.assertFalse(provider.populate(other, target=True))
+
+    def test_missing(self):
+        provider = SqliteProvider('test', ':memory:')
+        self.assertEqual([], provider.list_zones())
+        zone = Zone('unit.tests.', [])
+        with self.assertRaises(ProviderException) as ctx:
+            provider.populate(zone)
+        self.assertEqual(
+            'no zone unit.tests. found in :memory:', str(ctx.exception)
+        )
+
+        # fine as a target
+        self.assertFalse(provider.populate(zone, target=True))
+
+        # and when told to ignore them
+        provider = SqliteProvider('test', ':memory:', ignore_missing_zones=True)
+        self.assertFalse(provider.populate(zone))
+        self.assertEqual(0, len(zone.records))
+
+    def test_idna(self):
+        provider = SqliteProvider('test', ':memory:')
+        zone = Zone('déjà.vu.', [])
+        zone.add_record(
+            Record.new(zone, 'ça', {'type': 'A', 'ttl': 30, 'value': '1.2.3.4'})
+        )
+        with self.assertLogs('SqliteProvider[test]', 'WARNING'):
+            provider.apply(provider.plan(zone))
+        self.assertEqual(['xn--dj-kia8a.vu.'], provider.list_zones())
+        self.assertEqual(
+            [(idna_encode('ça'),)],
+            provider.conn.execute('SELECT name FROM records').fetchall(),
+        )
+
+        reloaded = Zone('déjà.vu.', [])
+        provider.populate(reloaded)
+        self.assertEqual(['ça'], [r.decoded_name for r in reloaded.records])
+
+    def test_populate_replace_and_invalid(self):
+        provider = SqliteProvider('test', ':memory:', supports_root_ns=False)
+        zone = Zone('unit.tests.', [])
+        zone.add_record(
+            Record.new(zone, 'a', {'type': 'A', 'ttl': 30, 'value': '1.2.3.4'})
+        )
+        provider.apply(provider.plan(zone))
+
+        # duplicates aren't replaced unless configured
+        with self.assertRaises(DuplicateRecordException):
+            provider.populate(zone)
+        provider.populate_should_replace = True
+        self.assertTrue(provider.populate(zone))
+        self.assertEqual(1, len(zone.records))
+
+        # invalid data includes where it came from
+        provider.conn.execute("UPDATE records SET data = '{\"ttl\":-1}'")
+        with self.assertRaises(ValidationError) as ctx:
+            provider.populate(Zone('unit.tests.', []))
+        self.assertIn(':memory:, a A', str(ctx.exception))
+        # unless lenient
+        lenient = Zone('unit.tests.', [])
+        provider.populate(lenient, lenient=True)
+        self.assertEqual(1, len(lenient.records))
+
+    def test_close(self):
+        provider = SqliteProvider('test', ':memory:')
+        # nothing to close
+        provider.close()
+        conn = provider.conn
+        self.assertIs(conn, provider.conn)
+        provider.close()
+        self.assertIsNone(provider._conn)
+        # re-opened on use
+        self.assertEqual([], provider.list_zones())
+        self.assertIsNot(conn, provider.conn)
+
+    def test_supports(self):
+        provider = SqliteProvider('test', ':memory:')
+        self.assertTrue(provider.supports(None))
+        self.assertIn('A', provider.SUPPORTS)
+        self.assertTrue(provider.SUPPORTS_ROOT_NS)
+        provider = SqliteProvider('test', ':memory:', supports_root_ns=False)
+        self.assertFalse(provider.SUPPORTS_ROOT_NS)
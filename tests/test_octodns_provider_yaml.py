@@ -2,10 +2,12 @@
 #
 #
 
-from os import makedirs, remove
+from io import StringIO
+from os import listdir, makedirs, remove
 from os.path import dirname, isdir, isfile, join
 from shutil import rmtree
 from unittest import TestCase
+from unittest.mock import patch
 
 from helpers import TemporaryDirectory
 from yaml import safe_load
@@ -16,7 +18,8 @@ from octodns.provider import ProviderException
 from octodns.provider.yaml import SplitYamlProvider, YamlProvider
 from octodns.record import Create, NsValue, Record, ValuesMixin
 from octodns.record.exception import ValidationError
-from octodns.zone import SubzoneRecordException, Zone
+from octodns.yaml import safe_dump, safe_dump_stream
+from octodns.zone import DuplicateRecordException, SubzoneRecordException, Zone
 
 
 def touch(filename):
@@ -238,6 +241,92 @@ xn--dj-kia8a:
         source.populate(zone)
         self.assertEqual(0, len(zone.records))
 
+    def test_cache_dir(self):
+        with TemporaryDirectory() as td:
+            cache_dir = join(td.dirname, 'cache')
+            source = YamlProvider(
+                'test',
+                join(dirname(__file__), 'config'),
+                cache_dir=cache_dir,
+                cache_max_size=1024 * 1024,
+            )
+            self.assertEqual(1024 * 1024, source._cache.max_size)
+
+            expected = Zone('unit.tests.', [])
+            YamlProvider('test', join(dirname(__file__), 'config')).populate(
+                expected
+            )
+
+            zone = Zone('unit.tests.', [])
+            source.populate(zone)
+            self.assertEqual(1, len(listdir(cache_dir)))
+            # second time around comes from the cache
+            again = Zone('unit.tests.', [])
+            with patch('octodns.yaml.safe_load') as safe_load_mock:
+                source.populate(again)
+            safe_load_mock.assert_not_called()
+
+            for populated in (zone, again):
+                self.assertEqual(len(expected), len(populated))
+                self.assertFalse(expected.changes(populated, source))
+                self.assertEqual(
+                    {r.context for r in expected},
+                    {r.context for r in populated},
+                )
+
+            # copies get their own cache, in the same place
+            copy = source.copy()
+            self.assertEqual(cache_dir, copy.cache_dir)
+            self.assertIsNot(source._cache, copy._cache)
+
+    def test_apply_streams(self):
+        zone = Zone('unit.tests.', [])
+        for name, value in (('', 'root'), ('a1', 'b'), ('b', 'c'), ('ü', 'd')):
+            zone.add_record(
+                Record.new(
+                    zone, name, {'type': 'TXT', 'ttl': 60, 'value': value}
+                )
+            )
+
+        with TemporaryDirectory() as td:
+            target = YamlProvider('test', td.dirname)
+            filename = join(td.dirname, 'unit.tests.yaml')
+
+            def apply(zone):
+                with patch(
+                    'octodns.provider.yaml.safe_dump_stream',
+                    wraps=safe_dump_stream,
+                ) as stream_mock:
+                    target.apply(target.plan(zone))
+                with open(filename) as fh:
+                    return fh.read(), stream_mock.called
+
+            written, streamed = apply(zone)
+            self.assertTrue(streamed)
+            expected = StringIO()
+            safe_dump(
+                {
+                    '': {'ttl': 60, 'type': 'TXT', 'value': 'root'},
+                    'a1': {'ttl': 60, 'type': 'TXT', 'value': 'b'},
+                    'b': {'ttl': 60, 'type': 'TXT', 'value': 'c'},
+                    'ü': {'ttl': 60, 'type': 'TXT', 'value': 'd'},
+                },
+                expected,
+                allow_unicode=True,
+            )
+            self.assertEqual(expected.getvalue(), written)
+
+            # names that sort the same can't be streamed, their data decides
+            # the order so it's all built up and written at once
+            zone.add_record(
+                Record.new(
+                    zone, 'a01', {'type': 'TXT', 'ttl': 60, 'value': 'a'}
+                )
+            )
+            written, streamed = apply(zone)
+            self.assertFalse(streamed)
+            self.assertIn('\na01:\n', written)
+
     def test_ignore_missing_zones(self):
         # Test that ignore_missing_zones prevents errors when zone files are missing
         with TemporaryDirectory() as td:
@@ -968,6 +1057,274 @@ class TestSplitYamlProvider(TestCase):
         source.populate(zone)
         self.assertEqual(2, len(zone.records))
 
+    def test_load_workers(self):
+        def provider(**kwargs):
+            return YamlProvider(
+                'test',
+                join(dirname(__file__), 'config/split'),
+                split_extension='.tst',
+                disable_zonefile=True,
+                shared_filename='shared.yaml',
+                strict_supports=False,
+                **kwargs,
+            )
+
+        expected = Zone('unit.tests.', [])
+        provider().populate(expected)
+        self.assertEqual(21, len(expected))
+
+        for load_executor in ('thread', 'process'):
+            source = provider(load_workers=4, load_executor=load_executor)
+            zone = Zone('unit.tests.', [])
+            with patch.object(
+                source, '_load_files', wraps=source._load_files
+            ) as load_files_mock:
+                source.populate(zone)
+            load_files_mock.assert_called_once()
+            self.assertEqual(len(expected), len(zone))
+            self.assertFalse(expected.changes(zone, source))
+            self.assertEqual(
+                {(r.name, r._type, r.context) for r in expected},
+                {(r.name, r._type, r.context) for r in zone},
+            )
+
+            # the pool is created once and reused
+            pool = source._load_pool
+            self.assertIsNotNone(pool)
+            source.populate(Zone('unit.tests.', []))
+            self.assertIs(pool, source._load_pool)
+            # copies get their own
+            self.assertIsNone(source.copy()._load_pool)
+
+            source.close()
+            self.assertIsNone(source._load_pool)
+            # nothing to close
+            source.close()
+
+        # processes are spawned, never forked
+        source = provider(load_workers=2, load_executor='process')
+        self.assertEqual(
+            'spawn', source._load_executor_pool._mp_context.get_start_method()
+        )
+        source.close()
+
+        # a single file is just loaded
+        source = provider(load_workers=4)
+        zone = Zone('empty.', [])
+        with patch.object(source, '_load_files') as load_files_mock:
+            source.populate(zone)
+        load_files_mock.assert_not_called()
+
+        with self.assertRaises(ProviderException) as ctx:
+            provider(load_executor='fiber')
+        self.assertEqual(
+            'Invalid load_executor, "fiber", options are "thread", "process"',
+            str(ctx.exception),
+        )
+
+    def test_load_workers_duplicates(self):
+        with TemporaryDirectory() as td:
+            directory = join(td.dirname, 'dup.tests.')
+            makedirs(directory)
+            # the same record in the catchall and its own file
+            with open(join(directory, 'dup.tests.yaml'), 'w') as fh:
+                fh.write('---\nwww:\n  type: A\n  value: 1.1.1.1\n')
+            with open(join(directory, 'www.yaml'), 'w') as fh:
+                fh.write('---\nwww:\n  type: A\n  value: 2.2.2.2\n')
+
+            for load_workers in (1, 2):
+                source = YamlProvider(
+                    'test',
+                    td.dirname,
+                    split_extension='.',
+                    disable_zonefile=True,
+                    load_workers=load_workers,
+                )
+                with self.assertRaises(DuplicateRecordException):
+                    source.populate(Zone('dup.tests.', []))
+
+                # the last file, in sorted order, wins
+                source.populate_should_replace = True
+                zone = Zone('dup.tests.', [])
+                source.populate(zone)
+                self.assertEqual(['2.2.2.2'], zone.get('www').pop().values)
+
+    def test_shared_filename_loaded_once(self):
+        with TemporaryDirectory() as td:
+            shared = join(td.dirname, 'shared.yaml')
+            with open(shared, 'w') as fh:
+                fh.write('---\nshared:\n  type: TXT\n  value: v=spf1 -all;x\n')
+            for zone_name in ('a.tests.', 'b.tests.'):
+                makedirs(join(td.dirname, zone_name))
+                with open(join(td.dirname, zone_name, 'www.yaml'), 'w') as fh:
+                    fh.write('---\nwww:\n  type: A\n  value: 1.2.3.4\n')
+
+            source = YamlProvider(
+                'test',
+                td.dirname,
+                split_extension='.',
+                disable_zonefile=True,
+                shared_filename='shared.yaml',
+                escaped_semicolons=False,
+            )
+
+            def populate(zone_name):
+                zone = Zone(zone_name, [])
+                with patch.object(
+                    source, '_load_file', wraps=source._load_file
+                ) as load_file_mock:
+                    source.populate(zone)
+                return zone, [c[0][0] for c in load_file_mock.call_args_list]
+
+            a, loaded = populate('a.tests.')
+            self.assertIn(shared, loaded)
+            b, loaded = populate('b.tests.')
+            self.assertNotIn(shared, loaded)
+            self.assertEqual(1, len(loaded))
+
+            # each zone gets its own records, escaped once
+            a_shared = a.get('shared').pop()
+            b_shared = b.get('shared').pop()
+            self.assertEqual(['v=spf1 -all\\;x'], a_shared.values)
+            self.assertEqual(a_shared.values, b_shared.values)
+            self.assertEqual('shared.b.tests.', b_shared.fqdn)
+
+            # and changes to the file are picked up
+            with open(shared, 'w') as fh:
+                fh.write('---\nshared:\n  type: TXT\n  value: changed\n')
+            a, loaded = populate('a.tests.')
+            self.assertIn(shared, loaded)
+            self.assertEqual(['changed'], a.get('shared').pop().values)
+
+    def test_apply_incremental(self):
+        def zone(records):
+            zone = Zone('unit.tests.', [])
+            for name, data in records.items():
+                if not isinstance(data, list):
+                    data = [data]
+                for d in data:
+                    zone.add_record(Record.new(zone, name, dict(d, ttl=60)))
+            return zone
+
+        records = {
+            '': {'type': 'TXT', 'value': 'root'},
+            '*': {'type': 'A', 'value': '1.1.1.1'},
+            'a': {'type': 'A', 'value': '2.2.2.2'},
+            'b': {'type': 'A', 'value': '3.3.3.3'},
+            'c': {'type': 'CNAME', 'value': 'a.unit.tests.'},
+        }
+
+        with TemporaryDirectory() as td:
+            target = YamlProvider('test', td.dirname, split_extension='.')
+            directory = join(td.dirname, 'unit.tests.')
+
+            def apply(records):
+                desired = zone(records)
+                with patch.object(
+                    target, '_write', wraps=target._write
+                ) as write_mock:
+                    target.apply(target.plan(desired))
+                # everything round trips
+                reloaded = Zone('unit.tests.', [])
+                target.populate(reloaded)
+                self.assertFalse(desired.changes(reloaded, target))
+                return sorted(
+                    c[0][0][len(directory) + 1 :]
+                    for c in write_mock.call_args_list
+                )
+
+            self.assertEqual(
+                ['$unit.tests.yaml', 'a.yaml', 'b.yaml', 'c.yaml'],
+                apply(records),
+            )
+
+            # only the changed record's file is written
+            records['b'] = {'type': 'A', 'value': '4.4.4.4'}
+            self.assertEqual(['b.yaml'], apply(records))
+
+            # adding a type to a node rewrites it with both
+            records['a'] = [
+                {'type': 'A', 'value': '2.2.2.2'},
+                {'type': 'AAAA', 'value': '2001::1'},
+            ]
+            self.assertEqual(['a.yaml'], apply(records))
+            with open(join(directory, 'a.yaml')) as fh:
+                self.assertEqual(
+                    ['A', 'AAAA'], [r['type'] for r in safe_load(fh)['a']]
+                )
+
+            # deleting a node removes its file, nothing is written
+            del records['c']
+            self.assertEqual([], apply(records))
+            self.assertFalse(isfile(join(directory, 'c.yaml')))
+
+            # changes to either of the catchall nodes rewrite it
+            del records['*']
+            self.assertEqual(['$unit.tests.yaml'], apply(records))
+            with open(join(directory, '$unit.tests.yaml')) as fh:
+                self.assertEqual([''], list(safe_load(fh).keys()))
+
+            # and it's removed once they're both gone
+            del records['']
+            self.assertEqual([], apply(records))
+            self.assertEqual(['a.yaml', 'b.yaml'], sorted(listdir(directory)))
+
+            # without the catchall the root and wildcard get their own files
+            target.split_catchall = False
+            records['*'] = {'type': 'A', 'value': '1.1.1.1'}
+            self.assertEqual(['*.yaml'], apply(records))
+            del records['*']
+            self.assertEqual([], apply(records))
+            self.assertEqual(['a.yaml', 'b.yaml'], sorted(listdir(directory)))
+
+            # files that have already gone missing are fine
+            plan = target.plan(zone({}))
+            remove(join(directory, 'b.yaml'))
+            target.apply(plan)
+            self.assertEqual([], listdir(directory))
+
+    def test_apply_atomic(self):
+        with TemporaryDirectory() as td:
+            target = YamlProvider('test', td.dirname, split_extension='.')
+            zone = Zone('unit.tests.', [])
+            zone.add_record(
+                Record.new(
+                    zone, 'a', {'type': 'A', 'ttl': 60, 'value': '1.1.1.1'}
+                )
+            )
+            target.apply(target.plan(zone))
+            directory = join(td.dirname, 'unit.tests.')
+            filename = join(directory, 'a.yaml')
+            with open(filename) as fh:
+                before = fh.read()
+
+            zone = Zone('unit.tests.', [])
+            zone.add_record(
+                Record.new(
+                    zone, 'a', {'type': 'A', 'ttl': 60, 'value': '2.2.2.2'}
+                )
+            )
+            with patch(
+                'octodns.provider.yaml.safe_dump', side_effect=OSError('boom')
+            ):
+                with self.assertRaises(OSError):
+                    target.apply(target.plan(zone))
+            # the original is untouched and the temp file is cleaned up
+            self.assertEqual(['a.yaml'], listdir(directory))
+            with open(filename) as fh:
+                self.assertEqual(before, fh.read())
+
+            # a failure before the temp file is created
+            plan = target.plan(zone)
+            with patch(
+                'octodns.provider.yaml.open',
+                side_effect=OSError('nope'),
+                create=True,
+            ):
+                with self.assertRaises(OSError):
+                    target.apply(plan)
+            self.assertEqual(['a.yaml'], listdir(directory))
+
 
 class TestOverridingYamlProvider(TestCase):
     def test_provider(self):
@@ -2,11 +2,16 @@
 #
 #
 
+import sys
 import warnings
 from inspect import currentframe
+from os.path import join
 from unittest import TestCase
 from unittest.mock import patch
 
+from helpers import TemporaryDirectory, validators_snapshot
+
+import octodns.record
 from octodns.idna import idna_encode
 from octodns.record import (
     AliasRecord,
@@ -308,6 +313,80 @@ class TestRecord(TestCase):
 
         self.assertIn('AA', Record.registered_types())
 
+    def test_declare_type(self):
+        with TemporaryDirectory() as td, validators_snapshot():
+            with open(join(td.dirname, 'lazy_record_type.py'), 'w') as fh:
+                fh.write(
+                    'from octodns.record import Record\n'
+                    'from octodns.record.a import ARecord\n'
+                    'class LazyRecord(ARecord):\n'
+                    '    _type = "LAZY"\n'
+                    'Record.register_type(LazyRecord)\n'
+                )
+            sys.path.insert(0, td.dirname)
+
+            def forget():
+                sys.modules.pop('lazy_record_type', None)
+                Record._CLASSES.pop('LAZY', None)
+                Record._DECLARED.pop('LAZY', None)
+                for registry in (
+                    Record.validators.available_record,
+                    Record.validators.available_value,
+                ):
+                    registry.pop('LAZY', None)
+
+            try:
+                # declaring doesn't import anything
+                Record.declare_type('LAZY', 'lazy_record_type')
+                self.assertNotIn('LAZY', Record._CLASSES)
+                self.assertNotIn('lazy_record_type', sys.modules)
+
+                # creating a record does
+                record = Record.new(
+                    self.zone,
+                    'lazy',
+                    {'type': 'LAZY', 'ttl': 30, 'value': '1.2.3.4'},
+                )
+                self.assertEqual('LazyRecord', record.__class__.__name__)
+                self.assertEqual({}, Record._DECLARED)
+
+                # so does touching validators
+                forget()
+                Record.declare_type('LAZY', 'lazy_record_type')
+                self.assertIn('LAZY', Record.available_validators()['record'])
+                self.assertIn('LAZY', Record._CLASSES)
+
+                # something else registering a declared type conflicts with
+                # it, rather than it failing when it's later imported
+                forget()
+                Record.declare_type('LAZY', 'lazy_record_type')
+
+                class OtherLazyRecord(ARecord):
+                    _type = 'LAZY'
+
+                with self.assertRaises(RecordException) as ctx:
+                    Record.register_type(OtherLazyRecord)
+                self.assertEqual(
+                    'Type "LAZY" already registered by lazy_record_type.LazyRecord',
+                    str(ctx.exception),
+                )
+            finally:
+                sys.path.remove(td.dirname)
+                forget()
+
+    def test_lazy_names(self):
+        # type classes are available from octodns.record without it
+        # importing them up front
+        self.assertIs(ARecord, octodns.record.ARecord)
+        self.assertIn('ARecord', dir(octodns.record))
+        self.assertIn('Record', dir(octodns.record))
+        with self.assertRaises(AttributeError) as ctx:
+            octodns.record.NopeRecord
+        self.assertEqual(
+            "module 'octodns.record' has no attribute 'NopeRecord'",
+            str(ctx.exception),
+        )
+
     def test_lowering(self):
         record = ARecord(
             self.zone, 'MiXeDcAsE', {'ttl': 30, 'type': 'A', 'value': '1.2.3.4'}
@@ -778,6 +857,35 @@ class TestRecord(TestCase):
         delete = Delete(existing)
         self.assertEqual(existing.values, delete.record.values)
 
+    def test_hash_cached(self):
+        a = Record.new(
+            self.zone, 'a', {'ttl': 42, 'type': 'A', 'value': '1.1.1.1'}
+        )
+        self.assertIsNone(a._hash)
+        self.assertEqual(hash(('a', 'A')), hash(a))
+        self.assertEqual(hash(('a', 'A')), a._hash)
+        # equal records hash the same
+        self.assertEqual(hash(a), hash(a.copy()))
+
+    def test_slots(self):
+        a = Record.new(
+            self.zone, 'a', {'ttl': 42, 'type': 'A', 'value': '1.1.1.1'}
+        )
+        # records and their values are compact, no per-instance __dict__
+        self.assertFalse(hasattr(a, '__dict__'))
+        self.assertFalse(hasattr(a.values[0], '__dict__'))
+        with self.assertRaises(AttributeError):
+            a.not_a_thing = 42
+
+        # subclasses that don't declare __slots__ still work as before
+        class DictARecord(ARecord):
+            pass
+
+        b = DictARecord(self.zone, 'b', {'ttl': 42, 'value': '1.1.1.2'})
+        b.not_a_thing = 42
+        self.assertEqual({'not_a_thing': 42}, b.__dict__)
+        self.assertEqual(['1.1.1.2'], b.values)
+
     def test_inored(self):
         new = Record.new(
             self.zone,
@@ -265,9 +265,6 @@ class TestRecordDynamic(TestCase):
 
         # smoke test of _DynamicMixin.__repr__
         a.__repr__()
-        delattr(a, 'values')
-        a.value = 'abc'
-        a.__repr__()
 
     def test_simple_aaaa_weighted(self):
         aaaa_data = {
@@ -444,6 +441,9 @@ class TestRecordDynamic(TestCase):
         self.assertTrue(rules)
         self.assertEqual(cname_data['dynamic']['rules'][0], rules[0].data)
 
+        # smoke test of _DynamicMixin.__repr__ with a single value
+        cname.__repr__()
+
     def test_dynamic_validation(self):
         # Missing pools
         a_data = {
@@ -3,7 +3,9 @@
 #
 
 import warnings
+from collections import OrderedDict
 from unittest import TestCase
+from unittest.mock import patch
 
 from octodns.record import (
     AliasRecord,
@@ -30,6 +32,7 @@ from octodns.record.validator import (
     ValidatorRegistry,
     ValueValidator,
 )
+from octodns.zone import Zone
 
 
 class TestValidatorBase(TestCase):
@@ -679,6 +682,256 @@ class TestValidatorRegistry(TestCase):
         ]
         self.assertTrue(matched)
 
+    def test_process_record_legacy_validator_deprecated_once(self):
+        class Legacy(RecordValidator):
+            def validate(self, record_cls, name, fqdn, data):
+                return ['legacy reason']
+
+        reg = ValidatorRegistry()
+        reg.register(Legacy('test-legacy'), types=['MX'])
+        reg.enable('test-legacy', types=['MX'])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(3):
+                self.assertEqual(
+                    ['legacy reason'],
+                    reg.process_record(MxRecord, 'foo', 'foo.unit.tests.', {}),
+                )
+        # signature compatibility is resolved once, when the chain is built
+        self.assertEqual(
+            1, len([w for w in caught if 'Legacy' in str(w.message)])
+        )
+
+    def test_process_record_kwargs_validator(self):
+        class Kwargs(RecordValidator):
+            def validate(self, record_cls, name, fqdn, data, **kwargs):
+                return [f'got {sorted(kwargs)}']
+
+        reg = ValidatorRegistry()
+        reg.register(Kwargs('test-kwargs'), types=['MX'])
+        reg.enable('test-kwargs', types=['MX'])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertEqual(
+                ["got ['disabled']"],
+                reg.process_record(MxRecord, 'foo', 'foo.unit.tests.', {}),
+            )
+        self.assertFalse(
+            [w for w in caught if 'disabled' in str(w.message)], caught
+        )
+
+        # validators whose signature can't be inspected are assumed current
+        reg.invalidate()
+        with patch(
+            'octodns.record.validator.signature', side_effect=ValueError
+        ):
+            self.assertEqual(
+                ["got ['disabled']"],
+                reg.process_record(MxRecord, 'foo', 'foo.unit.tests.', {}),
+            )
+
+    def test_chains(self):
+        class Counter(RecordValidator):
+            def validate(self, record_cls, name, fqdn, data, disabled=None):
+                return [f'{self.id} {name}']
+
+        reg = ValidatorRegistry()
+        reg.register(Counter('test-one'), types=['MX'])
+        reg.register(Counter('test-two'))
+        reg.enable_sets(set())
+
+        def process(disabled=None):
+            return reg.process_record(
+                MxRecord, 'foo', 'foo.unit.tests.', {}, disabled=disabled
+            )
+
+        self.assertEqual(['test-two foo', 'test-one foo'], process())
+        # chains are compiled per type and disabled ids
+        self.assertEqual(['test-two foo'], process({'MX': {'test-one'}}))
+        self.assertEqual(
+            ['test-two foo'], process({'MX': frozenset(('test-one',))})
+        )
+        self.assertEqual(['test-one foo'], process({'*': {'test-two'}}))
+        self.assertEqual(3, len(reg._chains))
+        # and reused
+        chain = reg._record_chain('MX', {})
+        self.assertIs(chain, reg._record_chain('MX', {'A': {'test-one'}}))
+
+        # changes to the validators invalidate them
+        reg.disable('test-one')
+        self.assertEqual({}, reg._chains)
+        self.assertEqual(['test-two foo'], process())
+        reg.enable('test-one', types=['MX'])
+        self.assertEqual(['test-two foo', 'test-one foo'], process())
+        reg.register(Counter('test-three'), types=['MX'])
+        self.assertEqual({}, reg._chains)
+        reg.enable('test-three', types=['MX'])
+        self.assertEqual(
+            ['test-two foo', 'test-one foo', 'test-three foo'], process()
+        )
+        reg.reset_active()
+        self.assertEqual([], process())
+
+    def test_cache(self):
+        calls = []
+
+        class Spy(RecordValidator):
+            def __init__(self, id, name_dependent):
+                super().__init__(id)
+                self.name_dependent = name_dependent
+
+            def validate(self, record_cls, name, fqdn, data, disabled=None):
+                calls.append((self.id, name))
+                if data.get('bad') == self.id:
+                    return [
+                        ValidationReason(f'bad {name}', validator_id=self.id)
+                    ]
+                return []
+
+        reg = ValidatorRegistry()
+        reg.register(Spy('test-named', True), types=['MX'])
+        reg.register(Spy('test-data', False), types=['MX'])
+        reg.enable_sets(set())
+
+        def process(name, data, disabled=None):
+            calls.clear()
+            reasons = reg.process_record(
+                MxRecord, name, f'{name}.unit.tests.', data, disabled=disabled
+            )
+            return reasons, list(calls)
+
+        # off by default, everything is always run
+        self.assertIsNone(reg._cache)
+        data = {'ttl': 42, 'values': [{'preference': 1, 'exchange': 'mx.'}]}
+        for name in ('a', 'b'):
+            self.assertEqual(
+                ([], [('test-named', name), ('test-data', name)]),
+                process(name, data),
+            )
+
+        reg.enable_cache(2)
+        self.assertEqual(
+            ([], [('test-named', 'a'), ('test-data', 'a')]), process('a', data)
+        )
+        # same data, different name, only the name dependent one is run
+        self.assertEqual(([], [('test-named', 'b')]), process('b', dict(data)))
+        # name dependent failures are still reported
+        self.assertEqual(
+            (['bad b'], [('test-named', 'b'), ('test-data', 'b')]),
+            process('b', dict(data, bad='test-named')),
+        )
+        self.assertEqual(
+            (['bad c'], [('test-named', 'c')]),
+            process('c', dict(data, bad='test-named')),
+        )
+
+        # failures of the name independent ones aren't cached
+        bad = dict(data, bad='test-data')
+        for name in ('a', 'b'):
+            self.assertEqual(
+                ([f'bad {name}'], [('test-named', name), ('test-data', name)]),
+                process(name, bad),
+            )
+
+        # the disabled validators are part of the key
+        disabled = {'MX': {'test-named'}}
+        self.assertEqual(
+            ([], [('test-data', 'a')]), process('a', data, disabled)
+        )
+        self.assertEqual(([], []), process('b', data, disabled))
+
+        # 1, 1.0, and True aren't the same data
+        self.assertEqual(
+            ([], [('test-named', 'a'), ('test-data', 'a')]),
+            process('a', dict(data, ttl=42.0)),
+        )
+
+        # it's bounded, least recently used is evicted
+        self.assertEqual(2, len(reg._cache))
+        self.assertEqual(
+            ([], [('test-named', 'a'), ('test-data', 'a')]), process('a', data)
+        )
+
+        # data that can't be hashed isn't cached
+        unhashable = dict(data, extra={1, 2})
+        for name in ('a', 'b'):
+            self.assertEqual(
+                ([], [('test-named', name), ('test-data', name)]),
+                process(name, unhashable),
+            )
+
+        # changes to the validators clear it
+        reg.disable('test-named')
+        self.assertEqual({}, reg._cache)
+
+        # and it can be turned back off
+        reg.enable_cache(0)
+        self.assertIsNone(reg._cache)
+        reg.invalidate()
+
+    def test_cache_locked(self):
+        reg = ValidatorRegistry()
+        reg.enable_sets(set())
+        reg.enable_cache(1)
+        test = self
+
+        # records are validated from multiple threads, the check and move of
+        # a hit and the insert and evict of a miss can't be interleaved with
+        # another thread's, e.g. an eviction between `in` and move_to_end
+        class Checked(OrderedDict):
+            def __contains__(self, key):
+                test.assertTrue(reg._cache_lock.locked())
+                return super().__contains__(key)
+
+            def move_to_end(self, *args, **kwargs):
+                test.assertTrue(reg._cache_lock.locked())
+                return super().move_to_end(*args, **kwargs)
+
+            def __setitem__(self, key, value):
+                test.assertTrue(reg._cache_lock.locked())
+                return super().__setitem__(key, value)
+
+            def popitem(self, *args, **kwargs):
+                test.assertTrue(reg._cache_lock.locked())
+                return super().popitem(*args, **kwargs)
+
+        reg._cache = Checked()
+        for ttl in (1, 1, 2, 1):
+            data = {
+                'ttl': ttl,
+                'values': [{'preference': 1, 'exchange': 'mx.'}],
+            }
+            reg.process_record(MxRecord, 'a', 'a.unit.tests.', data)
+        self.assertEqual(1, len(reg._cache))
+
+    def test_cache_builtins(self):
+        zone = Zone('unit.tests.', [])
+        reg = ValidatorRegistry()
+        for validator in Record.validators.available_record['*'].values():
+            reg.register(validator)
+        for validator in Record.validators.available_record['MX'].values():
+            reg.register(validator, types=['MX'])
+        for validator in Record.validators.available_value['MX'].values():
+            reg.register(validator, types=['MX'])
+        reg.enable_sets({'legacy'})
+        reg.enable_cache(10)
+
+        data = {
+            'ttl': 42,
+            'values': [{'preference': 1, 'exchange': 'mx.unit.tests.'}],
+        }
+        for name in ('a', 'b'):
+            self.assertEqual(
+                [],
+                reg.process_record(MxRecord, name, f'{name}.{zone.name}', data),
+            )
+        self.assertEqual(1, len(reg._cache))
+        # name validation still happens
+        self.assertEqual(
+            ['invalid name "@", use "" instead'],
+            reg.process_record(MxRecord, '@', f'@.{zone.name}', data),
+        )
+
     def test_builtin_validator_ids_are_nonempty_and_unique(self):
         # Every registered validator must have a non-empty id. Ids within
         # each registry bucket must be unique (enforced by register, but
@@ -0,0 +1,103 @@
+#
+#
+#
+
+from io import StringIO
+from json import loads
+from os.path import join
+from unittest import TestCase
+
+from helpers import TemporaryDirectory
+
+from octodns.timings import Timings
+
+
+class TestTimings(TestCase):
+    def test_time_and_record(self):
+        timings = Timings()
+        with timings.time('populate', zone='unit.tests.', source='in'):
+            pass
+        with self.assertRaises(ValueError):
+            with timings.time('plan', zone='unit.tests.', target='dump'):
+                raise ValueError('boom')
+        timings.record('apply', 1.5, zone='unit.tests.', target=None)
+
+        populate, plan, apply = timings.entries
+        self.assertEqual(
+            {'phase', 'zone', 'source', 'start', 'seconds'}, set(populate)
+        )
+        self.assertEqual('in', populate['source'])
+        self.assertGreaterEqual(populate['start'], 0)
+        # exceptions are still timed
+        self.assertEqual('plan', plan['phase'])
+        self.assertEqual('dump', plan['target'])
+        # None labels are omitted
+        self.assertEqual({'phase', 'zone', 'start', 'seconds'}, set(apply))
+        self.assertEqual(1.5, apply['seconds'])
+
+        timings.reset()
+        self.assertEqual([], timings.entries)
+
+    def test_merge(self):
+        worker = Timings()
+        worker.record('plan', 0.5, start=worker.origin + 2, zone='z.')
+
+        timings = Timings()
+        timings.origin = worker.origin - 1
+        timings.merge(worker.entries, worker.origin)
+        self.assertEqual(3, timings.entries[0]['start'])
+        # the originals weren't modified
+        self.assertEqual(2, worker.entries[0]['start'])
+
+    def test_json(self):
+        timings = Timings()
+        timings.record('plan', 0.5, start=timings.origin + 2, zone='b.')
+        timings.record('plan', 0.25, start=timings.origin + 1, zone='a.')
+
+        fh = StringIO()
+        timings.write_json(fh)
+        data = loads(fh.getvalue())
+        # ordered by when things started
+        self.assertEqual(['a.', 'b.'], [e['zone'] for e in data['timings']])
+
+        with TemporaryDirectory() as td:
+            filename = join(td.dirname, 'timings.json')
+            timings.write(filename)
+            with open(filename) as fh:
+                self.assertEqual(data, loads(fh.read()))
+
+    def test_prometheus(self):
+        timings = Timings()
+        timings.record('plan', 0.5, zone='unit.tests.', target='dump')
+        timings.record('plan', 0.25, zone='unit.tests.', target='dump')
+        timings.record('sync', 2)
+        timings.record(
+            'process_plan',
+            0.125,
+            zone='unit.tests.',
+            target='dump',
+            processor='odd"\\name\n',
+        )
+
+        fh = StringIO()
+        timings.write_prometheus(fh)
+        self.assertEqual(
+            '''# HELP octodns_phase_duration_seconds Seconds spent in each phase of the run
+# TYPE octodns_phase_duration_seconds gauge
+octodns_phase_duration_seconds{phase="plan",zone="unit.tests.",target="dump"} 0.75
+octodns_phase_duration_seconds{phase="process_plan",zone="unit.tests.",target="dump",processor="odd\\"\\\\name\\n"} 0.125
+octodns_phase_duration_seconds{phase="sync"} 2
+# HELP octodns_phase_count Number of times each phase of the run happened
+# TYPE octodns_phase_count gauge
+octodns_phase_count{phase="plan",zone="unit.tests.",target="dump"} 2
+octodns_phase_count{phase="process_plan",zone="unit.tests.",target="dump",processor="odd\\"\\\\name\\n"} 1
+octodns_phase_count{phase="sync"} 1
+''',
+            fh.getvalue(),
+        )
+
+        with TemporaryDirectory() as td:
+            filename = join(td.dirname, 'timings.prom')
+            timings.write(filename, format='prometheus')
+            with open(filename) as fh:
+                self.assertIn('octodns_phase_count{phase="sync"} 1', fh.read())
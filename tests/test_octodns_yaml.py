@@ -3,13 +3,45 @@
 #
 
 import os
+from importlib import reload
 from io import StringIO
+from os import listdir, remove
+from os.path import exists, getsize, join
+from pickle import dumps, loads
+from shutil import copytree
+from time import sleep
 from unittest import TestCase
 from unittest.mock import patch
 
+import yaml
+from helpers import TemporaryDirectory
 from yaml.constructor import ConstructorError
 
-from octodns.yaml import InvalidOrder, safe_dump, safe_load
+from octodns import yaml as octodns_yaml
+from octodns.context import ContextDict
+from octodns.yaml import (
+    InvalidOrder,
+    YamlCache,
+    include_cache,
+    safe_dump,
+    safe_dump_stream,
+    safe_load,
+    sort_keys,
+)
+
+
+def _contexts(data, path=''):
+    # walks data returning a list of (path, context) for every ContextDict
+    ret = []
+    if isinstance(data, dict):
+        if isinstance(data, ContextDict):
+            ret.append((path, data.context))
+        for k, v in data.items():
+            ret.extend(_contexts(v, f'{path}/{k}'))
+    elif isinstance(data, list):
+        for i, v in enumerate(data):
+            ret.extend(_contexts(v, f'{path}/{i}'))
+    return ret
 
 
 class TestYaml(TestCase):
@@ -42,11 +74,28 @@ class TestYaml(TestCase):
 '*.11.2': 'd'
 '*.10.1': 'c'
 ''')
-        self.assertTrue(
-            'keys out of order: expected *.1.2 got *.2.2 at'
-            in ctx.exception.problem
+        # every out of order key is reported, along with where it is
+        self.assertEqual(
+            'keys out of order: '
+            '*.1.2 should be before *.2.2 at <unicode string>, line 3, column 1; '
+            '*.10.1 should be before *.11.2 at <unicode string>, line 5, column 1',
+            ctx.exception.problem,
         )
 
+        # lots of problems are capped
+        reversed_keys = ''.join(f'k{i:05}: {i}\n' for i in range(5000, 0, -1))
+        for libyaml in (True, False):
+            with self.assertRaises(ConstructorError) as ctx:
+                safe_load(reversed_keys, libyaml=libyaml)
+            problems = ctx.exception.problem.split('; ')
+            self.assertEqual(11, len(problems))
+            self.assertEqual(
+                'keys out of order: k04999 should be before k05000 at '
+                '<unicode string>, line 2, column 1',
+                problems[0],
+            )
+            self.assertEqual('and 4989 more', problems[-1])
+
         buf = StringIO()
         safe_dump({'*.1.1': 42, '*.11.1': 43, '*.2.1': 44}, buf)
         self.assertEqual(
@@ -125,7 +174,7 @@ class TestYaml(TestCase):
             safe_load(simple)
         problem = ctx.exception.problem.split(' at')[0]
         self.assertEqual(
-            'keys out of order: expected *.2.2 got *.10.1', problem
+            'keys out of order: *.2.2 should be before *.11.2', problem
         )
         # dump
         buf = StringIO()
@@ -140,7 +189,7 @@ class TestYaml(TestCase):
             safe_load(natural, order_mode='simple')
         problem = ctx.exception.problem.split(' at')[0]
         self.assertEqual(
-            'keys out of order: expected *.10.1 got *.2.2', problem
+            'keys out of order: *.10.1 should be before *.2.2', problem
         )
         buf = StringIO()
         safe_dump(data, buf, order_mode='simple')
@@ -188,3 +237,438 @@ parent:
         self.assertEqual('added', data['parent']['child'])
         self.assertEqual('overwrote', data['parent']['z'])
         expanduser_mock.assert_any_call('~/dict.yaml')
+
+    def test_libyaml(self):
+        # only meaningful when pyyaml has libyaml support, which it does in
+        # our dev/CI environments
+        self.assertIsNotNone(octodns_yaml.CContextLoader)
+
+        for filename, kwargs in (
+            ('tests/config/unit.tests.yaml', {}),
+            ('tests/config/dynamic.tests.yaml', {}),
+            ('tests/config/simple.yaml', {'enforce_order': False}),
+            ('tests/config/include/main.yaml', {}),
+            ('tests/config/include/merge.yaml', {'enforce_order': False}),
+        ):
+            with open(filename) as fh:
+                c = safe_load(fh, **kwargs)
+            with open(filename) as fh:
+                python = safe_load(fh, libyaml=False, **kwargs)
+            self.assertEqual(python, c, filename)
+            # the context of every dict is the same
+            self.assertTrue(_contexts(c), filename)
+            self.assertEqual(_contexts(python), _contexts(c), filename)
+
+        # order enforcement is the same
+        unordered = "---\n'*.2.2': b\n'*.10.1': c\n'*.1.1': a\n"
+        for order_mode in ('natural', 'simple'):
+            problems = []
+            for libyaml in (True, False):
+                with self.assertRaises(ConstructorError) as ctx:
+                    safe_load(unordered, order_mode=order_mode, libyaml=libyaml)
+                problems.append(ctx.exception.problem)
+            self.assertEqual(problems[0], problems[1])
+
+    def test_libyaml_unavailable(self):
+        # falls back to the pure Python loaders
+        with patch('octodns.yaml.CContextLoader', None):
+            with patch('octodns.yaml.load') as load_mock:
+                safe_load('a: 1', enforce_order=False)
+                self.assertIs(
+                    octodns_yaml.ContextLoader, load_mock.call_args[0][1]
+                )
+                safe_load('a: 1', order_mode='simple')
+                self.assertIs(
+                    octodns_yaml.SimpleSortEnforcingLoader,
+                    load_mock.call_args[0][1],
+                )
+
+    def test_libyaml_missing(self):
+        # pyyaml built without libyaml doesn't have the C classes, reloading
+        # with them removed goes through the fallback, patch.dict puts both
+        # modules back as they were when we're done
+        with patch.dict(yaml.__dict__), patch.dict(octodns_yaml.__dict__):
+            del yaml.__dict__['CSafeDumper']
+            del yaml.__dict__['CSafeLoader']
+            reload(octodns_yaml)
+            self.assertIsNone(octodns_yaml.CSafeLoader)
+            self.assertIsNone(octodns_yaml.CContextLoader)
+            self.assertEqual({}, octodns_yaml._c_loaders)
+
+            data = octodns_yaml.safe_load(
+                "---\na: 1\nb:\n  c: 2\n", order_mode='simple'
+            )
+            self.assertEqual({'a': 1, 'b': {'c': 2}}, data)
+            self.assertTrue(data['b'].context)
+
+            self.assertIsNone(octodns_yaml.CSortingDumper)
+            self.assertEqual({}, octodns_yaml._c_dumpers)
+            buf = StringIO()
+            octodns_yaml.safe_dump({'b': 2, 'a': 1}, buf)
+            self.assertEqual('---\na: 1\nb: 2\n', buf.getvalue())
+
+        self.assertIsNotNone(octodns_yaml.CContextLoader)
+        self.assertIsNotNone(octodns_yaml.CSortingDumper)
+        self.assertIs(InvalidOrder, octodns_yaml.InvalidOrder)
+
+    def test_dump_libyaml(self):
+        self.assertIsNotNone(octodns_yaml.CSortingDumper)
+
+        def dump(data, **kwargs):
+            buf = StringIO()
+            with patch('octodns.yaml.dump', wraps=octodns_yaml.dump) as mock:
+                safe_dump(data, buf, **kwargs)
+            return buf.getvalue(), mock.call_args[0][2]
+
+        class Value(str):
+            def __str__(self):
+                return 'not the value'
+
+        docs = []
+        for filename in (
+            'tests/config/unit.tests.yaml',
+            'tests/config/dynamic.tests.yaml',
+        ):
+            with open(filename) as fh:
+                data = safe_load(fh)
+            docs.append(data)
+            # each of the nodes on its own
+            docs.extend({k: v} for k, v in data.items())
+        docs.extend(
+            (
+                {'a': Value('v'), 'l': [1, 1.5, True, None, 'x y']},
+                # names that sort the same under natural ordering
+                {'a1': {'x': 2}, 'a01': {'x': 1}},
+                ['*.2.1', {'*.11.1': 43, '*.2.1': 44}],
+                # things libyaml writes differently
+                {'': 'root', 'b': 'c'},
+                {'a': 'ünicode'},
+                {'a': 'new\nline'},
+                {'a': {1, 2}},
+                'scalar',
+                None,
+            )
+        )
+
+        used = set()
+        for data in docs:
+            for kwargs in (
+                {},
+                {'order_mode': 'simple'},
+                {'allow_unicode': True},
+            ):
+                c, dumper = dump(data, **kwargs)
+                python, _ = dump(data, libyaml=False, **kwargs)
+                self.assertEqual(python, c, data)
+                used.add(dumper)
+        self.assertEqual(
+            {
+                octodns_yaml.CNaturalSortingDumper,
+                octodns_yaml.CSimpleSortingDumper,
+                octodns_yaml.NaturalSortingDumper,
+                octodns_yaml.SimpleSortingDumper,
+            },
+            used,
+        )
+
+        # str subclasses are written as their underlying value
+        self.assertEqual("---\na: v\n", dump({'a': Value('v')})[0])
+        # ties are broken by value, as they always have been
+        self.assertEqual(
+            "---\na01: a\na1: b\n", dump({'a1': 'b', 'a01': 'a'})[0]
+        )
+        self.assertEqual(
+            "---\na1: a\na01: b\n", dump({'a01': 'b', 'a1': 'a'})[0]
+        )
+
+        with self.assertRaises(InvalidOrder):
+            dump({}, order_mode='bad')
+
+    def test_dump_stream(self):
+        self.assertEqual(['a', 'b2', 'b10'], sort_keys(['b10', 'a', 'b2']))
+        self.assertEqual(
+            ['a', 'b10', 'b2'], sort_keys(['b10', 'a', 'b2'], 'simple')
+        )
+        # it can't be done when names sort the same
+        self.assertIsNone(sort_keys(['a1', 'a01']))
+        self.assertEqual(['a01', 'a1'], sort_keys(['a1', 'a01'], 'simple'))
+        with self.assertRaises(InvalidOrder):
+            sort_keys([], 'bad')
+
+        with open('tests/config/unit.tests.yaml') as fh:
+            data = safe_load(fh)
+        for order_mode in ('natural', 'simple'):
+            for libyaml in (True, False):
+                expected = StringIO()
+                safe_dump(
+                    data,
+                    expected,
+                    order_mode=order_mode,
+                    allow_unicode=True,
+                    libyaml=libyaml,
+                )
+                buf = StringIO()
+                safe_dump_stream(
+                    ((k, data[k]) for k in sort_keys(data, order_mode)),
+                    buf,
+                    order_mode=order_mode,
+                    allow_unicode=True,
+                    libyaml=libyaml,
+                )
+                self.assertEqual(expected.getvalue(), buf.getvalue())
+
+        buf = StringIO()
+        safe_dump_stream([], buf)
+        self.assertEqual('--- {}\n', buf.getvalue())
+
+
+class TestIncludeCache(TestCase):
+    def setUp(self):
+        self.td = TemporaryDirectory()
+        self.td.__enter__()
+        self.addCleanup(self.td.__exit__)
+        self.config = join(self.td.dirname, 'config')
+        copytree('tests/config/include', self.config)
+        include_cache.clear()
+        self.addCleanup(include_cache.clear)
+
+    def load(self, name, **kwargs):
+        with open(join(self.config, name)) as fh:
+            return safe_load(fh, **kwargs)
+
+    def counts(self):
+        return include_cache.hits, include_cache.misses
+
+    def test_load(self):
+        expected = self.load('main.yaml')
+        # array, dict, empty, nested, and the value.yaml it includes, are
+        # misses, main's own include of value.yaml is then a hit
+        self.assertEqual((1, 5), self.counts())
+
+        # the 2nd time around they're all hits, value.yaml only counting
+        # directly, it comes along with nested.yaml
+        data = self.load('main.yaml')
+        self.assertEqual(expected, data)
+        self.assertEqual((6, 5), self.counts())
+
+        # callers get their own copies
+        data['included-array'].append(99)
+        data['included-dict']['k'] = 'changed'
+        self.assertEqual(expected, self.load('main.yaml'))
+        self.assertEqual((11, 5), self.counts())
+
+        # merges are cached too, separately since they're flattened
+        merged = self.load('merge.yaml', enforce_order=False)
+        self.assertEqual((11, 6), self.counts())
+        self.assertEqual(merged, self.load('merge.yaml', enforce_order=False))
+        self.assertEqual((12, 6), self.counts())
+
+        # modifying a file that's included by an include invalidates both
+        with open(join(self.config, 'subdir', 'value.yaml'), 'w') as fh:
+            fh.write('--- Goodbye World!\n')
+        data = self.load('main.yaml')
+        self.assertEqual('Goodbye World!', data['included-nested'])
+        self.assertEqual('Goodbye World!', data['included-subdir'])
+        self.assertEqual((16, 8), self.counts())
+
+        # different loaders are cached separately
+        self.load('main.yaml', libyaml=False)
+        self.assertEqual((17, 13), self.counts())
+
+        include_cache.clear()
+        self.assertEqual((0, 0), self.counts())
+        self.load('main.yaml')
+        self.assertEqual((1, 5), self.counts())
+
+    def test_size(self):
+        with patch.object(include_cache, 'size', 1):
+            self.load('main.yaml')
+            self.assertEqual(1, len(include_cache._entries))
+            self.load('main.yaml')
+        self.assertEqual((0, 12), self.counts())
+
+
+class TestYamlCache(TestCase):
+    def setUp(self):
+        self.td = TemporaryDirectory()
+        self.td.__enter__()
+        self.addCleanup(self.td.__exit__)
+        # a copy of the include tests' files that we can modify
+        self.config = join(self.td.dirname, 'config')
+        copytree('tests/config/include', self.config)
+        self.main = join(self.config, 'main.yaml')
+        self.cache_dir = join(self.td.dirname, 'cache')
+
+    def load(self, cache, filename=None, **kwargs):
+        # returns the data and whether or not it was parsed
+        with patch(
+            'octodns.yaml.safe_load', wraps=octodns_yaml.safe_load
+        ) as safe_load_mock:
+            data = cache.load(filename or self.main, **kwargs)
+        return data, safe_load_mock.called
+
+    def test_load(self):
+        cache = YamlCache(self.cache_dir)
+        with open(self.main) as fh:
+            expected = safe_load(fh)
+
+        data, parsed = self.load(cache)
+        self.assertTrue(parsed)
+        self.assertEqual(expected, data)
+        self.assertEqual(1, len(listdir(self.cache_dir)))
+
+        # second time comes from the cache, context and all
+        data, parsed = self.load(cache)
+        self.assertFalse(parsed)
+        self.assertEqual(expected, data)
+        self.assertEqual(_contexts(expected), _contexts(data))
+
+        # a new instance, e.g. the next run, uses it as well
+        self.assertFalse(self.load(YamlCache(self.cache_dir))[1])
+
+        # an entry evicted by someone else between our read and utime is
+        # still a hit
+        def evicted(entry):
+            remove(entry)
+            raise FileNotFoundError(entry)
+
+        with patch('octodns.yaml.utime', side_effect=evicted):
+            data, parsed = self.load(cache)
+        self.assertFalse(parsed)
+        self.assertEqual(expected, data)
+        self.assertEqual([], listdir(self.cache_dir))
+        self.assertTrue(self.load(cache)[1])
+
+        # different loader modes are cached separately
+        self.assertTrue(self.load(cache, order_mode='simple')[1])
+        self.assertFalse(self.load(cache, order_mode='simple')[1])
+        self.assertTrue(self.load(cache, enforce_order=False)[1])
+        self.assertEqual(3, len(listdir(self.cache_dir)))
+
+        # modifying the file invalidates it
+        with open(self.main, 'a') as fh:
+            fh.write('other: thing\n')
+        data, parsed = self.load(cache)
+        self.assertTrue(parsed)
+        self.assertEqual('thing', data['other'])
+        self.assertFalse(self.load(cache)[1])
+
+        # as does modifying something it includes, even when nested
+        with open(join(self.config, 'subdir', 'value.yaml'), 'w') as fh:
+            fh.write('--- Goodbye World!\n')
+        data, parsed = self.load(cache)
+        self.assertTrue(parsed)
+        self.assertEqual('Goodbye World!', data['included-subdir'])
+        self.assertFalse(self.load(cache)[1])
+
+        # or removing it
+        remove(join(self.config, 'empty.yaml'))
+        with self.assertRaises(FileNotFoundError):
+            cache.load(self.main)
+
+        # order errors aren't cached
+        unordered = join(self.config, 'unordered.yaml')
+        with open(unordered, 'w') as fh:
+            fh.write('---\nb: 1\na: 2\n')
+        for _ in range(2):
+            with self.assertRaises(ConstructorError):
+                cache.load(unordered)
+
+    def test_pickle(self):
+        # caches are handed to process pools
+        cache = YamlCache(self.cache_dir, max_size=4242424)
+        self.assertTrue(self.load(cache)[1])
+        copy = loads(dumps(cache))
+        self.assertEqual(self.cache_dir, copy.directory)
+        self.assertEqual(4242424, copy.max_size)
+        self.assertFalse(self.load(copy)[1])
+
+    def test_unreadable_entry(self):
+        cache = YamlCache(self.cache_dir)
+        self.assertTrue(self.load(cache)[1])
+        entry = join(self.cache_dir, listdir(self.cache_dir)[0])
+        with open(entry, 'wb') as fh:
+            fh.write(b'not a pickle')
+        with self.assertLogs('YamlCache', level='WARNING') as logs:
+            data, parsed = self.load(cache)
+        self.assertTrue(parsed)
+        self.assertEqual('main', data['name'])
+        self.assertIn('unreadable entry', logs.output[0])
+        # and it's been replaced
+        self.assertFalse(self.load(cache)[1])
+
+    def test_write_failure(self):
+        cache = YamlCache(self.cache_dir)
+        with patch('octodns.yaml.replace', side_effect=OSError('nope')):
+            with self.assertLogs('YamlCache', level='WARNING') as logs:
+                data, parsed = self.load(cache)
+        self.assertTrue(parsed)
+        self.assertEqual('main', data['name'])
+        self.assertIn('failed to write', logs.output[0])
+        # nothing left behind
+        self.assertEqual([], listdir(self.cache_dir))
+
+        # if we can't even create the temp file
+        with patch('octodns.yaml.mkstemp', side_effect=OSError('nope')):
+            with self.assertLogs('YamlCache', level='WARNING'):
+                self.assertEqual('main', cache.load(self.main)['name'])
+
+        # or clean up after ourselves
+        with (
+            patch('octodns.yaml.replace', side_effect=OSError('nope')),
+            patch('octodns.yaml.remove', side_effect=OSError('nope')),
+        ):
+            with self.assertLogs('YamlCache', level='WARNING'):
+                self.assertEqual('main', cache.load(self.main)['name'])
+
+    def test_evict(self):
+        filenames = []
+        for i in range(4):
+            filename = join(self.config, f'file-{i}.yaml')
+            with open(filename, 'w') as fh:
+                fh.write(f'---\nkey: {"x" * 64}\nnumber: {i}\n')
+            filenames.append(filename)
+
+        cache = YamlCache(self.cache_dir)
+        cache.load(filenames[0])
+        size = getsize(join(self.cache_dir, listdir(self.cache_dir)[0]))
+
+        # room for 2 entries
+        cache = YamlCache(self.cache_dir, max_size=size * 2 + 1)
+        for filename in filenames[1:3]:
+            cache.load(filename)
+            # make sure mtimes differ
+            sleep(0.01)
+        self.assertEqual(2, len(listdir(self.cache_dir)))
+        # 2 is the most recent, use 1 so that it is
+        self.assertFalse(self.load(cache, filenames[1])[1])
+        sleep(0.01)
+        cache.load(filenames[3])
+        self.assertEqual(2, len(listdir(self.cache_dir)))
+        # 2 was evicted
+        self.assertFalse(self.load(cache, filenames[1])[1])
+        self.assertFalse(self.load(cache, filenames[3])[1])
+        self.assertTrue(self.load(cache, filenames[2])[1])
+
+        # other things in the directory are left alone
+        other = join(self.cache_dir, 'other')
+        with open(other, 'w') as fh:
+            fh.write('x' * size * 4)
+        cache = YamlCache(self.cache_dir, max_size=size * 2 + 1)
+        cache.load(filenames[0])
+        self.assertTrue(exists(other))
+
+        # entries that disappear out from under us are skipped
+        cache = YamlCache(self.cache_dir, max_size=1)
+        real_stat = octodns_yaml.stat
+
+        def flaky_stat(path):
+            if path.endswith('.pickle'):
+                remove(path)
+            return real_stat(path)
+
+        with patch('octodns.yaml.stat', side_effect=flaky_stat):
+            cache.load(filenames[1])
+        cache._size = None
+        with patch('octodns.yaml.remove', side_effect=FileNotFoundError()):
+            cache.load(filenames[2])
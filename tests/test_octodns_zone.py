@@ -919,6 +919,139 @@ class TestZone(TestCase):
         # Doesn't the second
         self.assertFalse(copy.hydrate())
 
+    def test_records_cached(self):
+        zone = Zone('unit.tests.', [])
+        # empty zones are still truthy
+        self.assertTrue(zone)
+        self.assertEqual(0, len(zone))
+        self.assertEqual([], list(zone))
+
+        a = ARecord(zone, 'a', {'ttl': 42, 'value': '1.1.1.1'})
+        zone.add_record(a)
+        b = ARecord(zone, 'b', {'ttl': 42, 'value': '1.1.1.2'})
+        zone.add_record(b)
+        self.assertEqual(2, len(zone))
+        self.assertEqual({a, b}, set(zone))
+
+        # the same snapshot is used until something changes
+        records = zone._snapshot()
+        self.assertIs(records, zone._snapshot())
+        # callers get their own copy that they're free to modify
+        zone.records.pop()
+        self.assertEqual(2, len(zone.records))
+
+        # replacing doesn't change the count, but does the records
+        b_prime = ARecord(zone, 'b', {'ttl': 42, 'value': '1.1.1.3'})
+        zone.add_record(b_prime, replace=True)
+        self.assertEqual(2, len(zone))
+        self.assertIsNot(records, zone._snapshot())
+        self.assertEqualNameAndValues({a, b_prime}, zone.records)
+        # replace of something that isn't there yet is an add
+        c = ARecord(zone, 'c', {'ttl': 42, 'value': '1.1.1.4'})
+        zone.add_record(c, replace=True)
+        self.assertEqual(3, len(zone))
+
+        # failed adds don't change anything
+        records = zone._snapshot()
+        with self.assertRaises(DuplicateRecordException):
+            zone.add_record(a)
+        self.assertEqual(3, len(zone))
+        self.assertIs(records, zone._snapshot())
+
+        # removing things that aren't there is a noop
+        d = ARecord(zone, 'd', {'ttl': 42, 'value': '1.1.1.5'})
+        zone.remove_record(d)
+        self.assertEqual(3, len(zone))
+        self.assertIs(records, zone._snapshot())
+
+        # removing while iterating works on the snapshot
+        for record in zone:
+            zone.remove_record(record)
+        self.assertEqual(0, len(zone))
+        self.assertEqual(set(), zone.records)
+
+    def test_records_cached_copy(self):
+        zone = Zone('unit.tests.', [])
+        a = ARecord(zone, 'a', {'ttl': 42, 'value': '1.1.1.1'})
+        zone.add_record(a)
+
+        copy = zone.copy()
+        self.assertEqual(1, len(copy))
+        self.assertIs(zone._snapshot(), copy._snapshot())
+        self.assertEqual([a], list(copy))
+        # copies of empty zones still point to their origin
+        self.assertIsNotNone(Zone('unit.tests.', []).copy()._origin)
+
+        # hydration shares the origin's snapshot
+        records = zone._snapshot()
+        copy.hydrate()
+        self.assertEqual(1, len(copy))
+        self.assertIs(records, copy._snapshot())
+
+        # until it's modified, which doesn't touch the origin
+        b = ARecord(zone, 'b', {'ttl': 42, 'value': '1.1.1.2'})
+        copy.add_record(b)
+        self.assertEqual(2, len(copy))
+        self.assertEqual({a, b}, copy.records)
+        self.assertEqual(1, len(zone))
+        self.assertIs(records, zone._snapshot())
+
+    def test_copy_node_granular(self):
+        zone = Zone('unit.tests.', [])
+        a = ARecord(zone, 'a', {'ttl': 42, 'value': '1.1.1.1'})
+        zone.add_record(a)
+        b = ARecord(zone, 'b', {'ttl': 42, 'value': '1.1.1.2'})
+        zone.add_record(b)
+        mx = MxRecord(
+            zone,
+            '',
+            {
+                'ttl': 42,
+                'value': {'preference': 10, 'exchange': 'a.unit.tests.'},
+            },
+        )
+        zone.add_record(mx)
+
+        copy = zone.copy()
+        b_prime = ARecord(zone, 'b', {'ttl': 42, 'value': '1.1.1.3'})
+        copy.add_record(b_prime, replace=True)
+        # untouched nodes are shared, touched ones were copied
+        self.assertIs(zone._records['a'], copy._records['a'])
+        self.assertIsNot(zone._records['b'], copy._records['b'])
+        self.assertIs(zone._records[''], copy._records[''])
+        self.assertEqual(3, len(copy))
+        # and the origin is unaffected
+        self.assertEqualNameAndValues({a, b, mx}, zone.records)
+        self.assertEqualNameAndValues({a, b_prime, mx}, copy.records)
+        self.assertEqual({a, b}, zone.get_by_type('A'))
+        (got,) = copy.get_by_type('A') - {a}
+        self.assertIs(b_prime, got)
+
+        # modifying the origin doesn't touch the copy either
+        zone.remove_record(mx)
+        self.assertEqual(set(), zone.get_references('a.unit.tests.'))
+        self.assertEqual({mx}, copy.get_references('a.unit.tests.'))
+        self.assertEqual({mx}, copy.get('', 'MX'))
+        c = ARecord(zone, 'c', {'ttl': 42, 'value': '1.1.1.4'})
+        zone.add_record(c)
+        self.assertEqual(set(), copy.get('c'))
+        self.assertEqual(3, len(copy))
+
+        # copies of copies hydrate from what they're ultimately based on
+        root_ns = NsRecord(
+            zone, '', {'ttl': 42, 'values': ['ns1.unit.tests.', 'ns2.tests.']}
+        )
+        zone.add_record(root_ns)
+        second = zone.copy().copy()
+        self.assertTrue(second.hydrate())
+        self.assertEqual(zone.records, second.records)
+        self.assertIs(root_ns, second.root_ns)
+        second.remove_record(root_ns)
+        self.assertIsNone(second.root_ns)
+        self.assertIs(root_ns, zone.root_ns)
+        self.assertEqual(4, len(zone))
+        self.assertEqual(3, len(second))
+
     def test_copy_context(self):
         zone = Zone('unit.tests.', [])
 
@@ -1123,3 +1256,172 @@ class TestZoneGet(TestCase):
         copy = zone.copy()
         self.assertIsNotNone(copy._origin)
         self.assertEqual({a}, copy.get('www', type='A'))
+
+
+class TestZoneIndexes(TestCase):
+    def _zone(self):
+        zone = Zone('unit.tests.', [])
+        records = {
+            'a': ARecord(zone, 'www', {'ttl': 300, 'value': '1.2.3.4'}),
+            'aaaa': AaaaRecord(zone, 'www', {'ttl': 300, 'value': '2001::1'}),
+            'cname': Record.new(
+                zone,
+                'alias',
+                {'type': 'CNAME', 'ttl': 300, 'value': 'www.unit.tests.'},
+            ),
+            'mx': MxRecord(
+                zone,
+                '',
+                {
+                    'ttl': 300,
+                    'values': [
+                        {'preference': 10, 'exchange': 'www.unit.tests.'},
+                        {'preference': 20, 'exchange': 'mx.other.tests.'},
+                    ],
+                },
+            ),
+            'srv': Record.new(
+                zone,
+                '_srv._tcp',
+                {
+                    'type': 'SRV',
+                    'ttl': 300,
+                    'value': {
+                        'priority': 1,
+                        'weight': 2,
+                        'port': 3,
+                        'target': 'alias.unit.tests.',
+                    },
+                },
+            ),
+            'ns': NsRecord(
+                zone,
+                'sub',
+                {'ttl': 300, 'values': ['ns1.unit.tests.', 'www.unit.tests.']},
+            ),
+        }
+        for record in records.values():
+            zone.add_record(record)
+        return zone, records
+
+    def test_get_by_type(self):
+        zone, records = self._zone()
+        self.assertEqual({records['a']}, zone.get_by_type('A'))
+        self.assertEqual({records['mx']}, zone.get_by_type('MX'))
+        self.assertEqual(set(), zone.get_by_type('TXT'))
+
+        # it's a copy
+        zone.get_by_type('A').clear()
+        self.assertEqual({records['a']}, zone.get_by_type('A'))
+
+        zone.remove_record(records['a'])
+        self.assertEqual(set(), zone.get_by_type('A'))
+
+        # replacing swaps out the instance
+        aaaa = AaaaRecord(zone, 'www', {'ttl': 300, 'value': '2001::2'})
+        zone.add_record(aaaa, replace=True)
+        (got,) = zone.get_by_type('AAAA')
+        self.assertIs(aaaa, got)
+
+    def test_get_by_fqdn(self):
+        zone, records = self._zone()
+        self.assertEqual(
+            {records['a'], records['aaaa']}, zone.get_by_fqdn('www.unit.tests.')
+        )
+        # trailing dot is optional and things are case insensitive
+        self.assertEqual(
+            {records['a']}, zone.get_by_fqdn('WWW.unit.tests', type='A')
+        )
+        self.assertEqual({records['mx']}, zone.get_by_fqdn('unit.tests.'))
+        self.assertEqual(set(), zone.get_by_fqdn('nope.unit.tests.'))
+        # not in the zone
+        self.assertEqual(set(), zone.get_by_fqdn('www.other.tests.'))
+        self.assertEqual(set(), zone.get_by_fqdn('wwwunit.tests.'))
+        self.assertEqual(set(), zone.get_by_fqdn('.'))
+
+    def test_get_references(self):
+        zone, records = self._zone()
+        self.assertEqual(
+            {records['cname'], records['mx'], records['ns']},
+            zone.get_references('www.unit.tests.'),
+        )
+        self.assertEqual(
+            {records['mx']}, zone.get_references('www.unit.tests', type='MX')
+        )
+        self.assertEqual(
+            {records['srv']}, zone.get_references('alias.unit.tests.')
+        )
+        # out of zone targets are indexed too
+        self.assertEqual(
+            {records['mx']}, zone.get_references('mx.other.tests.')
+        )
+        self.assertEqual(set(), zone.get_references('nope.unit.tests.'))
+
+        # removing with a different instance drops the stored instance's
+        # targets
+        zone.remove_record(
+            MxRecord(
+                zone,
+                '',
+                {
+                    'ttl': 300,
+                    'value': {'preference': 1, 'exchange': 'other.tests.'},
+                },
+            )
+        )
+        self.assertEqual(set(), zone.get_references('mx.other.tests.'))
+        self.assertEqual(
+            {records['cname'], records['ns']},
+            zone.get_references('www.unit.tests.'),
+        )
+
+        # replacing updates the targets
+        cname = Record.new(
+            zone,
+            'alias',
+            {'type': 'CNAME', 'ttl': 300, 'value': 'ns1.unit.tests.'},
+        )
+        zone.add_record(cname, replace=True)
+        self.assertEqual(
+            {records['ns']}, zone.get_references('www.unit.tests.')
+        )
+        self.assertEqual(
+            {cname, records['ns']}, zone.get_references('ns1.unit.tests.')
+        )
+
+        # failed replace leaves things alone
+        with self.assertRaises(DuplicateRecordException):
+            zone.add_record(records['cname'])
+        self.assertEqual(
+            {cname, records['ns']}, zone.get_references('ns1.unit.tests.')
+        )
+
+    def test_lenient_targets(self):
+        zone = Zone('unit.tests.', [])
+        cname = Record.new(
+            zone,
+            'alias',
+            {'type': 'CNAME', 'ttl': 300, 'value': 'www.unit.tests'},
+            lenient=True,
+        )
+        zone.add_record(cname)
+        self.assertEqual({cname}, zone.get_references('www.unit.tests.'))
+
+    def test_shallow_copy(self):
+        zone, records = self._zone()
+        copy = zone.copy()
+        self.assertIsNotNone(copy._origin)
+        self.assertEqual({records['a']}, copy.get_by_type('A'))
+        self.assertEqual(
+            {records['a']}, copy.get_by_fqdn('www.unit.tests.', 'A')
+        )
+        self.assertEqual(
+            {records['srv']}, copy.get_references('alias.unit.tests.')
+        )
+        self.assertIsNotNone(copy._origin)
+
+        copy.hydrate()
+        self.assertEqual({records['a']}, copy.get_by_type('A'))
+        self.assertEqual(
+            {records['srv']}, copy.get_references('alias.unit.tests.')
+        )
@@ -264,6 +264,22 @@ class TestCnameTargetNotCnameZoneValidator(TestCase):
             str(reasons[0]),
         )
 
+    def test_cname_target_under_sub_zone(self):
+        v = CnameTargetNotCnameZoneValidator('test')
+        zone = Zone('unit.tests.', ['sub'])
+
+        # a CNAME that leniently ended up under a sub-zone isn't ours so
+        # pointing at it isn't a problem
+        sub = _add_record(
+            zone, 'www.sub', {'type': 'CNAME', 'value': 'target.unit.tests.'}
+        )
+        zone.add_record(sub, lenient=True)
+        cname = _add_record(
+            zone, 'alias', {'type': 'CNAME', 'value': 'www.sub.unit.tests.'}
+        )
+        zone.add_record(cname)
+        self.assertEqual([], v.validate(zone))
+
 
 class TestCnameTargetResolvableInZoneZoneValidator(TestCase):
     def test_cname_target_resolvable_in_zone(self):